@@ -5,18 +5,12 @@ This module provides username/password authentication functionality.
 """
 from typing import Dict, Any, Optional, Tuple
 import re
-import os
-import sys
 import logging
 import datetime
 from flask import Blueprint, request, redirect, session, url_for, jsonify
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy.exc import SQLAlchemyError
-
-# Add the project root directory to Python path if not already added
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from sqlalchemy.orm import raiseload
 
 from backend.database.db_connection import get_db
 from backend.models.user import User
@@ -208,7 +202,7 @@ def login():
     try:
         with get_db() as db:
             # Try to find user by email or username
-            user = db.query(User).filter(
+            user = db.query(User).options(raiseload('*')).filter(
                 (User.email == login) | (User.username == login)
             ).first()
             
@@ -347,7 +341,7 @@ def change_password():
     
     try:
         with get_db() as db:
-            user = db.query(User).filter(User.id == user_id).first()
+            user = db.query(User).options(raiseload('*')).filter(User.id == user_id).first()
             
             if not user:
                 return jsonify({"error": "User not found"}), 404
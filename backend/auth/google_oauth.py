@@ -5,7 +5,6 @@ This module provides functionality to authenticate users via Google OAuth 2.0.
 """
 from typing import Dict, Any, Optional, Tuple
 import os
-import sys
 import json
 import logging
 import requests
@@ -14,11 +13,7 @@ import google.oauth2.credentials
 import google_auth_oauthlib.flow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
-
-# Add the project root directory to Python path if not already added
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from sqlalchemy.orm import raiseload
 
 from config.config import config
 from backend.database.db_connection import get_db
@@ -203,7 +198,7 @@ def callback():
     
     with get_db() as db:
         # Check if user already exists
-        user = db.query(User).filter(User.email == user_info.get('email')).first()
+        user = db.query(User).options(raiseload('*')).filter(User.email == user_info.get('email')).first()
         
         if user:
             # Update existing user
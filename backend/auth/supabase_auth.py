@@ -3,17 +3,10 @@ Supabase Authentication module for GolfStats application.
 
 This module provides authentication utilities using Supabase Auth.
 """
-import os
 import logging
 from typing import Dict, Any, Optional, Tuple
 from flask import session, request, abort, redirect, url_for
 
-# Add the project root directory to Python path
-import sys
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 from backend.database.supabase_client import get_supabase
 
 # Configure logging
@@ -7,16 +7,12 @@ supporting SQLite, PostgreSQL, and optionally MongoDB.
 from typing import Generator, Optional, Any
 import logging
 import os
-import sys
 from contextlib import contextmanager
 
-# Add the project root directory to Python path if not already added
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
-from sqlalchemy import create_engine, MetaData, event
+from sqlalchemy import create_engine, MetaData, event, Column, DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
@@ -84,6 +80,36 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 metadata = MetaData()
 
+class utcnow(FunctionElement):
+    """
+    Current UTC time evaluated by the database, for timestamp defaults.
+    
+    Usage:
+        created_at = Column(DateTime, server_default=utcnow())
+    """
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already in UTC
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+class TimestampMixin:
+    """
+    Mixin adding created_at/updated_at columns filled in by the database.
+    
+    Usage:
+        class GolfRound(TimestampMixin, Base):
+            ...
+    """
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+
 # For SQLite, enable foreign key support
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
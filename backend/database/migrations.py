@@ -6,6 +6,7 @@ This module allows running database migrations to add new columns or tables.
 import os
 import sys
 import logging
+from typing import Dict, Optional
 from sqlalchemy import text, inspect
 
 # Add the project root directory to Python path if not already added
@@ -101,6 +102,244 @@ def add_tracker_credentials_columns():
             logger.error(f"Error adding credential columns: {str(e)}")
             raise
 
+def add_round_external_id_column():
+    """
+    Add the external_id column and its unique index to the golf_rounds table.
+    """
+    with get_db() as db:
+        try:
+            if not check_if_column_exists('golf_rounds', 'external_id'):
+                db.execute(text("ALTER TABLE golf_rounds ADD COLUMN external_id VARCHAR(100)"))
+                logger.info("Added external_id column to golf_rounds table")
+            
+            db.execute(text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_golf_rounds_external_id "
+                "ON golf_rounds (user_id, source_system, external_id)"
+            ))
+            
+            db.commit()
+            logger.info("External ID column added successfully")
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error adding external_id column: {str(e)}")
+            raise
+
+def add_shot_round_id_column():
+    """
+    Add the round_id column to the golf_shots table and make hole_id optional.
+    """
+    with get_db() as db:
+        try:
+            if not check_if_column_exists('golf_shots', 'round_id'):
+                db.execute(text("ALTER TABLE golf_shots ADD COLUMN round_id INTEGER REFERENCES golf_rounds(id)"))
+                logger.info("Added round_id column to golf_shots table")
+            
+            # SQLite cannot alter column constraints; recreate the database instead
+            if engine.dialect.name == "postgresql":
+                db.execute(text("ALTER TABLE golf_shots ALTER COLUMN hole_id DROP NOT NULL"))
+                logger.info("Made golf_shots.hole_id nullable")
+            
+            db.commit()
+            logger.info("Shot round_id column added successfully")
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error adding round_id column to golf_shots: {str(e)}")
+            raise
+
+# Composite indexes for the common round and shot queries, as (name, table, columns)
+QUERY_INDEXES = (
+    ("ix_rounds_user_date", "golf_rounds", "user_id, date DESC"),
+    ("ix_holes_round_id_hole_number", "golf_holes", "round_id, hole_number"),
+    ("ix_shots_hole_id_shot_number", "golf_shots", "hole_id, shot_number"),
+    ("ix_shots_round_id_shot_number", "golf_shots", "round_id, shot_number"),
+)
+
+def add_query_indexes():
+    """
+    Add the composite query indexes to existing tables.
+    
+    On PostgreSQL the indexes are built CONCURRENTLY so production writes are
+    not blocked, which requires running outside a transaction.
+    """
+    concurrently = "CONCURRENTLY " if engine.dialect.name == "postgresql" else ""
+    
+    try:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            for name, table, columns in QUERY_INDEXES:
+                connection.execute(text(f"CREATE INDEX {concurrently}IF NOT EXISTS {name} ON {table} ({columns})"))
+                logger.info(f"Added index {name} to {table} table")
+        
+        logger.info("Query indexes added successfully")
+    
+    except Exception as e:
+        logger.error(f"Error adding query indexes: {str(e)}")
+        raise
+
+def convert_extended_stats_to_jsonb():
+    """
+    Store round_stats.extended_stats as JSONB with a GIN index on PostgreSQL.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    with get_db() as db:
+        try:
+            db.execute(text(
+                "ALTER TABLE round_stats ALTER COLUMN extended_stats TYPE jsonb USING extended_stats::jsonb"
+            ))
+            db.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_round_stats_extended_gin ON round_stats USING gin (extended_stats)"
+            ))
+            
+            db.commit()
+            logger.info("Converted round_stats.extended_stats to JSONB")
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error converting extended_stats to JSONB: {str(e)}")
+            raise
+
+def create_etl_outbox_table():
+    """
+    Create the etl_outbox table if it does not exist.
+    """
+    try:
+        from backend.models.golf_data import EtlOutbox
+        
+        EtlOutbox.__table__.create(engine, checkfirst=True)
+        logger.info("ETL outbox table created successfully")
+    
+    except Exception as e:
+        logger.error(f"Error creating etl_outbox table: {str(e)}")
+        raise
+
+# Timestamp columns filled in by the database, as (table, column)
+TIMESTAMP_COLUMNS = (
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("golf_rounds", "created_at"),
+    ("golf_rounds", "updated_at"),
+    ("etl_outbox", "created_at"),
+    ("user_stats_aggregates", "updated_at"),
+)
+
+def set_timestamp_server_defaults():
+    """
+    Give existing timestamp columns a database-side UTC default on PostgreSQL.
+    
+    SQLite cannot alter column defaults; recreate the database instead.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    with get_db() as db:
+        try:
+            for table, column in TIMESTAMP_COLUMNS:
+                db.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT TIMEZONE('utc', CURRENT_TIMESTAMP)"
+                ))
+            
+            db.commit()
+            logger.info("Timestamp server defaults set successfully")
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error setting timestamp server defaults: {str(e)}")
+            raise
+
+def _column_data_type(table_name: str, column_name: str) -> Optional[str]:
+    """
+    Look up a column's type in information_schema.
+    
+    Args:
+        table_name: Name of the table
+        column_name: Name of the column
+        
+    Returns:
+        Data type such as "smallint", or None if the column does not exist
+    """
+    with get_db() as db:
+        return db.execute(text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+        ), {"table": table_name, "column": column_name}).scalar()
+
+def _enum_case(column: str, enum_class, aliases: Optional[Dict[str, str]] = None) -> str:
+    """
+    Build the CASE expression converting a name column to its enum codes.
+    
+    Args:
+        column: Column holding the names
+        enum_class: IntEnum listing the names and codes
+        aliases: Other names stored for a member, mapped to the member's name
+        
+    Returns:
+        SQL CASE expression, NULL for empty names and UNKNOWN (or NULL, if the
+        enum has no UNKNOWN member) for any other name
+    """
+    names = {member.name.lower(): member.value for member in enum_class}
+    for alias, name in (aliases or {}).items():
+        names[alias] = names[name]
+    whens = " ".join(f"WHEN '{name}' THEN {value}" for name, value in names.items())
+    other = int(enum_class.UNKNOWN) if "UNKNOWN" in enum_class.__members__ else "NULL"
+    return (
+        f"CASE WHEN {column} IS NULL OR TRIM({column}) = '' THEN NULL "
+        f"ELSE CASE LOWER(TRIM({column})) {whens} ELSE {other} END END"
+    )
+
+def convert_enum_columns_to_smallint():
+    """
+    Store shot locations and club types as small integer codes on PostgreSQL.
+    
+    Columns that are already smallint are left alone. SQLite cannot alter
+    column types; recreate the database instead.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    
+    from backend.models.golf_data import ShotLocation, ClubType, SHOT_LOCATION_ALIASES
+    
+    columns = (
+        ("golf_shots", "from_location", ShotLocation, SHOT_LOCATION_ALIASES),
+        ("golf_shots", "to_location", ShotLocation, SHOT_LOCATION_ALIASES),
+        ("clubs", "club_type", ClubType, None),
+    )
+    
+    with get_db() as db:
+        try:
+            for table, column, enum_class, aliases in columns:
+                data_type = _column_data_type(table, column)
+                if data_type is None or data_type == "smallint":
+                    continue
+                db.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE smallint "
+                    f"USING {_enum_case(column, enum_class, aliases)}"
+                ))
+                logger.info(f"Converted {table}.{column} to smallint")
+            
+            db.commit()
+        
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error converting enum columns to smallint: {str(e)}")
+            raise
+
+def create_user_stats_aggregates_table():
+    """
+    Create the user_stats_aggregates table if it does not exist.
+    """
+    try:
+        from backend.models.golf_data import UserStatsAggregate
+        
+        UserStatsAggregate.__table__.create(engine, checkfirst=True)
+        logger.info("User stats aggregates table created successfully")
+    
+    except Exception as e:
+        logger.error(f"Error creating user_stats_aggregates table: {str(e)}")
+        raise
+
 def run_migrations():
     """
     Run all database migrations.
@@ -115,6 +354,14 @@ def run_migrations():
             # Fall back to adding columns manually if recreation fails
             logger.warning("Database recreation failed, attempting manual column addition")
             add_tracker_credentials_columns()
+            add_round_external_id_column()
+            add_shot_round_id_column()
+            create_etl_outbox_table()
+            add_query_indexes()
+            convert_extended_stats_to_jsonb()
+            create_user_stats_aggregates_table()
+            set_timestamp_server_defaults()
+            convert_enum_columns_to_smallint()
         
         logger.info("Database migrations completed successfully")
     except Exception as e:
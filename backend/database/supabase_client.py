@@ -9,12 +9,6 @@ from typing import Dict, Any, Optional
 
 from supabase import create_client, Client
 
-# Add the project root directory to Python path
-import sys
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 from config.config import config
 
 # Configure logging
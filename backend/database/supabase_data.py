@@ -3,7 +3,6 @@ Supabase data access module for GolfStats application.
 
 This module provides functions to interact with Supabase tables.
 """
-import os
 import logging
 from typing import Dict, Any, List, Optional, Tuple, Union
 import json
@@ -13,17 +12,15 @@ from collections import defaultdict
 
 from supabase import Client
 
-# Add the project root directory to Python path
-import sys
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
+from config.config import config
 from backend.database.supabase_client import get_supabase
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of rows sent in a single insert request
+INSERT_CHUNK_SIZE = config["supabase"]["insert_chunk_size"]
+
 # Utility class for JSON serialization
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -31,6 +28,30 @@ class DateTimeEncoder(json.JSONEncoder):
             return obj.isoformat()
         return super().default(obj)
 
+def _insert_in_chunks(table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insert rows into a table in requests of at most INSERT_CHUNK_SIZE rows.
+    
+    All requests go through the shared client, so they reuse its connection.
+    
+    Args:
+        table: Table name
+        rows: Rows to insert
+        
+    Returns:
+        List of created rows
+    """
+    supabase = get_supabase()
+    created = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        response = supabase.table(table) \
+            .insert(rows[start:start + INSERT_CHUNK_SIZE]) \
+            .execute()
+        if response.data:
+            created.extend(response.data)
+    
+    return created
+
 # Golf round functions
 def get_golf_rounds(user_id: str, limit: int = 100) -> List[Dict[str, Any]]:
     """
@@ -105,6 +126,62 @@ def create_golf_round(user_id: str, round_data: Dict[str, Any]) -> Optional[Dict
         logger.error(f"Error creating golf round: {str(e)}")
         return None
 
+def upsert_golf_round(user_id: str, round_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Create a golf round, or update the one imported earlier from the same session.
+    
+    Rounds are matched on user_id, source_system and external_id. The holes
+    and shots of a matched round are deleted so the caller can add them again.
+    
+    Args:
+        user_id: Supabase user ID
+        round_data: Golf round data
+        
+    Returns:
+        Created or updated golf round data or None if failed
+    """
+    if not round_data.get('external_id'):
+        return create_golf_round(user_id, round_data)
+    
+    try:
+        # Ensure user_id is set
+        round_data['user_id'] = user_id
+        
+        supabase = get_supabase()
+        existing = supabase.table('golf_rounds') \
+            .select('id') \
+            .eq('user_id', user_id) \
+            .eq('source_system', round_data.get('source_system')) \
+            .eq('external_id', round_data['external_id']) \
+            .execute()
+        
+        if not existing.data:
+            response = supabase.table('golf_rounds') \
+                .insert(round_data) \
+                .execute()
+            return response.data[0] if response.data else None
+        
+        # Clear the previous import; every shot carries its round_id
+        round_id = existing.data[0]['id']
+        supabase.table('golf_shots') \
+            .delete() \
+            .eq('round_id', round_id) \
+            .execute()
+        supabase.table('golf_holes') \
+            .delete() \
+            .eq('round_id', round_id) \
+            .execute()
+        
+        response = supabase.table('golf_rounds') \
+            .update(round_data) \
+            .eq('id', round_id) \
+            .execute()
+        
+        return response.data[0] if response.data else None
+    except Exception as e:
+        logger.error(f"Error upserting golf round: {str(e)}")
+        return None
+
 def update_golf_round(round_id: int, round_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Update a golf round.
@@ -215,12 +292,7 @@ def add_holes_for_round(round_id: int, holes_data: List[Dict[str, Any]]) -> List
         for hole_data in holes_data:
             hole_data['round_id'] = round_id
         
-        supabase = get_supabase()
-        response = supabase.table('golf_holes') \
-            .insert(holes_data) \
-            .execute()
-            
-        return response.data if response.data else []
+        return _insert_in_chunks('golf_holes', holes_data)
     except Exception as e:
         logger.error(f"Error adding holes to round {round_id}: {str(e)}")
         return []
@@ -241,16 +313,32 @@ def add_shots_for_hole(hole_id: int, shots_data: List[Dict[str, Any]]) -> List[D
         for shot_data in shots_data:
             shot_data['hole_id'] = hole_id
         
-        supabase = get_supabase()
-        response = supabase.table('golf_shots') \
-            .insert(shots_data) \
-            .execute()
-            
-        return response.data if response.data else []
+        return _insert_in_chunks('golf_shots', shots_data)
     except Exception as e:
         logger.error(f"Error adding shots to hole {hole_id}: {str(e)}")
         return []
 
+def add_shots_for_round(round_id: int, shots_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add multiple shots that do not belong to a hole, such as range session shots.
+    
+    Args:
+        round_id: Golf round ID
+        shots_data: List of shot data dictionaries
+        
+    Returns:
+        List of created shot data or empty list if failed
+    """
+    try:
+        # Ensure round_id is set for each shot
+        for shot_data in shots_data:
+            shot_data['round_id'] = round_id
+        
+        return _insert_in_chunks('golf_shots', shots_data)
+    except Exception as e:
+        logger.error(f"Error adding shots to round {round_id}: {str(e)}")
+        return []
+
 def add_round_stats(round_id: int, stats_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Add or update statistics for a golf round.
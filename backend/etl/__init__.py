@@ -4,7 +4,21 @@ ETL (Extract, Transform, Load) package for GolfStats application.
 This package contains modules for extracting data from various golf tracking
 systems, transforming it to the GolfStats schema, and loading it into the database.
 """
-from backend.etl.daily_etl import run_daily_etl
-from backend.etl.data_transformer import GolfDataTransformer, GolfDataStorage
+import importlib
 
-__all__ = ['run_daily_etl', 'GolfDataTransformer', 'GolfDataStorage']
\ No newline at end of file
+# Public names and the submodule defining each, imported on first access so
+# that running a submodule directly (python -m backend.etl.daily_etl) does not
+# load it a second time through the package
+_EXPORTS = {
+    'run_daily_etl': 'daily_etl',
+    'GolfDataTransformer': 'data_transformer',
+    'GolfDataStorage': 'data_transformer'
+}
+
+__all__ = ['run_daily_etl', 'GolfDataTransformer', 'GolfDataStorage']
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,44 @@
+"""
+Compiled shot aggregation kernels for GolfStats ETL.
+
+Numba is optional; when it is not installed NUMBA_AVAILABLE is False and
+callers should fall back to their NumPy implementation.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many shots the JIT warm-up outweighs any speedup
+MIN_JIT_SIZE = 256
+
+if NUMBA_AVAILABLE:
+    # fastmath without "nnan" so the NaN check in the loop is kept
+    @njit("float64(float64[:], boolean[:])", cache=True, boundscheck=False,
+          fastmath={"reassoc", "contract", "arcp", "nsz"})
+    def masked_mean(values, mask):
+        """
+        Average the non-zero, non-NaN values selected by a mask in one pass.
+        
+        Args:
+            values: Values to average
+            mask: Boolean array selecting the values to include
+            
+        Returns:
+            Mean of the selected values, or NaN if there are none
+        """
+        total = 0.0
+        count = 0
+        for i in range(values.shape[0]):
+            value = values[i]
+            if mask[i] and value == value and value != 0.0:
+                total += value
+                count += 1
+        
+        if count == 0:
+            return np.nan
+        
+        return total / count
@@ -0,0 +1,107 @@
+"""
+Pre-computed user stats for GolfStats dashboards.
+
+This module rebuilds the user_stats_aggregates table from the stored rounds,
+so dashboards read one indexed row per user and window instead of grouping
+every round on each request.
+"""
+import logging
+import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, insert, select, func, literal, and_
+from sqlalchemy.orm import Session
+
+from backend.database.db_connection import get_db
+from backend.models.golf_data import GolfRound, RoundStats, UserStatsAggregate
+
+# Configure logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Trailing windows, in days, kept for each user
+AGGREGATE_WINDOWS = (30, 90, 365)
+
+def _window_query(window_days: int, now: datetime.datetime):
+    """
+    Build the SELECT producing one aggregate row per user for a window.
+    
+    Course stats only count rounds with a score, so range sessions do not
+    pull the averages towards zero.
+    
+    Args:
+        window_days: Length of the trailing window in days
+        now: End of the window
+        
+    Returns:
+        SELECT statement with the user_stats_aggregates columns
+    """
+    score = func.nullif(GolfRound.total_score, 0)
+    par = func.nullif(GolfRound.total_par, 0)
+    scored = and_(GolfRound.total_score.isnot(None), GolfRound.total_score > 0)
+    
+    return (
+        select(
+            GolfRound.user_id,
+            literal(window_days),
+            func.count(GolfRound.id),
+            func.avg(score),
+            func.avg(score - par),
+            func.avg(func.nullif(RoundStats.putts_total, 0)).filter(scored),
+            (func.sum(RoundStats.fairways_hit).filter(scored) * 100.0
+             / func.nullif(func.sum(RoundStats.fairways_total).filter(scored), 0)),
+            func.avg(RoundStats.greens_in_regulation).filter(scored),
+            func.avg(RoundStats.average_drive_yards),
+            literal(now)
+        )
+        .select_from(GolfRound)
+        .outerjoin(RoundStats, RoundStats.round_id == GolfRound.id)
+        .where(GolfRound.date >= now - datetime.timedelta(days=window_days))
+        .group_by(GolfRound.user_id)
+    )
+
+def refresh_user_aggregates(db: Optional[Session] = None,
+                            windows: Tuple[int, ...] = AGGREGATE_WINDOWS) -> int:
+    """
+    Rebuild the aggregate rows of every user in one transaction.
+    
+    Args:
+        db: Session to write with (defaults to a new session)
+        windows: Trailing windows in days
+        
+    Returns:
+        Number of aggregate rows written
+    """
+    if db is None:
+        with get_db() as db:
+            return refresh_user_aggregates(db, windows)
+    
+    now = datetime.datetime.utcnow()
+    columns = [
+        UserStatsAggregate.user_id,
+        UserStatsAggregate.window_days,
+        UserStatsAggregate.rounds_played,
+        UserStatsAggregate.scoring_average,
+        UserStatsAggregate.score_to_par_average,
+        UserStatsAggregate.putts_per_round,
+        UserStatsAggregate.fairways_hit_pct,
+        UserStatsAggregate.greens_in_regulation_per_round,
+        UserStatsAggregate.average_drive_yards,
+        UserStatsAggregate.updated_at
+    ]
+    
+    try:
+        db.execute(delete(UserStatsAggregate))
+        rows = 0
+        for window_days in windows:
+            result = db.execute(insert(UserStatsAggregate).from_select(columns, _window_query(window_days, now)))
+            rows += result.rowcount
+        
+        db.commit()
+        logger.info(f"Refreshed {rows} user stats aggregates")
+        return rows
+    
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error refreshing user stats aggregates: {str(e)}")
+        raise
@@ -7,19 +7,36 @@ from various sources (Trackman, Arccos, SkyTrak) into the GolfStats database.
 import os
 import sys
 import logging
+import logging.handlers
+import queue
+import time
 import datetime
-from typing import List, Dict, Any, Optional
+import multiprocessing.util
+from collections import Counter
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    TimeoutError as FuturesTimeoutError
+)
+from typing import List, Dict, Any, Optional, Tuple, Callable, NamedTuple
 
 # Add the project root directory to Python path if not already added
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from backend.database.db_connection import get_db
+from sqlalchemy.orm import Session, raiseload
+
+from config.config import config
+from backend.database.db_connection import get_db, engine, SessionLocal
 from backend.scrapers.trackman_scraper import get_trackman_data
 from backend.scrapers.arccos_scraper import get_arrcos_data
 from backend.scrapers.skytrak_scraper import get_skytrak_data
+from backend.scrapers.common import deadline_passed
 from backend.models.user import User
+from backend.etl.data_transformer import GolfDataStorage
+from backend.etl.throttle import AdaptiveThrottle, create_throttles
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -38,6 +55,65 @@ file_handler = logging.FileHandler(os.path.join(logs_dir, 'daily_etl.log'))
 file_handler.setFormatter(formatter)
 logger.addHandler(file_handler)
 
+# Per-provider batch sizes (overridable via TRACKMAN_LIMIT etc.)
+TRACKMAN_LIMIT = config["etl"]["limits"]["trackman"]
+ARCCOS_LIMIT = config["etl"]["limits"]["arccos"]
+SKYTRAK_LIMIT = config["etl"]["limits"]["skytrak"]
+
+class DataSource(NamedTuple):
+    """Scraper and storage wiring for one external data source."""
+    name: str
+    label: str
+    result_key: str
+    fetch: Callable[..., List[Any]]
+    limit: int
+    store_method: str
+
+DATA_SOURCES = (
+    DataSource("trackman", "Trackman", "trackman_sessions", get_trackman_data,
+               TRACKMAN_LIMIT, "store_trackman_session"),
+    DataSource("arccos", "Arccos", "arccos_rounds", get_arrcos_data,
+               ARCCOS_LIMIT, "store_arccos_round"),
+    DataSource("skytrak", "SkyTrak", "skytrak_sessions", get_skytrak_data,
+               SKYTRAK_LIMIT, "store_skytrak_session"),
+)
+
+# Number of worker processes used to process users in parallel
+ETL_WORKERS = config["etl"]["workers"]
+
+# Total run time allowed before remaining users are skipped
+ETL_MAX_RUNTIME_SECONDS = config["etl"]["max_runtime_seconds"]
+
+# Adaptive per-provider concurrency across all worker processes
+THROTTLE_CONFIG = config["etl"]["throttle"]
+
+# Database session shared by every user handled in this process
+_worker_session: Optional[Session] = None
+
+# Provider throttles shared with the parent process, set by _init_worker
+_throttles: Dict[str, AdaptiveThrottle] = {}
+
+def _get_session() -> Session:
+    """
+    Get the database session for the current worker process.
+    
+    Returns:
+        SQLAlchemy Session, created on first use
+    """
+    global _worker_session
+    if _worker_session is None:
+        _worker_session = SessionLocal()
+    return _worker_session
+
+def _close_session() -> None:
+    """
+    Close the worker's database session, if one was opened.
+    """
+    global _worker_session
+    if _worker_session is not None:
+        _worker_session.close()
+        _worker_session = None
+
 def extract_user_list() -> List[User]:
     """
     Extract list of users from database.
@@ -48,88 +124,156 @@ def extract_user_list() -> List[User]:
     users = []
     try:
         with get_db() as db:
-            users = db.query(User).filter(User.is_active == True).all()
+            # Users are sent to the workers without a session, so lazy loads
+            # are disallowed outright
+            users = db.query(User).options(raiseload('*')).filter(User.is_active == True).all()
         logger.info(f"Found {len(users)} active users")
     except Exception as e:
         logger.error(f"Error extracting user list: {str(e)}")
     
     return users
 
-def process_user_data(user: User) -> Dict[str, List[int]]:
+def _fetch_source(source: DataSource, user_id: int, deadline: Optional[float] = None) -> List[Any]:
+    """
+    Scrape one source for a user, holding a slot of the provider's throttle.
+    
+    Args:
+        source: Data source to scrape
+        user_id: User ID
+        deadline: time.monotonic() value after which to stop waiting for a
+            slot; the scraper stops fetching sessions once it passes
+        
+    Returns:
+        Scraped sessions/rounds
+    """
+    throttle = _throttles.get(source.name)
+    if throttle is None:
+        return source.fetch(user_id=user_id, limit=source.limit, deadline=deadline)
+    
+    with throttle.slot(deadline):
+        return source.fetch(user_id=user_id, limit=source.limit, deadline=deadline)
+
+def process_user_data(user: User, db: Optional[Session] = None,
+                      deadline: Optional[float] = None) -> Tuple[Counter, List[str]]:
     """
     Process golf data for a specific user from all sources.
     
+    The scrapes for all sources run concurrently since each one spends
+    nearly all of its time waiting on its own browser session; results are
+    stored sequentially on the single database session. Scrapers stop
+    fetching once the deadline passes, and results still outstanding then
+    are abandoned.
+    
     Args:
         user: User object
+        db: Session to store data with (defaults to the worker's session)
+        deadline: time.monotonic() value after which results are no longer awaited
         
     Returns:
-        Dictionary with results from each data source
+        Tuple of (counts keyed like the run_daily_etl results, error messages)
     """
-    results = {
-        "trackman": [],
-        "arccos": [],
-        "skytrak": []
-    }
+    counts = Counter(users_processed=1)
+    errors = []
     
     try:
         logger.info(f"Processing data for user {user.id} ({user.email})")
         
-        # Create storage handler
-        from backend.etl.data_transformer import GolfDataStorage
-        storage = GolfDataStorage()
+        # Create storage handler reusing the worker's session
+        storage = GolfDataStorage(db=db or _get_session())
         
-        # Process Trackman data
-        if user.trackman_credentials_valid():
-            try:
-                logger.info(f"Processing Trackman data for user {user.id}")
-                trackman_data_list = get_trackman_data(user_id=user.id, limit=20)
-                
-                # Store each Trackman session
-                for trackman_data in trackman_data_list:
-                    round_id = storage.store_trackman_session(user.id, trackman_data)
-                    if round_id:
-                        results["trackman"].append(round_id)
-                
-                logger.info(f"Processed and stored {len(results['trackman'])} Trackman sessions")
-            except Exception as e:
-                logger.error(f"Error processing Trackman data for user {user.id}: {str(e)}")
+        sources = [
+            source for source in DATA_SOURCES
+            if getattr(user, f"{source.name}_credentials_valid")()
+        ]
+        if not sources:
+            return counts, errors
         
-        # Process Arccos data
-        if user.arccos_credentials_valid():
-            try:
-                logger.info(f"Processing Arccos data for user {user.id}")
-                arccos_data_list = get_arrcos_data(user_id=user.id, limit=20)
-                
-                # Store each Arccos round
-                for arccos_data in arccos_data_list:
-                    round_id = storage.store_arccos_round(user.id, arccos_data)
-                    if round_id:
-                        results["arccos"].append(round_id)
-                
-                logger.info(f"Processed and stored {len(results['arccos'])} Arccos rounds")
-            except Exception as e:
-                logger.error(f"Error processing Arccos data for user {user.id}: {str(e)}")
+        if deadline_passed(deadline):
+            errors.append(f"Skipped user {user.id}: ETL deadline reached")
+            logger.warning(errors[-1])
+            # A skipped user was not processed
+            return Counter(), errors
         
-        # Process SkyTrak data
-        if user.skytrak_credentials_valid():
+        # Scrape all sources at once
+        pool = ThreadPoolExecutor(max_workers=len(sources))
+        try:
+            futures = {}
+            for source in sources:
+                logger.info(f"Processing {source.label} data for user {user.id}")
+                future = pool.submit(_fetch_source, source, user.id, deadline)
+                futures[future] = source
+            
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
             try:
-                logger.info(f"Processing SkyTrak data for user {user.id}")
-                skytrak_data_list = get_skytrak_data(user_id=user.id, limit=20)
-                
-                # Store each SkyTrak session
-                for skytrak_data in skytrak_data_list:
-                    round_id = storage.store_skytrak_session(user.id, skytrak_data)
-                    if round_id:
-                        results["skytrak"].append(round_id)
-                
-                logger.info(f"Processed and stored {len(results['skytrak'])} SkyTrak sessions")
-            except Exception as e:
-                logger.error(f"Error processing SkyTrak data for user {user.id}: {str(e)}")
+                for future in as_completed(futures, timeout=timeout):
+                    source = futures[future]
+                    try:
+                        store = getattr(storage, source.store_method)
+                        
+                        # Store each session/round
+                        for data in future.result():
+                            if store(user.id, data):
+                                counts[source.result_key] += 1
+                        
+                        logger.info(f"Processed and stored {counts[source.result_key]} {source.label} rounds")
+                    except Exception as e:
+                        errors.append(f"Error processing {source.label} data for user {user.id}: {str(e)}")
+                        logger.error(errors[-1])
+            
+            except FuturesTimeoutError:
+                errors.append(f"ETL deadline reached, abandoned unfinished sources for user {user.id}")
+                logger.warning(errors[-1])
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
     
     except Exception as e:
-        logger.error(f"Error in process_user_data for user {user.id}: {str(e)}")
+        errors.append(f"Error in process_user_data for user {user.id}: {str(e)}")
+        logger.error(errors[-1])
     
-    return results
+    return counts, errors
+
+def _root_log_queue() -> Optional[Any]:
+    """
+    Find the multiprocessing queue the root logger hands records to, if any.
+    
+    Returns:
+        Queue of the root logger's QueueHandler, or None if there is no such
+        handler or its queue can only be read within this process
+    """
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.handlers.QueueHandler) and not isinstance(handler.queue, queue.Queue):
+            return handler.queue
+    return None
+
+def _init_worker(throttles: Optional[Dict[str, AdaptiveThrottle]] = None,
+                 log_queue: Optional[Any] = None) -> None:
+    """
+    Initialize an ETL worker process.
+    
+    Each worker keeps its own connection pool; connections inherited from
+    the parent process must not be shared across processes. Root queue
+    handlers inherited from the parent are replaced, since nothing in the
+    worker reads their queue.
+    
+    Args:
+        throttles: Provider throttles shared by all workers
+        log_queue: Multiprocessing queue drained by the parent's log listener
+    """
+    global _throttles
+    _throttles = throttles or {}
+    
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root.removeHandler(handler)
+    if log_queue is not None:
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    engine.dispose(close=False)
+    
+    # Open one session for all users handled by this worker
+    _get_session()
+    multiprocessing.util.Finalize(None, _close_session, exitpriority=10)
 
 def run_daily_etl() -> Dict[str, Any]:
     """
@@ -139,6 +283,7 @@ def run_daily_etl() -> Dict[str, Any]:
         Dictionary with ETL results
     """
     start_time = datetime.datetime.now()
+    deadline = time.monotonic() + ETL_MAX_RUNTIME_SECONDS
     results = {
         "start_time": start_time,
         "end_time": None,
@@ -155,21 +300,49 @@ def run_daily_etl() -> Dict[str, Any]:
         # Get list of users
         users = extract_user_list()
         
-        # Process each user
-        for user in users:
+        # Process users in parallel across worker processes; each worker
+        # returns its own counts, which are summed here
+        totals = Counter()
+        throttles = create_throttles(
+            (source.name for source in DATA_SOURCES),
+            THROTTLE_CONFIG["target_seconds"],
+            THROTTLE_CONFIG["start_concurrency"],
+            THROTTLE_CONFIG["max_concurrency"]
+        )
+        pool = ProcessPoolExecutor(max_workers=ETL_WORKERS, initializer=_init_worker,
+                                   initargs=(throttles, _root_log_queue()))
+        try:
+            futures = {
+                pool.submit(process_user_data, user, None, deadline): user
+                for user in users
+            }
+            
             try:
-                user_results = process_user_data(user)
-                
-                # Update results
-                results["users_processed"] += 1
-                results["trackman_sessions"] += len(user_results["trackman"])
-                results["arccos_rounds"] += len(user_results["arccos"])
-                results["skytrak_sessions"] += len(user_results["skytrak"])
-                
-            except Exception as e:
-                error_msg = f"Error processing user {user.id}: {str(e)}"
-                logger.error(error_msg)
-                results["errors"].append(error_msg)
+                for future in as_completed(futures, timeout=max(0, deadline - time.monotonic())):
+                    user = futures[future]
+                    try:
+                        user_counts, user_errors = future.result()
+                        totals.update(user_counts)
+                        results["errors"].extend(user_errors)
+                        
+                    except Exception as e:
+                        error_msg = f"Error processing user {user.id}: {str(e)}"
+                        logger.error(error_msg)
+                        results["errors"].append(error_msg)
+            
+            except FuturesTimeoutError:
+                # Record every user that did not finish in time
+                for future, user in futures.items():
+                    if not future.done():
+                        future.cancel()
+                        error_msg = f"Skipped user {user.id}: ETL deadline of {ETL_MAX_RUNTIME_SECONDS}s exceeded"
+                        logger.error(error_msg)
+                        results["errors"].append(error_msg)
+        finally:
+            # Don't block on users still running past the deadline; their
+            # scrapers stop after the session they are fetching
+            pool.shutdown(wait=False, cancel_futures=True)
+            results.update(totals)
         
         logger.info(f"Daily ETL completed - Processed {results['users_processed']} users, "
                    f"{results['trackman_sessions']} Trackman sessions, "
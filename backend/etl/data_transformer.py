@@ -4,23 +4,26 @@ Data transformation module for GolfStats application.
 This module provides functionality to transform scraped data from various sources
 (Trackman, Arccos, SkyTrak) into a standardized format for storage in the database.
 """
-import os
-import sys
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import functools
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple, Generator
 from datetime import datetime
 
-# Add the project root directory to Python path if not already added
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import numpy as np
 
-from backend.database.db_connection import get_db
-from backend.models.golf_data import GolfRound, GolfHole, GolfShot, RoundStats
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from backend.database.db_connection import get_db, utcnow
+from backend.etl import _fast_aggr
+from backend.models.golf_data import GolfRound, GolfHole, GolfShot, RoundStats, EtlOutbox
 from backend.database.supabase_data import (
-    create_golf_round, 
+    upsert_golf_round, 
     add_holes_for_round, 
     add_shots_for_hole, 
+    add_shots_for_round,
     add_round_stats
 )
 
@@ -28,6 +31,41 @@ from backend.database.supabase_data import (
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Maximum number of rows per bulk INSERT; larger batches gain little on PostgreSQL
+SQL_INSERT_CHUNK_SIZE = 10000
+
+# Lowercased club names counted as drives
+_DRIVER_CLUBS = frozenset(("driver", "1w", "1-wood"))
+
+# Shot columns read from each source as (column, raw key, default)
+_TRACKMAN_SHOT_FIELDS = (
+    ("ball_speed_mph", "ball_speed", None),
+    ("club_speed_mph", "club_speed", None),
+    ("smash_factor", "smash_factor", None),
+    ("launch_angle_degrees", "launch_angle", None),
+    ("spin_rate_rpm", "spin_rate", None),
+    ("spin_axis_degrees", "spin_axis", None),
+    ("carry_distance_yards", "carry_distance", None),
+    ("total_distance_yards", "total_distance", None),
+    ("side_deviation_yards", "side_deviation", None)
+)
+_ARCCOS_SHOT_FIELDS = (
+    ("distance_yards", "distance", 0),
+    ("from_location", "from_location", ""),
+    ("to_location", "to_location", ""),
+    ("is_penalty", "is_penalty", False),
+    ("carry_distance_yards", "carry_distance", None),
+    ("total_distance_yards", "total_distance", None)
+)
+_SKYTRAK_SHOT_FIELDS = (
+    ("ball_speed_mph", "ball_speed", None),
+    ("club_speed_mph", "club_speed", None),
+    ("launch_angle_degrees", "launch_angle", None),
+    ("spin_rate_rpm", "spin_rate", None),
+    ("carry_distance_yards", "carry", None),
+    ("total_distance_yards", "total", None)
+)
+
 class GolfDataTransformer:
     """
     Transforms scraped golf data into database models.
@@ -42,7 +80,7 @@ class GolfDataTransformer:
         """
         self.user_id = user_id
         
-    def transform_trackman_data(self, trackman_data: Dict[str, Any]) -> Tuple[GolfRound, List[GolfShot], Dict[str, Any]]:
+    def transform_trackman_data(self, trackman_data: Dict[str, Any]) -> Tuple[GolfRound, List[Dict[str, Any]], Dict[str, Any]]:
         """
         Transform Trackman data to GolfStats models.
         
@@ -50,12 +88,12 @@ class GolfDataTransformer:
             trackman_data: Raw Trackman data
             
         Returns:
-            Tuple of (GolfRound, list of GolfShots, stats dictionary)
+            Tuple of (GolfRound, shot column dictionaries, stats dictionary)
         """
         logger.info(f"Transforming Trackman data for user {self.user_id}")
         
         # Extract session metadata
-        session_date = datetime.strptime(trackman_data.get("session_date", datetime.now().strftime("%Y-%m-%d")), "%Y-%m-%d")
+        session_date = self._parse_date(trackman_data.get("session_date"))
         
         # Create the golf round
         golf_round = GolfRound(
@@ -63,44 +101,39 @@ class GolfDataTransformer:
             date=session_date,
             course_name=trackman_data.get("location", "Trackman Session"),
             source_system="trackman",
+            external_id=trackman_data.get("session_id"),
             notes=trackman_data.get("notes", "")
         )
         
-        # Process shots
-        shots = []
-        for idx, shot_data in enumerate(trackman_data.get("shots", [])):
-            shot = GolfShot(
-                shot_number=idx + 1,
-                club=shot_data.get("club", "Unknown"),
-                ball_speed_mph=shot_data.get("ball_speed", None),
-                club_speed_mph=shot_data.get("club_speed", None),
-                smash_factor=shot_data.get("smash_factor", None),
-                launch_angle_degrees=shot_data.get("launch_angle", None),
-                spin_rate_rpm=shot_data.get("spin_rate", None),
-                spin_axis_degrees=shot_data.get("spin_axis", None),
-                carry_distance_yards=shot_data.get("carry_distance", None),
-                total_distance_yards=shot_data.get("total_distance", None),
-                side_deviation_yards=shot_data.get("side_deviation", None)
-            )
-            shots.append(shot)
+        # Keep the scraped ISO date for the Supabase payload so it is not re-serialized
+        golf_round._iso_date = trackman_data.get("session_date") or session_date.date().isoformat()
+        
+        # Process shots, collecting the columns to aggregate in the same pass
+        shot_rows, columns, is_drive = self._build_shots(
+            trackman_data.get("shots", []),
+            _TRACKMAN_SHOT_FIELDS,
+            ("ball_speed_mph", "club_speed_mph", "smash_factor", "launch_angle_degrees",
+             "spin_rate_rpm", "total_distance_yards")
+        )
         
         # Aggregate stats
         stats = {
-            "average_drive_yards": self._calculate_average_drive_distance(shots),
+            "average_drive_yards": self._calculate_average_drive_distance(
+                is_drive, columns["total_distance_yards"]),
             "extended_stats": {
-                "average_ball_speed": self._calculate_average(shots, "ball_speed_mph"),
-                "average_club_speed": self._calculate_average(shots, "club_speed_mph"),
-                "average_smash_factor": self._calculate_average(shots, "smash_factor"),
-                "average_launch_angle": self._calculate_average(shots, "launch_angle_degrees"),
-                "average_spin_rate": self._calculate_average(shots, "spin_rate_rpm"),
-                "shot_count": len(shots),
+                "average_ball_speed": self._calculate_average(columns["ball_speed_mph"]),
+                "average_club_speed": self._calculate_average(columns["club_speed_mph"]),
+                "average_smash_factor": self._calculate_average(columns["smash_factor"]),
+                "average_launch_angle": self._calculate_average(columns["launch_angle_degrees"]),
+                "average_spin_rate": self._calculate_average(columns["spin_rate_rpm"]),
+                "shot_count": len(shot_rows),
                 "data_source": "trackman"
             }
         }
         
-        return golf_round, shots, stats
+        return golf_round, shot_rows, stats
     
-    def transform_arccos_data(self, arccos_data: Dict[str, Any]) -> Tuple[GolfRound, List[GolfHole], List[List[GolfShot]], Dict[str, Any]]:
+    def transform_arccos_data(self, arccos_data: Dict[str, Any]) -> Tuple[GolfRound, List[Dict[str, Any]], List[List[Dict[str, Any]]], Dict[str, Any]]:
         """
         Transform Arccos data to GolfStats models.
         
@@ -108,12 +141,13 @@ class GolfDataTransformer:
             arccos_data: Raw Arccos data
             
         Returns:
-            Tuple of (GolfRound, list of GolfHoles, list of lists of GolfShots (by hole), stats dictionary)
+            Tuple of (GolfRound, list of hole column dictionaries, list of lists of
+            shot column dictionaries (by hole), stats dictionary)
         """
         logger.info(f"Transforming Arccos data for user {self.user_id}")
         
         # Extract round metadata
-        round_date = datetime.strptime(arccos_data.get("date", datetime.now().strftime("%Y-%m-%d")), "%Y-%m-%d")
+        round_date = self._parse_date(arccos_data.get("date"))
         course_name = arccos_data.get("course_name", "Unknown Course")
         
         # Create the golf round
@@ -128,45 +162,35 @@ class GolfDataTransformer:
             front_nine_score=arccos_data.get("front_nine_score", 0),
             back_nine_score=arccos_data.get("back_nine_score", 0),
             weather_conditions=arccos_data.get("weather", ""),
-            source_system="arccos"
+            source_system="arccos",
+            external_id=arccos_data.get("round_id")
         )
         
+        # Keep the scraped ISO date for the Supabase payload so it is not re-serialized
+        golf_round._iso_date = arccos_data.get("date") or round_date.date().isoformat()
+        
         # Process holes and shots
         holes = []
-        shots_by_hole = []
+        shot_rows_by_hole = []
         
         for hole_data in arccos_data.get("holes", []):
             hole_number = hole_data.get("number", 0)
             par = hole_data.get("par", 0)
             
             # Create hole
-            hole = GolfHole(
-                hole_number=hole_number,
-                par=par,
-                score=hole_data.get("score", 0),
-                fairway_hit=hole_data.get("fairway_hit", None),
-                green_in_regulation=hole_data.get("gir", None),
-                putts=hole_data.get("putts", 0),
-                distance_yards=hole_data.get("distance", 0)
-            )
-            holes.append(hole)
+            holes.append({
+                "hole_number": hole_number,
+                "par": par,
+                "score": hole_data.get("score", 0),
+                "fairway_hit": hole_data.get("fairway_hit", None),
+                "green_in_regulation": hole_data.get("gir", None),
+                "putts": hole_data.get("putts", 0),
+                "distance_yards": hole_data.get("distance", 0)
+            })
             
             # Process shots for this hole
-            hole_shots = []
-            for idx, shot_data in enumerate(hole_data.get("shots", [])):
-                shot = GolfShot(
-                    shot_number=idx + 1,
-                    club=shot_data.get("club", "Unknown"),
-                    distance_yards=shot_data.get("distance", 0),
-                    from_location=shot_data.get("from_location", ""),
-                    to_location=shot_data.get("to_location", ""),
-                    is_penalty=shot_data.get("is_penalty", False),
-                    carry_distance_yards=shot_data.get("carry_distance", None),
-                    total_distance_yards=shot_data.get("total_distance", None)
-                )
-                hole_shots.append(shot)
-            
-            shots_by_hole.append(hole_shots)
+            hole_shot_rows, _, _ = self._build_shots(hole_data.get("shots", []), _ARCCOS_SHOT_FIELDS)
+            shot_rows_by_hole.append(hole_shot_rows)
         
         # Aggregate stats
         stats = {
@@ -182,9 +206,9 @@ class GolfDataTransformer:
             })
         }
         
-        return golf_round, holes, shots_by_hole, stats
+        return golf_round, holes, shot_rows_by_hole, stats
     
-    def transform_skytrak_data(self, skytrak_data: Dict[str, Any]) -> Tuple[GolfRound, List[GolfShot], Dict[str, Any]]:
+    def transform_skytrak_data(self, skytrak_data: Dict[str, Any]) -> Tuple[GolfRound, List[Dict[str, Any]], Dict[str, Any]]:
         """
         Transform SkyTrak data to GolfStats models.
         
@@ -192,12 +216,12 @@ class GolfDataTransformer:
             skytrak_data: Raw SkyTrak data
             
         Returns:
-            Tuple of (GolfRound, list of GolfShots, stats dictionary)
+            Tuple of (GolfRound, shot column dictionaries, stats dictionary)
         """
         logger.info(f"Transforming SkyTrak data for user {self.user_id}")
         
         # Extract session metadata
-        session_date = datetime.strptime(skytrak_data.get("session_date", datetime.now().strftime("%Y-%m-%d")), "%Y-%m-%d")
+        session_date = self._parse_date(skytrak_data.get("session_date"))
         
         # Create the golf round
         golf_round = GolfRound(
@@ -205,75 +229,171 @@ class GolfDataTransformer:
             date=session_date,
             course_name=skytrak_data.get("location", "SkyTrak Session"),
             source_system="skytrak",
+            external_id=skytrak_data.get("session_id"),
             notes=skytrak_data.get("notes", "")
         )
         
-        # Process shots
-        shots = []
-        for idx, shot_data in enumerate(skytrak_data.get("shots", [])):
-            shot = GolfShot(
-                shot_number=idx + 1,
-                club=shot_data.get("club", "Unknown"),
-                ball_speed_mph=shot_data.get("ball_speed", None),
-                club_speed_mph=shot_data.get("club_speed", None),
-                launch_angle_degrees=shot_data.get("launch_angle", None),
-                spin_rate_rpm=shot_data.get("spin_rate", None),
-                carry_distance_yards=shot_data.get("carry", None),
-                total_distance_yards=shot_data.get("total", None)
-            )
-            shots.append(shot)
+        # Keep the scraped ISO date for the Supabase payload so it is not re-serialized
+        golf_round._iso_date = skytrak_data.get("session_date") or session_date.date().isoformat()
+        
+        # Process shots, collecting the columns to aggregate in the same pass
+        shot_rows, columns, is_drive = self._build_shots(
+            skytrak_data.get("shots", []),
+            _SKYTRAK_SHOT_FIELDS,
+            ("ball_speed_mph", "launch_angle_degrees", "spin_rate_rpm", "total_distance_yards")
+        )
         
         # Aggregate stats
         stats = {
-            "average_drive_yards": self._calculate_average_drive_distance(shots),
+            "average_drive_yards": self._calculate_average_drive_distance(
+                is_drive, columns["total_distance_yards"]),
             "extended_stats": {
-                "average_ball_speed": self._calculate_average(shots, "ball_speed_mph"),
-                "average_launch_angle": self._calculate_average(shots, "launch_angle_degrees"),
-                "average_spin_rate": self._calculate_average(shots, "spin_rate_rpm"),
-                "shot_count": len(shots),
+                "average_ball_speed": self._calculate_average(columns["ball_speed_mph"]),
+                "average_launch_angle": self._calculate_average(columns["launch_angle_degrees"]),
+                "average_spin_rate": self._calculate_average(columns["spin_rate_rpm"]),
+                "shot_count": len(shot_rows),
                 "data_source": "skytrak"
             }
         }
         
-        return golf_round, shots, stats
+        return golf_round, shot_rows, stats
     
-    def _calculate_average(self, shots: List[GolfShot], attribute_name: str) -> Optional[float]:
+    def _build_shots(self, raw_shots: List[Dict[str, Any]], fields: Tuple[Tuple[str, str, Any], ...],
+                     stat_columns: Tuple[str, ...] = ()) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray],
+                                                              np.ndarray]:
+        """
+        Build shots from raw shot data in a single pass.
+        
+        Each shot's column values are collected in one dictionary, which is the
+        row written to the database and Supabase; no GolfShot instances are
+        created since both backends insert the rows directly.
+        The per-shot loop only copies values through the field table; the
+        columns to aggregate are converted to float arrays afterwards, one
+        column at a time.
+        
+        Args:
+            raw_shots: Raw shot dictionaries
+            fields: (column, raw key, default) for each column to read
+            stat_columns: Columns to collect into arrays for aggregation
+            
+        Returns:
+            Tuple of (list of shot column dictionaries, dictionary of column
+            arrays with NaN for missing values, boolean array flagging driver
+            shots)
+        """
+        is_drive = np.zeros(len(raw_shots), dtype=np.bool_)
+        shot_rows = []
+        
+        for idx, shot_data in enumerate(raw_shots):
+            club = shot_data.get("club", "Unknown")
+            row = {"shot_number": idx + 1, "club": club}
+            for column, key, default in fields:
+                row[column] = shot_data.get(key, default)
+            
+            is_drive[idx] = (club or "").lower() in _DRIVER_CLUBS
+            shot_rows.append(row)
+        
+        # None becomes NaN in a float array
+        columns = {
+            column: np.array([row[column] for row in shot_rows], dtype=np.float64)
+            for column in stat_columns
+        }
+        
+        return shot_rows, columns, is_drive
+    
+    def _parse_date(self, value: Optional[str]) -> datetime:
+        """
+        Parse a YYYY-MM-DD date from scraped data.
+        
+        Args:
+            value: Date string, or None if the source did not provide one
+            
+        Returns:
+            Parsed date, or midnight today if no date was given
+        """
+        if value:
+            return datetime.fromisoformat(value)
+        
+        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    def _calculate_average(self, values: np.ndarray) -> Optional[float]:
         """
         Calculate average for a shot attribute.
         
         Args:
-            shots: List of GolfShot objects
-            attribute_name: Name of the attribute to average
+            values: Attribute values, with NaN for missing values
             
         Returns:
             Average value or None if no valid data
         """
-        values = [getattr(shot, attribute_name) for shot in shots 
-                 if getattr(shot, attribute_name) is not None]
-        
-        if not values:
+        if values.size == 0 or np.isnan(values).all():
             return None
             
-        return sum(values) / len(values)
+        return float(np.nanmean(values))
     
-    def _calculate_average_drive_distance(self, shots: List[GolfShot]) -> Optional[float]:
+    def _calculate_average_drive_distance(self, is_drive: np.ndarray, total_distances: np.ndarray) -> Optional[float]:
         """
         Calculate average drive distance from shot data.
         
         Args:
-            shots: List of GolfShot objects
+            is_drive: Boolean array flagging driver shots
+            total_distances: Total distance of each shot, with NaN for missing values
             
         Returns:
             Average drive distance or None if no valid data
         """
-        driver_shots = [shot for shot in shots 
-                      if shot.club and shot.club.lower() in ("driver", "1w", "1-wood")
-                      and shot.total_distance_yards]
-        
-        if not driver_shots:
+        # Range sessions often have no driver shots at all
+        if not is_drive.any():
             return None
-            
-        return sum(shot.total_distance_yards for shot in driver_shots) / len(driver_shots)
+        
+        if _fast_aggr.NUMBA_AVAILABLE and total_distances.size >= _fast_aggr.MIN_JIT_SIZE:
+            average = _fast_aggr.masked_mean(total_distances, is_drive)
+            return None if np.isnan(average) else float(average)
+        
+        drive_distances = total_distances[is_drive & (total_distances != 0)]
+        
+        return self._calculate_average(drive_distances)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_transformer(user_id: int) -> GolfDataTransformer:
+    """
+    Get the transformer for a user, reusing it across rounds.
+    
+    Args:
+        user_id: Database ID of the user
+        
+    Returns:
+        GolfDataTransformer for the user
+    """
+    return GolfDataTransformer(user_id)
+
+
+# How each source is transformed and stored
+_SOURCE_SPECS = {
+    "trackman": {
+        "label": "Trackman",
+        "noun": "session",
+        "transform": "transform_trackman_data",
+        "has_holes": False,
+        "round_fields": ("course_name", "notes")
+    },
+    "arccos": {
+        "label": "Arccos",
+        "noun": "round",
+        "transform": "transform_arccos_data",
+        "has_holes": True,
+        "round_fields": ("course_name", "course_location", "tee_color", "total_score", "total_par",
+                         "front_nine_score", "back_nine_score", "weather_conditions")
+    },
+    "skytrak": {
+        "label": "SkyTrak",
+        "noun": "session",
+        "transform": "transform_skytrak_data",
+        "has_holes": False,
+        "round_fields": ("course_name", "notes")
+    }
+}
 
 
 class GolfDataStorage:
@@ -281,259 +401,328 @@ class GolfDataStorage:
     Stores transformed golf data in the database.
     """
     
-    def __init__(self, use_supabase: bool = True, use_sqlalchemy: bool = True):
+    def __init__(self, use_supabase: bool = True, use_sqlalchemy: bool = True,
+                 db: Optional[Session] = None):
         """
         Initialize the storage handler.
         
         Args:
             use_supabase: Whether to store data in Supabase
             use_sqlalchemy: Whether to store data in SQLAlchemy
+            db: Optional session to reuse for all writes instead of opening
+                a new one per call
         """
         self.use_supabase = use_supabase
         self.use_sqlalchemy = use_sqlalchemy
+        self.db = db
     
-    def store_trackman_session(self, user_id: int, trackman_data: Dict[str, Any]) -> Optional[int]:
+    @contextmanager
+    def _session(self) -> Generator[Session, None, None]:
         """
-        Store Trackman session data in the database.
+        Get the database session to write with.
+        
+        Yields:
+            The shared session if one was provided, otherwise a new session
+        """
+        if self.db is None:
+            with get_db() as db:
+                yield db
+            return
+        
+        try:
+            yield self.db
+        except Exception:
+            # Keep the shared session usable for the next write
+            self.db.rollback()
+            raise
+    
+    def _row_values(self, objects: List[Any], **values: Any) -> List[Dict[str, Any]]:
+        """
+        Convert transient model instances to rows for a bulk INSERT.
+        
+        Columns left unset are omitted so their defaults apply.
+        
+        Args:
+            objects: Model instances of a single class
+            **values: Column values to set on every row
+            
+        Returns:
+            List of column-name to value dictionaries
+        """
+        rows = []
+        for obj in objects:
+            row = {
+                column.key: getattr(obj, column.key)
+                for column in obj.__table__.columns
+                if getattr(obj, column.key) is not None
+            }
+            row.update(values)
+            rows.append(row)
+        return rows
+    
+    def _upsert_round(self, db: Session, golf_round: GolfRound) -> int:
+        """
+        Insert a round, or update it in place if it was already imported.
+        
+        Rounds are matched on (user_id, source_system, external_id) with
+        INSERT ... ON CONFLICT DO UPDATE, so re-scraping a session costs a
+        single statement. Rounds without an external ID are inserted with
+        RETURNING rather than flushed through the ORM. The holes, shots and
+        stats of an updated round are deleted so the caller can write them
+        again.
+        
+        Args:
+            db: Session to write with
+            golf_round: Transient round to store
+            
+        Returns:
+            ID of the inserted or updated round
+        """
+        dialect = db.get_bind().dialect
+        if golf_round.external_id is None or dialect.name not in ("postgresql", "sqlite"):
+            if not dialect.insert_returning:
+                db.add(golf_round)
+                db.flush()  # Flush to get the ID
+                return golf_round.id
+            
+            # Nothing to match on; insert and get the ID in the same round trip
+            return db.execute(
+                insert(GolfRound).returning(GolfRound.id),
+                self._row_values([golf_round])[0]
+            ).scalar_one()
+        
+        dialect_insert = postgresql.insert if dialect.name == "postgresql" else sqlite.insert
+        values = self._row_values([golf_round], updated_at=utcnow())[0]
+        stmt = dialect_insert(GolfRound).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "source_system", "external_id"],
+            set_={name: stmt.excluded[name] for name in values
+                  if name not in ("user_id", "source_system", "external_id", "created_at")}
+        ).returning(GolfRound.id)
+        round_id = db.execute(stmt).scalar_one()
+        
+        # Clear the previous import of this round
+        hole_ids = select(GolfHole.id).where(GolfHole.round_id == round_id)
+        db.execute(delete(GolfShot).where(or_(GolfShot.round_id == round_id, GolfShot.hole_id.in_(hole_ids))))
+        db.execute(delete(GolfHole).where(GolfHole.round_id == round_id))
+        db.execute(delete(RoundStats).where(RoundStats.round_id == round_id))
+        
+        return round_id
+    
+    def _store(self, user_id: int, data: Dict[str, Any], source: str) -> Optional[int]:
+        """
+        Transform data from any source and store it in the enabled backends.
+        
+        Range sessions have no holes, so their shots are stored against the
+        round directly with no hole_id. When both backends are enabled, the
+        Supabase copy is queued in the outbox within the same transaction and
+        replicated later by backend.etl.outbox_worker.
         
         Args:
             user_id: User ID
-            trackman_data: Raw Trackman data
+            data: Raw data from the source
+            source: Key of the source in _SOURCE_SPECS
             
         Returns:
             ID of the created golf round or None if failed
         """
-        # Transform data
-        transformer = GolfDataTransformer(user_id)
-        golf_round, shots, stats = transformer.transform_trackman_data(trackman_data)
+        spec = _SOURCE_SPECS[source]
         
-        # Store in database
-        round_id = None
+        # Transform data
+        transform = getattr(_get_transformer(user_id), spec["transform"])
+        if spec["has_holes"]:
+            golf_round, holes, shot_rows_by_hole, stats = transform(data)
+        else:
+            golf_round, shot_rows, stats = transform(data)
+            holes, shot_rows_by_hole = [], [shot_rows]
+        
+        payload = None
+        if self.use_supabase:
+            payload = self._supabase_payload(user_id, source, golf_round, holes, shot_rows_by_hole, stats)
         
-        # Using SQLAlchemy
+        # Using SQLAlchemy, with the Supabase write queued in the same commit
         if self.use_sqlalchemy:
             try:
-                with get_db() as db:
-                    # Add round to database
-                    db.add(golf_round)
-                    db.flush()  # Flush to get the ID
-                    round_id = golf_round.id
-                    
-                    # Create a dummy hole for the shots
-                    hole = GolfHole(
-                        round_id=round_id,
-                        hole_number=1,
-                        par=0,
-                        distance_yards=0
-                    )
-                    db.add(hole)
-                    db.flush()
-                    
-                    # Add shots to the hole
-                    for shot in shots:
-                        shot.hole_id = hole.id
-                        db.add(shot)
-                    
-                    # Add stats
-                    round_stats = RoundStats(
-                        round_id=round_id,
-                        **stats
-                    )
-                    db.add(round_stats)
-                    
-                    # Commit transaction
-                    db.commit()
-                    logger.info(f"Stored Trackman session with round ID {round_id} using SQLAlchemy")
+                with self._session() as db:
+                    round_id = self._store_sqlalchemy(db, golf_round, holes, shot_rows_by_hole, stats, payload)
+                    logger.info(f"Stored {spec['label']} {spec['noun']} with round ID {round_id} using SQLAlchemy")
+                    return round_id
                     
             except Exception as e:
-                logger.error(f"Error storing Trackman data with SQLAlchemy: {str(e)}")
-                round_id = None
+                logger.error(f"Error storing {spec['label']} data with SQLAlchemy: {str(e)}")
+                return None
         
-        # Using Supabase
-        if self.use_supabase:
+        # Using Supabase only
+        if payload is not None:
             try:
-                # Create round
-                round_dict = {
-                    "user_id": str(user_id),
-                    "date": golf_round.date.isoformat(),
-                    "course_name": golf_round.course_name,
-                    "source_system": "trackman",
-                    "notes": golf_round.notes
-                }
-                supabase_round = create_golf_round(str(user_id), round_dict)
+                supabase_round_id = self.store_supabase_payload(payload)
+                logger.info(f"Stored {spec['label']} {spec['noun']} with round ID {supabase_round_id} using Supabase")
+                return supabase_round_id
                 
-                if supabase_round:
-                    supabase_round_id = supabase_round["id"]
-                    round_id = round_id or supabase_round_id
-                    
-                    # Create a dummy hole
-                    hole_data = [{
-                        "round_id": supabase_round_id,
-                        "hole_number": 1,
-                        "par": 0,
-                        "distance_yards": 0
-                    }]
-                    holes_result = add_holes_for_round(supabase_round_id, hole_data)
-                    
-                    if holes_result:
-                        hole_id = holes_result[0]["id"]
-                        
-                        # Add shots
-                        shots_data = []
-                        for shot in shots:
-                            shot_dict = {
-                                "hole_id": hole_id,
-                                "shot_number": shot.shot_number,
-                                "club": shot.club,
-                                "ball_speed_mph": shot.ball_speed_mph,
-                                "club_speed_mph": shot.club_speed_mph,
-                                "smash_factor": shot.smash_factor,
-                                "launch_angle_degrees": shot.launch_angle_degrees,
-                                "spin_rate_rpm": shot.spin_rate_rpm,
-                                "spin_axis_degrees": shot.spin_axis_degrees,
-                                "carry_distance_yards": shot.carry_distance_yards,
-                                "total_distance_yards": shot.total_distance_yards,
-                                "side_deviation_yards": shot.side_deviation_yards
-                            }
-                            shots_data.append(shot_dict)
-                        
-                        add_shots_for_hole(hole_id, shots_data)
-                        
-                        # Add stats
-                        add_round_stats(supabase_round_id, stats)
-                        
-                        logger.info(f"Stored Trackman session with round ID {supabase_round_id} using Supabase")
-                    
             except Exception as e:
-                logger.error(f"Error storing Trackman data with Supabase: {str(e)}")
+                logger.error(f"Error storing {spec['label']} data with Supabase: {str(e)}")
+        
+        return None
+    
+    def _store_sqlalchemy(self, db: Session, golf_round: GolfRound, holes: List[Dict[str, Any]],
+                          shot_rows_by_hole: List[List[Dict[str, Any]]], stats: Dict[str, Any],
+                          outbox_payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Store a transformed round with SQLAlchemy and commit it.
         
+        Args:
+            db: Session to write with
+            golf_round: Transient round to store
+            holes: Hole column dictionaries of the round
+            shot_rows_by_hole: Shot column dictionaries for each hole, or a
+                single list of shots without a hole if there are no holes
+            stats: Stats dictionary
+            outbox_payload: Supabase payload to queue in the same transaction
+            
+        Returns:
+            ID of the stored round
+        """
+        # Add or update round in database
+        round_id = self._upsert_round(db, golf_round)
+        
+        # Add holes in one statement, returning their IDs in insertion order
+        hole_ids = [None]
+        if holes:
+            hole_ids = db.scalars(
+                insert(GolfHole).returning(GolfHole.id, sort_by_parameter_order=True),
+                [dict(hole, round_id=round_id) for hole in holes]
+            ).all()
+        
+        # Add the shots of all holes, one executemany per chunk
+        shot_rows = [
+            dict(row, round_id=round_id, hole_id=hole_id)
+            for hole_id, hole_shot_rows in zip(hole_ids, shot_rows_by_hole)
+            for row in hole_shot_rows
+        ]
+        for start in range(0, len(shot_rows), SQL_INSERT_CHUNK_SIZE):
+            db.execute(insert(GolfShot), shot_rows[start:start + SQL_INSERT_CHUNK_SIZE])
+        
+        # Add stats
+        db.add(RoundStats(round_id=round_id, **stats))
+        
+        # Queue the Supabase copy
+        if outbox_payload is not None:
+            db.add(EtlOutbox(kind=golf_round.source_system, payload=outbox_payload))
+        
+        # Commit transaction
+        db.commit()
         return round_id
     
-    def store_arccos_round(self, user_id: int, arccos_data: Dict[str, Any]) -> Optional[int]:
+    def _supabase_payload(self, user_id: int, source: str, golf_round: GolfRound, holes: List[Dict[str, Any]],
+                          shot_rows_by_hole: List[List[Dict[str, Any]]], stats: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Store Arccos round data in the database.
+        Build the JSON-serializable payload used to store a round in Supabase.
         
         Args:
             user_id: User ID
-            arccos_data: Raw Arccos data
+            source: Key of the source in _SOURCE_SPECS
+            golf_round: Transient round to store
+            holes: Hole column dictionaries of the round
+            shot_rows_by_hole: Shot column dictionaries for each hole, or a
+                single list of shots without a hole if there are no holes
+            stats: Stats dictionary
             
         Returns:
-            ID of the created golf round or None if failed
+            Dictionary with round, holes, shots_by_hole and stats entries
         """
-        # Transform data
-        transformer = GolfDataTransformer(user_id)
-        golf_round, holes, shots_by_hole, stats = transformer.transform_arccos_data(arccos_data)
-        
-        # Store in database
-        round_id = None
+        iso_date = getattr(golf_round, "_iso_date", None) or golf_round.date.isoformat()
+        round_dict = {"user_id": str(user_id), "date": iso_date}
+        for field in _SOURCE_SPECS[source]["round_fields"]:
+            round_dict[field] = getattr(golf_round, field)
+        round_dict["source_system"] = source
+        round_dict["external_id"] = golf_round.external_id
+        
+        return {
+            "round": round_dict,
+            "holes": holes,
+            "shots_by_hole": shot_rows_by_hole,
+            "stats": stats
+        }
+    
+    def store_supabase_payload(self, payload: Dict[str, Any]) -> int:
+        """
+        Store a round payload built by _supabase_payload in Supabase.
         
-        # Using SQLAlchemy
-        if self.use_sqlalchemy:
-            try:
-                with get_db() as db:
-                    # Add round to database
-                    db.add(golf_round)
-                    db.flush()  # Flush to get the ID
-                    round_id = golf_round.id
-                    
-                    # Add holes and shots
-                    for i, hole in enumerate(holes):
-                        hole.round_id = round_id
-                        db.add(hole)
-                        db.flush()
-                        
-                        # Add shots for this hole
-                        for shot in shots_by_hole[i]:
-                            shot.hole_id = hole.id
-                            db.add(shot)
-                    
-                    # Add stats
-                    round_stats = RoundStats(
-                        round_id=round_id,
-                        **stats
-                    )
-                    db.add(round_stats)
-                    
-                    # Commit transaction
-                    db.commit()
-                    logger.info(f"Stored Arccos round with round ID {round_id} using SQLAlchemy")
-                    
-            except Exception as e:
-                logger.error(f"Error storing Arccos data with SQLAlchemy: {str(e)}")
-                round_id = None
+        A round already imported from the same session is updated and its
+        holes and shots are replaced, so a payload can be replayed safely.
         
-        # Using Supabase
-        if self.use_supabase:
-            try:
-                # Create round
-                round_dict = {
-                    "user_id": str(user_id),
-                    "date": golf_round.date.isoformat(),
-                    "course_name": golf_round.course_name,
-                    "course_location": golf_round.course_location,
-                    "tee_color": golf_round.tee_color,
-                    "total_score": golf_round.total_score,
-                    "total_par": golf_round.total_par,
-                    "front_nine_score": golf_round.front_nine_score,
-                    "back_nine_score": golf_round.back_nine_score,
-                    "weather_conditions": golf_round.weather_conditions,
-                    "source_system": "arccos"
-                }
-                supabase_round = create_golf_round(str(user_id), round_dict)
+        Args:
+            payload: Round payload
+            
+        Returns:
+            Supabase ID of the stored round
+            
+        Raises:
+            RuntimeError: If the round or any of its holes, shots or stats
+                was not stored
+        """
+        round_dict = payload["round"]
+        holes = payload["holes"]
+        shot_rows_by_hole = payload["shots_by_hole"]
+        
+        # Create or update round
+        supabase_round = upsert_golf_round(round_dict["user_id"], dict(round_dict))
+        if not supabase_round:
+            raise RuntimeError("Supabase did not store the round")
+        
+        supabase_round_id = supabase_round["id"]
+        
+        if not holes:
+            # Range session shots belong to the round directly
+            if shot_rows_by_hole and shot_rows_by_hole[0]:
+                shots_data = [dict(row) for row in shot_rows_by_hole[0]]
+                if len(add_shots_for_round(supabase_round_id, shots_data)) != len(shots_data):
+                    raise RuntimeError(f"Supabase did not store the shots of round {supabase_round_id}")
+        else:
+            # Create holes
+            holes_result = add_holes_for_round(supabase_round_id, [dict(hole) for hole in holes])
+            if len(holes_result) != len(holes):
+                raise RuntimeError(f"Supabase did not store the holes of round {supabase_round_id}")
+            
+            # Add shots for each hole
+            for hole_result, hole_shot_rows in zip(holes_result, shot_rows_by_hole):
+                hole_id = hole_result["id"]
+                shots_data = [dict(row, round_id=supabase_round_id) for row in hole_shot_rows]
                 
-                if supabase_round:
-                    supabase_round_id = supabase_round["id"]
-                    round_id = round_id or supabase_round_id
-                    
-                    # Create holes
-                    holes_data = []
-                    for hole in holes:
-                        hole_dict = {
-                            "round_id": supabase_round_id,
-                            "hole_number": hole.hole_number,
-                            "par": hole.par,
-                            "score": hole.score,
-                            "fairway_hit": hole.fairway_hit,
-                            "green_in_regulation": hole.green_in_regulation,
-                            "putts": hole.putts,
-                            "distance_yards": hole.distance_yards
-                        }
-                        holes_data.append(hole_dict)
-                    
-                    holes_result = add_holes_for_round(supabase_round_id, holes_data)
-                    
-                    if holes_result:
-                        # Add shots for each hole
-                        for i, hole_result in enumerate(holes_result):
-                            hole_id = hole_result["id"]
-                            shots_data = []
-                            
-                            for shot in shots_by_hole[i]:
-                                shot_dict = {
-                                    "hole_id": hole_id,
-                                    "shot_number": shot.shot_number,
-                                    "club": shot.club,
-                                    "distance_yards": shot.distance_yards,
-                                    "from_location": shot.from_location,
-                                    "to_location": shot.to_location,
-                                    "is_penalty": shot.is_penalty,
-                                    "carry_distance_yards": shot.carry_distance_yards,
-                                    "total_distance_yards": shot.total_distance_yards
-                                }
-                                shots_data.append(shot_dict)
-                            
-                            if shots_data:
-                                add_shots_for_hole(hole_id, shots_data)
-                        
-                        # Add stats
-                        add_round_stats(supabase_round_id, stats)
-                        
-                        logger.info(f"Stored Arccos round with round ID {supabase_round_id} using Supabase")
-                    
-            except Exception as e:
-                logger.error(f"Error storing Arccos data with Supabase: {str(e)}")
+                if shots_data and len(add_shots_for_hole(hole_id, shots_data)) != len(shots_data):
+                    raise RuntimeError(f"Supabase did not store the shots of hole {hole_id}")
         
-        return round_id
+        # Add stats
+        if add_round_stats(supabase_round_id, dict(payload["stats"])) is None:
+            raise RuntimeError(f"Supabase did not store the stats of round {supabase_round_id}")
+        
+        return supabase_round_id
+    
+    def store_trackman_session(self, user_id: int, trackman_data: Dict[str, Any]) -> Optional[int]:
+        """
+        Store Trackman session data in the database.
+        
+        Args:
+            user_id: User ID
+            trackman_data: Raw Trackman data
+            
+        Returns:
+            ID of the created golf round or None if failed
+        """
+        return self._store(user_id, trackman_data, "trackman")
+    
+    def store_arccos_round(self, user_id: int, arccos_data: Dict[str, Any]) -> Optional[int]:
+        """
+        Store Arccos round data in the database.
+        
+        Args:
+            user_id: User ID
+            arccos_data: Raw Arccos data
+            
+        Returns:
+            ID of the created golf round or None if failed
+        """
+        return self._store(user_id, arccos_data, "arccos")
     
     def store_skytrak_session(self, user_id: int, skytrak_data: Dict[str, Any]) -> Optional[int]:
         """
@@ -546,105 +735,4 @@ class GolfDataStorage:
         Returns:
             ID of the created golf round or None if failed
         """
-        # Transform data
-        transformer = GolfDataTransformer(user_id)
-        golf_round, shots, stats = transformer.transform_skytrak_data(skytrak_data)
-        
-        # Store in database
-        round_id = None
-        
-        # Using SQLAlchemy
-        if self.use_sqlalchemy:
-            try:
-                with get_db() as db:
-                    # Add round to database
-                    db.add(golf_round)
-                    db.flush()  # Flush to get the ID
-                    round_id = golf_round.id
-                    
-                    # Create a dummy hole for the shots
-                    hole = GolfHole(
-                        round_id=round_id,
-                        hole_number=1,
-                        par=0,
-                        distance_yards=0
-                    )
-                    db.add(hole)
-                    db.flush()
-                    
-                    # Add shots to the hole
-                    for shot in shots:
-                        shot.hole_id = hole.id
-                        db.add(shot)
-                    
-                    # Add stats
-                    round_stats = RoundStats(
-                        round_id=round_id,
-                        **stats
-                    )
-                    db.add(round_stats)
-                    
-                    # Commit transaction
-                    db.commit()
-                    logger.info(f"Stored SkyTrak session with round ID {round_id} using SQLAlchemy")
-                    
-            except Exception as e:
-                logger.error(f"Error storing SkyTrak data with SQLAlchemy: {str(e)}")
-                round_id = None
-        
-        # Using Supabase
-        if self.use_supabase:
-            try:
-                # Create round
-                round_dict = {
-                    "user_id": str(user_id),
-                    "date": golf_round.date.isoformat(),
-                    "course_name": golf_round.course_name,
-                    "source_system": "skytrak",
-                    "notes": golf_round.notes
-                }
-                supabase_round = create_golf_round(str(user_id), round_dict)
-                
-                if supabase_round:
-                    supabase_round_id = supabase_round["id"]
-                    round_id = round_id or supabase_round_id
-                    
-                    # Create a dummy hole
-                    hole_data = [{
-                        "round_id": supabase_round_id,
-                        "hole_number": 1,
-                        "par": 0,
-                        "distance_yards": 0
-                    }]
-                    holes_result = add_holes_for_round(supabase_round_id, hole_data)
-                    
-                    if holes_result:
-                        hole_id = holes_result[0]["id"]
-                        
-                        # Add shots
-                        shots_data = []
-                        for shot in shots:
-                            shot_dict = {
-                                "hole_id": hole_id,
-                                "shot_number": shot.shot_number,
-                                "club": shot.club,
-                                "ball_speed_mph": shot.ball_speed_mph,
-                                "club_speed_mph": shot.club_speed_mph,
-                                "launch_angle_degrees": shot.launch_angle_degrees,
-                                "spin_rate_rpm": shot.spin_rate_rpm,
-                                "carry_distance_yards": shot.carry_distance_yards,
-                                "total_distance_yards": shot.total_distance_yards
-                            }
-                            shots_data.append(shot_dict)
-                        
-                        add_shots_for_hole(hole_id, shots_data)
-                        
-                        # Add stats
-                        add_round_stats(supabase_round_id, stats)
-                        
-                        logger.info(f"Stored SkyTrak session with round ID {supabase_round_id} using Supabase")
-                    
-            except Exception as e:
-                logger.error(f"Error storing SkyTrak data with Supabase: {str(e)}")
-        
-        return round_id
\ No newline at end of file
+        return self._store(user_id, skytrak_data, "skytrak")
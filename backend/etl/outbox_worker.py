@@ -0,0 +1,95 @@
+"""
+Outbox replication for GolfStats ETL.
+
+When both storage backends are enabled, GolfDataStorage commits each round to
+the database together with an etl_outbox row holding its Supabase payload.
+This module replays those rows against Supabase, retrying failed rows on later
+runs until they succeed or run out of attempts.
+"""
+import logging
+import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from config.config import config
+from backend.database.db_connection import get_db
+from backend.models.golf_data import EtlOutbox
+from backend.etl.data_transformer import GolfDataStorage
+
+# Configure logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Outbox rows replicated per run
+OUTBOX_BATCH_SIZE = config["etl"]["outbox"]["batch_size"]
+
+# Failed attempts after which a row is no longer retried
+OUTBOX_MAX_ATTEMPTS = config["etl"]["outbox"]["max_attempts"]
+
+def drain_outbox(limit: int = OUTBOX_BATCH_SIZE, db: Optional[Session] = None) -> Dict[str, int]:
+    """
+    Replicate pending outbox rows to Supabase, oldest first.
+    
+    Each row is committed as soon as it is processed, so a crash part way
+    through only repeats the row that was in flight.
+    
+    Args:
+        limit: Maximum number of rows to process
+        db: Session to read and update the outbox with (defaults to a new session)
+        
+    Returns:
+        Dictionary with the number of rows replicated, retried and failed
+    """
+    if db is None:
+        with get_db() as db:
+            return drain_outbox(limit, db)
+    
+    results = {"replicated": 0, "retried": 0, "failed": 0}
+    storage = GolfDataStorage(use_sqlalchemy=False)
+    
+    entries = db.scalars(
+        select(EtlOutbox)
+        .where(EtlOutbox.status == "pending")
+        .order_by(EtlOutbox.id)
+        .limit(limit)
+    ).all()
+    
+    for entry in entries:
+        try:
+            storage.store_supabase_payload(entry.payload)
+            
+            entry.status = "done"
+            entry.processed_at = datetime.datetime.utcnow()
+            results["replicated"] += 1
+        
+        except Exception as e:
+            entry.attempts += 1
+            entry.last_error = str(e)
+            if entry.attempts >= OUTBOX_MAX_ATTEMPTS:
+                entry.status = "failed"
+                entry.processed_at = datetime.datetime.utcnow()
+                results["failed"] += 1
+                logger.error(f"Giving up on outbox entry {entry.id} after {entry.attempts} attempts: {str(e)}")
+            else:
+                results["retried"] += 1
+                logger.warning(f"Error replicating outbox entry {entry.id} (attempt {entry.attempts}): {str(e)}")
+        
+        db.commit()
+    
+    if entries:
+        logger.info(f"Outbox drained - {results['replicated']} replicated, "
+                    f"{results['retried']} to retry, {results['failed']} failed")
+    
+    return results
+
+if __name__ == "__main__":
+    """
+    Replicate pending outbox rows when the script is executed directly.
+    """
+    results = drain_outbox()
+    print(f"Outbox Summary:")
+    print(f"- Replicated: {results['replicated']}")
+    print(f"- To Retry: {results['retried']}")
+    print(f"- Failed: {results['failed']}")
@@ -0,0 +1,138 @@
+"""
+Adaptive scraper throttling for GolfStats ETL.
+
+This module limits how many scrapes of the same provider run at once across
+all ETL worker processes, adjusting the limit to the provider's observed
+response time in the style of Scrapy's AutoThrottle.
+"""
+import time
+import logging
+import multiprocessing
+from contextlib import contextmanager
+from typing import Dict, Generator, Iterable, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Weight of the newest sample in the latency moving average
+EWMA_ALPHA = 0.3
+
+# Consecutive fast scrapes required before allowing one more in flight
+INCREASE_AFTER = 3
+
+class AdaptiveThrottle:
+    """
+    Cross-process concurrency limit for one provider.
+    
+    The limit is halved whenever a scrape fails or the average scrape time
+    rises well above the target, and grows by one after a run of scrapes
+    finishing under the target. State lives in shared memory, so a throttle
+    created before the worker pool starts is shared by every worker.
+    """
+    
+    def __init__(self, name: str, target_seconds: float, start_concurrency: int = 2,
+                 max_concurrency: int = 8):
+        """
+        Initialize the throttle.
+        
+        Args:
+            name: Provider name, used in log messages
+            target_seconds: Scrape time the provider handles comfortably
+            start_concurrency: Number of concurrent scrapes allowed at first
+            max_concurrency: Upper bound on concurrent scrapes
+        """
+        self.name = name
+        self.target_seconds = target_seconds
+        self.max_concurrency = max(1, max_concurrency)
+        self._cond = multiprocessing.Condition()
+        self._permits = multiprocessing.RawValue('i', min(max(1, start_concurrency), self.max_concurrency))
+        self._in_flight = multiprocessing.RawValue('i', 0)
+        self._latency = multiprocessing.RawValue('d', 0.0)
+        self._fast_streak = multiprocessing.RawValue('i', 0)
+    
+    @property
+    def permits(self) -> int:
+        """Current number of concurrent scrapes allowed."""
+        return self._permits.value
+    
+    @contextmanager
+    def slot(self, deadline: Optional[float] = None) -> Generator[None, None, None]:
+        """
+        Hold one of the provider's concurrency slots for the duration of a scrape.
+        
+        Args:
+            deadline: time.monotonic() value after which to stop waiting for a slot
+            
+        Raises:
+            TimeoutError: If no slot became free before the deadline
+        """
+        with self._cond:
+            while self._in_flight.value >= self._permits.value:
+                timeout = None if deadline is None else deadline - time.monotonic()
+                if timeout is not None and timeout <= 0:
+                    raise TimeoutError(f"Timed out waiting for a {self.name} scrape slot")
+                self._cond.wait(timeout)
+            self._in_flight.value += 1
+        
+        start = time.monotonic()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self._record(time.monotonic() - start, failed)
+    
+    def _record(self, latency: float, failed: bool) -> None:
+        """
+        Release a slot and adjust the limit from the scrape outcome.
+        
+        Args:
+            latency: Duration of the scrape in seconds
+            failed: Whether the scrape raised an error
+        """
+        with self._cond:
+            self._in_flight.value -= 1
+            permits = self._permits.value
+            
+            if failed:
+                self._fast_streak.value = 0
+                self._permits.value = max(1, permits // 2)
+            else:
+                if self._latency.value:
+                    self._latency.value += EWMA_ALPHA * (latency - self._latency.value)
+                else:
+                    self._latency.value = latency
+                
+                if self._latency.value > self.target_seconds * 1.5:
+                    self._fast_streak.value = 0
+                    self._permits.value = max(1, permits // 2)
+                elif self._latency.value < self.target_seconds:
+                    self._fast_streak.value += 1
+                    if self._fast_streak.value >= INCREASE_AFTER:
+                        self._fast_streak.value = 0
+                        self._permits.value = min(self.max_concurrency, permits + 1)
+            
+            if self._permits.value != permits:
+                logger.info(f"{self.name} concurrency changed from {permits} to {self._permits.value} "
+                            f"(average scrape time {self._latency.value:.1f}s)")
+            self._cond.notify_all()
+
+def create_throttles(names: Iterable[str], target_seconds: float, start_concurrency: int,
+                     max_concurrency: int) -> Dict[str, AdaptiveThrottle]:
+    """
+    Create one throttle per provider.
+    
+    Args:
+        names: Provider names
+        target_seconds: Scrape time each provider handles comfortably
+        start_concurrency: Number of concurrent scrapes allowed at first
+        max_concurrency: Upper bound on concurrent scrapes
+        
+    Returns:
+        Dictionary mapping provider name to its throttle
+    """
+    return {
+        name: AdaptiveThrottle(name, target_seconds, start_concurrency, max_concurrency)
+        for name in names
+    }
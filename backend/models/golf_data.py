@@ -4,24 +4,99 @@ Golf data models for GolfStats application.
 This module defines models for storing golf-related data such as rounds, shots,
 and statistics from various tracking systems.
 """
-import os
-import sys
-import datetime
-from typing import List, Optional
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, JSON, Text
+import enum
+from typing import Dict, List, Optional, Type
+from sqlalchemy import Column, Integer, SmallInteger, String, Float, DateTime, Boolean, ForeignKey, JSON, Text, UniqueConstraint, Index, desc
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
 
-# Add the project root directory to Python path if not already added
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from backend.database.db_connection import Base, TimestampMixin, utcnow
 
-from backend.database.db_connection import Base
+class ShotLocation(enum.IntEnum):
+    """Stored codes for GolfShot.from_location and to_location."""
+    UNKNOWN = 0
+    TEE = 1
+    FAIRWAY = 2
+    ROUGH = 3
+    SAND = 4
+    GREEN = 5
+    HOLE = 6
+    RANGE = 7
 
-class GolfRound(Base):
+# Lie names used by tracker APIs for a ShotLocation of another name
+SHOT_LOCATION_ALIASES = {
+    "bunker": "sand",
+    "fairway bunker": "sand",
+    "greenside bunker": "sand",
+    "fringe": "green",
+    "cup": "hole",
+}
+
+class ClubType(enum.IntEnum):
+    """Stored codes for Club.club_type."""
+    DRIVER = 1
+    WOOD = 2
+    HYBRID = 3
+    IRON = 4
+    WEDGE = 5
+    PUTTER = 6
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store one of a fixed set of lowercase names as a small integer code.
+    
+    Values are read and written as the names ('tee', 'driver', ...), so the
+    narrower column is invisible to callers. Names are matched ignoring case
+    and surrounding spaces, after mapping any aliases. Empty strings are
+    stored as NULL and unrecognized names as UNKNOWN, if the enum has that
+    member.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    
+    def __init__(self, enum_class: Type[enum.IntEnum], aliases: Optional[Dict[str, str]] = None,
+                 *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        # Kept hashable for the statement cache key
+        self.aliases = tuple(sorted((aliases or {}).items()))
+        self._alias_map = dict(self.aliases)
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, int):
+            # Codes and enum members are stored as they are
+            return int(self.enum_class(value))
+        
+        name = str(value).strip().lower()
+        if not name:
+            return None
+        name = self._alias_map.get(name, name)
+        try:
+            return int(self.enum_class[name.upper()])
+        except KeyError:
+            # Keep the row when the enum has a catch-all member
+            if "UNKNOWN" in self.enum_class.__members__:
+                return int(self.enum_class.UNKNOWN)
+            raise ValueError(f"Unknown {self.enum_class.__name__} value: {value!r}")
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_class(value).name.lower()
+
+class GolfRound(TimestampMixin, Base):
     """Model for a round of golf."""
     
     __tablename__ = "golf_rounds"
+    __table_args__ = (
+        # Lets re-scraped sessions be upserted instead of duplicated
+        UniqueConstraint("user_id", "source_system", "external_id", name="uq_golf_rounds_external_id"),
+        # Latest rounds for a user; rounds by source use the constraint above
+        Index("ix_rounds_user_date", "user_id", desc("date")),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -36,12 +111,12 @@ class GolfRound(Base):
     weather_conditions = Column(String(100), nullable=True)
     notes = Column(Text, nullable=True)
     source_system = Column(String(50), nullable=True)  # 'arccos', 'manual', etc.
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    external_id = Column(String(100), nullable=True)  # Session/round ID in the source system
     
     # Relationships
     user = relationship("User", back_populates="golf_rounds")
     holes = relationship("GolfHole", back_populates="round", cascade="all, delete-orphan")
+    shots = relationship("GolfShot", back_populates="round", cascade="all, delete-orphan")
     stats = relationship("RoundStats", back_populates="round", uselist=False, cascade="all, delete-orphan")
     
     def __repr__(self):
@@ -52,6 +127,9 @@ class GolfHole(Base):
     """Model for a single hole in a round of golf."""
     
     __tablename__ = "golf_holes"
+    __table_args__ = (
+        Index("ix_holes_round_id_hole_number", "round_id", "hole_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     round_id = Column(Integer, ForeignKey("golf_rounds.id"), nullable=False)
@@ -76,14 +154,20 @@ class GolfShot(Base):
     """Model for a single shot in a hole."""
     
     __tablename__ = "golf_shots"
+    __table_args__ = (
+        Index("ix_shots_hole_id_shot_number", "hole_id", "shot_number"),
+        # Range session shots, which have no hole
+        Index("ix_shots_round_id_shot_number", "round_id", "shot_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    hole_id = Column(Integer, ForeignKey("golf_holes.id"), nullable=False)
+    round_id = Column(Integer, ForeignKey("golf_rounds.id"), nullable=True)
+    hole_id = Column(Integer, ForeignKey("golf_holes.id"), nullable=True)  # None for range sessions
     shot_number = Column(Integer, nullable=False)
     club = Column(String(50), nullable=True)
     distance_yards = Column(Float, nullable=True)
-    from_location = Column(String(50), nullable=True)  # 'tee', 'fairway', 'rough', 'sand', 'green'
-    to_location = Column(String(50), nullable=True)
+    from_location = Column(SmallIntEnum(ShotLocation, SHOT_LOCATION_ALIASES), nullable=True)  # 'tee', 'fairway', 'rough', 'sand', 'green', 'hole', 'range'
+    to_location = Column(SmallIntEnum(ShotLocation, SHOT_LOCATION_ALIASES), nullable=True)
     is_penalty = Column(Boolean, default=False)
     
     # Shot metrics (from launch monitors)
@@ -98,6 +182,7 @@ class GolfShot(Base):
     side_deviation_yards = Column(Float, nullable=True)
     
     # Relationships
+    round = relationship("GolfRound", back_populates="shots")
     hole = relationship("GolfHole", back_populates="shots")
     
     def __repr__(self):
@@ -108,6 +193,10 @@ class RoundStats(Base):
     """Model for aggregated statistics for a round."""
     
     __tablename__ = "round_stats"
+    __table_args__ = (
+        # Key lookups inside extended_stats (PostgreSQL only)
+        Index("ix_round_stats_extended_gin", "extended_stats", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     round_id = Column(Integer, ForeignKey("golf_rounds.id"), nullable=False, unique=True)
@@ -127,8 +216,8 @@ class RoundStats(Base):
     up_and_down_attempts = Column(Integer, nullable=True)
     three_putts = Column(Integer, nullable=True)
     
-    # Extended stats from tracking systems (stored as JSON)
-    extended_stats = Column(JSON, nullable=True)
+    # Extended stats from tracking systems (stored as JSON, JSONB on PostgreSQL)
+    extended_stats = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     
     # Relationships
     round = relationship("GolfRound", back_populates="stats")
@@ -145,7 +234,7 @@ class Club(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     name = Column(String(100), nullable=False)
-    club_type = Column(String(50), nullable=False)  # 'driver', 'wood', 'hybrid', 'iron', 'wedge', 'putter'
+    club_type = Column(SmallIntEnum(ClubType), nullable=False)  # 'driver', 'wood', 'hybrid', 'iron', 'wedge', 'putter'
     brand = Column(String(100), nullable=True)
     model = Column(String(100), nullable=True)
     loft = Column(Float, nullable=True)
@@ -158,4 +247,46 @@ class Club(Base):
     user = relationship("User", back_populates="clubs")
     
     def __repr__(self):
-        return f"<Club(id={self.id}, user_id={self.user_id}, name={self.name}, type={self.club_type})>"
\ No newline at end of file
+        return f"<Club(id={self.id}, user_id={self.user_id}, name={self.name}, type={self.club_type})>"
+
+
+class UserStatsAggregate(Base):
+    """Model for a user's stats over a trailing window, refreshed after each ETL run."""
+    
+    __tablename__ = "user_stats_aggregates"
+    __table_args__ = (
+        UniqueConstraint("user_id", "window_days", name="uq_user_stats_aggregates_window"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    window_days = Column(Integer, nullable=False)  # 30, 90, 365
+    rounds_played = Column(Integer, nullable=False, default=0)
+    scoring_average = Column(Float, nullable=True)
+    score_to_par_average = Column(Float, nullable=True)
+    putts_per_round = Column(Float, nullable=True)
+    fairways_hit_pct = Column(Float, nullable=True)
+    greens_in_regulation_per_round = Column(Float, nullable=True)
+    average_drive_yards = Column(Float, nullable=True)
+    updated_at = Column(DateTime, server_default=utcnow())
+    
+    def __repr__(self):
+        return f"<UserStatsAggregate(user_id={self.user_id}, window_days={self.window_days}, rounds={self.rounds_played})>"
+
+
+class EtlOutbox(Base):
+    """Model for ETL writes waiting to be replicated to Supabase."""
+    
+    __tablename__ = "etl_outbox"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)  # Source system of the stored round
+    payload = Column(JSON, nullable=False)
+    status = Column(String(20), default="pending", nullable=False, index=True)  # 'pending', 'done', 'failed'
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow())
+    processed_at = Column(DateTime, nullable=True)
+    
+    def __repr__(self):
+        return f"<EtlOutbox(id={self.id}, kind={self.kind}, status={self.status}, attempts={self.attempts})>"
@@ -4,21 +4,38 @@ User model for GolfStats application.
 This module defines the User model for authentication and user management.
 """
 from typing import Optional, Dict, Any
-import os
-import sys
-import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, and_
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 
-# Add the project root directory to Python path if not already added
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
-from backend.database.db_connection import Base
+from backend.database.db_connection import Base, TimestampMixin
 from config.config import config
 
-class User(Base):
+# Global tracker credentials from config, used when a user has none of their
+# own; read once since the config does not change at runtime
+_TRACKMAN_GLOBAL = (config["scrapers"]["trackman"]["username"], config["scrapers"]["trackman"]["password"])
+_ARCCOS_GLOBAL = (config["scrapers"]["arccos"]["email"], config["scrapers"]["arccos"]["password"])
+_SKYTRAK_GLOBAL = (config["scrapers"]["skytrak"]["username"], config["scrapers"]["skytrak"]["password"])
+
+_TRACKMAN_GLOBAL_VALID = all(_TRACKMAN_GLOBAL)
+_ARCCOS_GLOBAL_VALID = all(_ARCCOS_GLOBAL)
+_SKYTRAK_GLOBAL_VALID = all(_SKYTRAK_GLOBAL)
+
+def _user_credentials_set(login_column: Column, password_column: Column):
+    """
+    Build a SQL expression that is true when a user stored their own credentials.
+    
+    Args:
+        login_column: Username or email column
+        password_column: Password column
+        
+    Returns:
+        Boolean SQL expression matching the truthiness check done in Python
+    """
+    return and_(login_column.isnot(None), login_column != "",
+                password_column.isnot(None), password_column != "")
+
+class User(TimestampMixin, Base):
     """User model for authentication and profile information."""
     
     __tablename__ = "users"
@@ -30,8 +47,6 @@ class User(Base):
     full_name = Column(String(100), nullable=True)
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
     
     # OAuth related fields
     auth_provider = Column(String(20), nullable=True)  # 'google', 'custom', etc.
@@ -57,6 +72,35 @@ class User(Base):
     golf_rounds = relationship("GolfRound", back_populates="user")
     clubs = relationship("Club", back_populates="user")
     
+    # Whether the user stored their own tracker credentials; usable in queries,
+    # e.g. db.query(User).filter(User.has_arccos_user_credentials)
+    @hybrid_property
+    def has_trackman_user_credentials(self) -> bool:
+        return bool(self.trackman_username and self.trackman_password)
+    
+    @has_trackman_user_credentials.inplace.expression
+    @classmethod
+    def _has_trackman_user_credentials_expression(cls):
+        return _user_credentials_set(cls.trackman_username, cls.trackman_password)
+    
+    @hybrid_property
+    def has_arccos_user_credentials(self) -> bool:
+        return bool(self.arccos_email and self.arccos_password)
+    
+    @has_arccos_user_credentials.inplace.expression
+    @classmethod
+    def _has_arccos_user_credentials_expression(cls):
+        return _user_credentials_set(cls.arccos_email, cls.arccos_password)
+    
+    @hybrid_property
+    def has_skytrak_user_credentials(self) -> bool:
+        return bool(self.skytrak_username and self.skytrak_password)
+    
+    @has_skytrak_user_credentials.inplace.expression
+    @classmethod
+    def _has_skytrak_user_credentials_expression(cls):
+        return _user_credentials_set(cls.skytrak_username, cls.skytrak_password)
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert user model to dictionary.
@@ -89,14 +133,11 @@ class User(Base):
             bool: True if has valid credentials
         """
         # First check user-specific credentials
-        if self.trackman_username and self.trackman_password:
+        if self.has_trackman_user_credentials:
             return True
         
         # Then check global credentials from config
-        global_username = config["scrapers"]["trackman"]["username"]
-        global_password = config["scrapers"]["trackman"]["password"]
-        
-        return bool(global_username and global_password)
+        return _TRACKMAN_GLOBAL_VALID
     
     def arccos_credentials_valid(self) -> bool:
         """
@@ -106,14 +147,11 @@ class User(Base):
             bool: True if has valid credentials
         """
         # First check user-specific credentials
-        if self.arccos_email and self.arccos_password:
+        if self.has_arccos_user_credentials:
             return True
         
         # Then check global credentials from config
-        global_email = config["scrapers"]["arccos"]["email"]
-        global_password = config["scrapers"]["arccos"]["password"]
-        
-        return bool(global_email and global_password)
+        return _ARCCOS_GLOBAL_VALID
     
     def skytrak_credentials_valid(self) -> bool:
         """
@@ -123,14 +161,11 @@ class User(Base):
             bool: True if has valid credentials
         """
         # First check user-specific credentials
-        if self.skytrak_username and self.skytrak_password:
+        if self.has_skytrak_user_credentials:
             return True
         
         # Then check global credentials from config
-        global_username = config["scrapers"]["skytrak"]["username"]
-        global_password = config["scrapers"]["skytrak"]["password"]
-        
-        return bool(global_username and global_password)
+        return _SKYTRAK_GLOBAL_VALID
     
     def get_trackman_credentials(self) -> Dict[str, str]:
         """
@@ -146,8 +181,8 @@ class User(Base):
             }
         else:
             return {
-                "username": config["scrapers"]["trackman"]["username"],
-                "password": config["scrapers"]["trackman"]["password"]
+                "username": _TRACKMAN_GLOBAL[0],
+                "password": _TRACKMAN_GLOBAL[1]
             }
     
     def get_arccos_credentials(self) -> Dict[str, str]:
@@ -164,8 +199,8 @@ class User(Base):
             }
         else:
             return {
-                "email": config["scrapers"]["arccos"]["email"],
-                "password": config["scrapers"]["arccos"]["password"]
+                "email": _ARCCOS_GLOBAL[0],
+                "password": _ARCCOS_GLOBAL[1]
             }
     
     def get_skytrak_credentials(self) -> Dict[str, str]:
@@ -182,8 +217,8 @@ class User(Base):
             }
         else:
             return {
-                "username": config["scrapers"]["skytrak"]["username"],
-                "password": config["scrapers"]["skytrak"]["password"]
+                "username": _SKYTRAK_GLOBAL[0],
+                "password": _SKYTRAK_GLOBAL[1]
             }
     
     @classmethod
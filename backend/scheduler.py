@@ -3,64 +3,149 @@ Scheduler for GolfStats ETL jobs.
 
 This module runs scheduled tasks for the GolfStats application, including
 daily ETL processes to fetch data from external sources.
+
+Run it through run.py (python run.py --scheduler) or from the project root
+with python -m backend.scheduler.
 """
 import os
-import sys
+import atexit
 import logging
-import time
+import functools
+import logging.handlers
+import multiprocessing
 from datetime import datetime
-from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.events import EVENT_SCHEDULER_STARTED
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
-# Add the project root directory to Python path if not already added
+# Project root directory, for the log file location
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
 
 from config.config import config
+from backend.database.db_connection import engine
 from backend.etl.daily_etl import run_daily_etl
+from backend.etl.outbox_worker import drain_outbox
+from backend.etl.aggregates import refresh_user_aggregates
+
+# Configure logging; records are only queued by the logging thread and
+# written to the console and log file by a background listener. The queue is
+# a multiprocessing one so ETL worker processes can log through it too.
+# force=True replaces the handler installed by modules imported above.
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(formatter)
+file_handler = logging.FileHandler(os.path.join(project_root, 'logs', 'scheduler.log'))
+file_handler.setFormatter(formatter)
 
-# Configure logging
+log_queue = multiprocessing.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+log_listener.start()
+# Flush queued records before multiprocessing closes the queue at exit
+atexit.register(log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(os.path.join(project_root, 'logs', 'scheduler.log'))
-    ]
+    format='%(message)s',  # Formatted by the listener's handlers
+    handlers=[logging.handlers.QueueHandler(log_queue)],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
-def create_scheduler() -> BackgroundScheduler:
+# Job schedules, read and parsed once at import
+DAILY_SCHEDULE = config["etl"]["schedule"]["daily_update"]
+WEEKLY_SCHEDULE = config["etl"]["schedule"]["weekly_report"]
+OUTBOX_INTERVAL_MINUTES = config["etl"]["outbox"]["interval_minutes"]
+DAILY_MISFIRE_GRACE_SECONDS = config["etl"]["schedule"]["misfire_grace_seconds"]
+
+DAILY_TRIGGER = CronTrigger.from_crontab(DAILY_SCHEDULE)
+WEEKLY_TRIGGER = CronTrigger.from_crontab(WEEKLY_SCHEDULE)
+OUTBOX_TRIGGER = IntervalTrigger(minutes=OUTBOX_INTERVAL_MINUTES)
+
+def _ensure_job(scheduler: BlockingScheduler, func, trigger, job_id: str, **options) -> None:
     """
-    Create and configure the scheduler.
+    Add a job unless the job store already has it.
     
-    Returns:
-        Configured BackgroundScheduler instance
+    A stored job keeps its next run time, so runs missed while the scheduler
+    was down are still caught up. Its options are refreshed, and it is only
+    rescheduled if the configured trigger has changed.
+    
+    Args:
+        scheduler: Running scheduler
+        func: Job function
+        trigger: Trigger from the configured schedule
+        job_id: Job ID in the job store
+        **options: Other add_job options, such as name and coalesce
+    """
+    job = scheduler.get_job(job_id)
+    if job is None:
+        scheduler.add_job(func, trigger, id=job_id, **options)
+        return
+    
+    scheduler.modify_job(job_id, func=func, **options)
+    if str(job.trigger) != str(trigger):
+        scheduler.reschedule_job(job_id, trigger=trigger)
+        logger.info(f"Rescheduled job '{job_id}' to {trigger}")
+
+def _add_jobs(scheduler: BlockingScheduler, event) -> None:
     """
-    scheduler = BackgroundScheduler()
+    Add the application's jobs once the scheduler has started.
     
-    # Add daily ETL job
-    daily_schedule = config["etl"]["schedule"]["daily_update"]
-    scheduler.add_job(
+    Jobs are only looked up in the job store after it has been started, so
+    they cannot be checked for before start().
+    
+    Args:
+        scheduler: Scheduler that has started
+        event: Scheduler started event
+    """
+    _ensure_job(
+        scheduler,
         daily_etl_job,
-        CronTrigger.from_crontab(daily_schedule),
-        id='daily_etl',
+        DAILY_TRIGGER,
+        'daily_etl',
         name='Daily ETL Process',
-        replace_existing=True
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=DAILY_MISFIRE_GRACE_SECONDS
     )
     
     # Add weekly report job (if needed in the future)
-    weekly_schedule = config["etl"]["schedule"]["weekly_report"]
-    scheduler.add_job(
+    _ensure_job(
+        scheduler,
         weekly_report_job,
-        CronTrigger.from_crontab(weekly_schedule),
-        id='weekly_report',
-        name='Weekly Report Generation',
-        replace_existing=True
+        WEEKLY_TRIGGER,
+        'weekly_report',
+        name='Weekly Report Generation'
     )
     
-    logger.info(f"Scheduler configured with jobs: daily ETL at '{daily_schedule}', weekly report at '{weekly_schedule}'")
+    # Add outbox job replicating queued ETL writes to Supabase
+    _ensure_job(
+        scheduler,
+        outbox_job,
+        OUTBOX_TRIGGER,
+        'etl_outbox',
+        name='ETL Outbox Replication',
+        max_instances=1,
+        coalesce=True
+    )
+    
+    logger.info(f"Scheduler configured with jobs: daily ETL at '{DAILY_SCHEDULE}', weekly report at '{WEEKLY_SCHEDULE}', "
+                f"outbox replication every {OUTBOX_INTERVAL_MINUTES} minutes")
+
+def create_scheduler() -> BlockingScheduler:
+    """
+    Create and configure the scheduler.
+    
+    Jobs are kept in the application database and added on start only if
+    missing, so next run times survive a scheduler restart; a daily run
+    missed while the scheduler was down starts late, once, if it is within
+    DAILY_MISFIRE_GRACE_SECONDS.
+    
+    Returns:
+        Configured BlockingScheduler instance
+    """
+    scheduler = BlockingScheduler(jobstores={"default": SQLAlchemyJobStore(engine=engine)})
+    scheduler.add_listener(functools.partial(_add_jobs, scheduler), EVENT_SCHEDULER_STARTED)
     return scheduler
 
 def daily_etl_job() -> None:
@@ -76,6 +161,31 @@ def daily_etl_job() -> None:
                    f"{results['skytrak_sessions']} SkyTrak sessions")
     except Exception as e:
         logger.error(f"Error in daily ETL job: {str(e)}")
+    
+    # Rebuild the dashboard aggregates from the newly loaded rounds
+    refresh_user_aggregates_job()
+
+def refresh_user_aggregates_job() -> None:
+    """
+    Rebuild the pre-computed user stats as a scheduled job.
+    """
+    try:
+        logger.info("Starting user stats aggregate refresh")
+        rows = refresh_user_aggregates()
+        logger.info(f"User stats aggregate refresh completed - {rows} rows")
+    except Exception as e:
+        logger.error(f"Error in user stats aggregate refresh: {str(e)}")
+
+def outbox_job() -> None:
+    """
+    Replicate queued ETL writes to Supabase as a scheduled job.
+    """
+    try:
+        results = drain_outbox()
+        if results['retried'] or results['failed']:
+            logger.warning(f"Outbox job left {results['retried']} entries to retry, {results['failed']} failed")
+    except Exception as e:
+        logger.error(f"Error in outbox job: {str(e)}")
 
 def weekly_report_job() -> None:
     """
@@ -90,7 +200,7 @@ def weekly_report_job() -> None:
 
 def run_scheduler() -> None:
     """
-    Run the scheduler indefinitely.
+    Run the scheduler indefinitely, blocking the calling thread.
     """
     scheduler = create_scheduler()
     
@@ -98,16 +208,13 @@ def run_scheduler() -> None:
         logger.info("Starting scheduler")
         scheduler.start()
         
-        # Keep the process alive
-        while True:
-            time.sleep(60)
-            
     except (KeyboardInterrupt, SystemExit):
         logger.info("Scheduler stopping due to keyboard interrupt or system exit")
     except Exception as e:
         logger.error(f"Scheduler error: {str(e)}")
     finally:
-        scheduler.shutdown()
+        if scheduler.running:
+            scheduler.shutdown()
         logger.info("Scheduler shut down")
 
 if __name__ == "__main__":
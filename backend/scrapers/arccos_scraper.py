@@ -1,17 +1,30 @@
 """
 Arccos Golf Data Scraper for GolfStats application.
 
-This module provides functionality to scrape golf data from Arccos Golf website
-using Selenium to automate browser interactions.
+This module provides functionality to retrieve golf data from Arccos Golf,
+reading the JSON APIs behind the Arccos dashboard and falling back to Selenium
+browser automation when the API cannot be used.
 """
 import os
 import sys
 import time
+import logging
 import datetime
 import json
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import string
+import queue
+import atexit
+import functools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Callable
 
+import requests
+import lxml.etree
+import lxml.html
+from sqlalchemy import select, insert, or_
+from sqlalchemy.orm import Session
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -35,11 +48,12 @@ if project_root not in sys.path:
 
 from config.config import config
 from backend.database.db_connection import get_db
-from backend.models.golf_data import GolfRound, GolfHole, GolfShot, RoundStats
+from backend.models.golf_data import GolfRound, GolfHole, GolfShot, RoundStats, SHOT_LOCATION_ALIASES
 from backend.scrapers.common import (
     setup_logger, retry, log_exceptions, CaptchaDetector,
     safe_wait_for_element, take_error_screenshot, 
-    save_json_data, generate_timestamp_filename
+    save_json_data, load_json_data, generate_timestamp_filename,
+    ensure_data_directory, deadline_passed, time_left
 )
 
 # Set up logger
@@ -50,36 +64,435 @@ logger = setup_logger(
     log_file=os.path.join(logs_dir, 'arccos_scraper.log')
 )
 
+# Browser user agent, also sent with API requests
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36"
+
+# Timeout for Arccos API requests in seconds
+API_TIMEOUT = 30
+
+# Elements that are only shown to a logged in user, matched in one query
+DASHBOARD_XPATH = " | ".join((
+    "//div[contains(@class, 'dashboard')]",
+    "//div[contains(@class, 'home')]",
+    "//a[contains(text(), 'Dashboard')]",
+    "//h1[contains(text(), 'Dashboard')]",
+    "//div[contains(@class, 'user-profile')]",
+    "//div[contains(@class, 'rounds')]",
+    "//a[contains(text(), 'Rounds')]"
+))
+
+# Login form fields; each matches any of its alternatives in one query
+EMAIL_SELECTOR = "input[type='email'], #email"
+PASSWORD_SELECTOR = "input[type='password'], #password, input[name='password']"
+LOGIN_BUTTON_XPATH = " | ".join((
+    "//button[@type='submit']",
+    "//button[contains(concat(' ', normalize-space(@class), ' '), ' login-button ')]",
+    "//button[contains(text(), 'Sign In')]",
+    "//button[contains(text(), 'Log In')]",
+    "//input[@type='submit']"
+))
+
+# Round cards on the rounds page and their fields, tried in order
+ROUND_CARD_XPATHS = tuple(lxml.etree.XPath(xpath) for xpath in (
+    "//div[contains(@class, 'round-card')]",
+    "//div[contains(@class, 'round-item')]",
+    "//div[contains(@class, 'round-container')]",
+    "//div[contains(@class, 'round-entry')]",
+    "//div[contains(@class, 'round')][@data-id]",
+    "//article[contains(@class, 'round')]"
+))
+ROUND_DATE_XPATHS = tuple(lxml.etree.XPath(xpath) for xpath in (
+    ".//div[contains(@class, 'round-date')]",
+    ".//span[contains(@class, 'date')]",
+    ".//time",
+    ".//div[contains(@class, 'date')]",
+    ".//span[contains(text(), '/') or contains(text(), '-')]"  # Common date format indicators
+))
+ROUND_COURSE_XPATHS = tuple(lxml.etree.XPath(xpath) for xpath in (
+    ".//div[contains(@class, 'course-name')]",
+    ".//span[contains(@class, 'course')]",
+    ".//div[contains(@class, 'course')]",
+    ".//h3",
+    ".//h4"
+))
+ROUND_SCORE_XPATHS = tuple(lxml.etree.XPath(xpath) for xpath in (
+    ".//div[contains(@class, 'score')]",
+    ".//span[contains(@class, 'score')]",
+    ".//div[contains(text(), '+') or contains(text(), '-') or contains(text(), 'E')]",  # Look for +/- scores or Even
+    ".//span[contains(text(), '+') or contains(text(), '-') or contains(text(), 'E')]"
+))
+
+# Translation tables keeping only the digits (and decimal point) of the
+# numbers shown on the dashboard, cheaper than a regex for short labels
+KEEP_DIGITS = str.maketrans('', '', ''.join(chr(i) for i in range(256) if chr(i) not in string.digits))
+KEEP_NUMBER = str.maketrans('', '', ''.join(chr(i) for i in range(256) if chr(i) not in string.digits + '.'))
+
+# Patterns for reading the numbers shown on the dashboard
+FRACTION_RE = re.compile(r'(\d+)/(\d+)')
+NUMBER_RE = re.compile(r'(\d+)')
+
+# Hole cards on the round page
+HOLE_CARD_XPATH = "//div[contains(@class, 'hole-card')]"
+
+# Elements shown after clicking a hole card or the stats tab
+SHOT_ITEM_XPATH = "//div[contains(@class, 'shot-item')]"
+CLOSE_BUTTON_XPATH = "//button[contains(@class, 'close-button')]"
+STATS_XPATH = "//div[contains(@class, 'fairways-hit')]"
+
+# Class, club and distance of every shot item, read in one script call
+SHOT_ITEMS_SCRIPT = """
+return Array.from(document.querySelectorAll("div[class*='shot-item']")).map(shot => ({
+    cls: shot.className,
+    club: shot.querySelector("div[class*='club']")?.innerText.trim() ?? null,
+    dist: shot.querySelector("div[class*='distance']")?.innerText.trim() ?? null
+}));
+"""
+
+# Shot item classes giving the start and end location, in priority order
+SHOT_FROM_CLASSES = {
+    "tee-shot": "tee",
+    "fairway-shot": "fairway",
+    "rough-shot": "rough",
+    "sand-shot": "sand",
+    "green-shot": "green"
+}
+SHOT_TO_CLASSES = {
+    "to-fairway": "fairway",
+    "to-rough": "rough",
+    "to-sand": "sand",
+    "to-green": "green",
+    "to-hole": "hole"
+}
+
+# Longest wait for a panel to open or close after a click, in seconds
+SHORT_WAIT_SECONDS = 3
+
+# Longest wait for a page or form to load, in seconds
+LONG_WAIT_SECONDS = 15
+
+# Longest wait for driver.get() to return, in seconds
+PAGE_LOAD_TIMEOUT_SECONDS = 15
+
+# Headless browsers kept running in each process for the next scraper
+MAX_IDLE_DRIVERS = 4
+_idle_drivers = queue.LifoQueue()
+
+# Content the scraper never reads, so the browser does not download it
+BLOCKED_CONTENT_SETTINGS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2
+}
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.woff", "*.woff2", "*.ttf", "*.css",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics*", "*googletagmanager*", "*segment.io*", "*hotjar*"
+]
+
+def _short_wait(driver: webdriver.Chrome) -> WebDriverWait:
+    """
+    Create a wait that polls quickly for the result of a click.
+    """
+    return WebDriverWait(driver, SHORT_WAIT_SECONDS, poll_frequency=0.1)
+
+def _element_text(element: lxml.html.HtmlElement) -> str:
+    """
+    Get the text of a parsed element with whitespace collapsed, like the
+    text Selenium reports for it.
+    """
+    return " ".join(element.text_content().split())
+
+def _first_text(element: lxml.html.HtmlElement, xpaths: Tuple[lxml.etree.XPath, ...]) -> Optional[str]:
+    """
+    Get the first non-empty text found by a list of XPaths tried in order.
+    
+    Args:
+        element: Parsed page or element to search
+        xpaths: Compiled XPaths, most specific first
+        
+    Returns:
+        Text of the first matching element with text, or None
+    """
+    for xpath in xpaths:
+        for match in xpath(element):
+            text = _element_text(match)
+            if text:
+                return text
+    return None
+
+def _column_values(obj: Any) -> Dict[str, Any]:
+    """
+    Get the column values of a transient model object for a bulk insert,
+    so every row of a table has the same keys and is sent in one batch.
+    """
+    return {column.key: getattr(obj, column.key) for column in obj.__table__.columns if not column.primary_key}
+
+def _per_hole(total: int, holes: int) -> float:
+    """
+    Average a round total over its holes to one decimal, rounding halves up
+    with integer arithmetic instead of float rounding.
+    """
+    return (total * 10 + holes // 2) // holes / 10
+
+@functools.lru_cache(maxsize=2048)
+def _parse_round_date(date_str: str) -> datetime.datetime:
+    """
+    Parse a dashboard date like "Jun 01, 2023".
+    
+    Results are cached, as strptime is slow and the rounds of a batch
+    often share dates.
+    
+    Raises:
+        ValueError: If the date is not in the dashboard format
+    """
+    return datetime.datetime.strptime(date_str, "%b %d, %Y")
+
+def _xpath_text(element: lxml.html.HtmlElement, xpath: str) -> str:
+    """
+    Get the text of the first element matching an XPath in a parsed page.
+    
+    Args:
+        element: Parsed page or element to search
+        xpath: XPath of the element to read
+        
+    Returns:
+        Text of the matching element
+        
+    Raises:
+        NoSuchElementException: If no element matches
+    """
+    matches = element.xpath(xpath)
+    if not matches:
+        raise NoSuchElementException(f"Unable to locate element: {xpath}")
+    return _element_text(matches[0])
+
+@functools.lru_cache(maxsize=None)
+def _chromedriver_path() -> str:
+    """
+    Install or locate the ChromeDriver binary once per process.
+    """
+    return ChromeDriverManager().install()
+
+def _take_idle_driver() -> Optional[webdriver.Chrome]:
+    """
+    Take a running browser left by a previous scraper, if there is one.
+    """
+    try:
+        return _idle_drivers.get_nowait()
+    except queue.Empty:
+        return None
+
+@atexit.register
+def _quit_idle_drivers() -> None:
+    """
+    Quit the idle browsers when the process exits.
+    """
+    while True:
+        driver = _take_idle_driver()
+        if driver is None:
+            break
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing idle WebDriver: {str(e)}")
+
+def _drain_performance_log(driver: webdriver.Chrome) -> None:
+    """
+    Discard the network events a browser has recorded so far.
+    
+    Chrome keeps performance entries until they are read, so browsers whose
+    log is never read would otherwise grow with every page they load.
+    
+    Args:
+        driver: WebDriver instance to drain
+    """
+    try:
+        driver.get_log("performance")
+    except WebDriverException as e:
+        logger.debug(f"Could not drain performance log: {str(e)}")
+
+class BrowserPool:
+    """
+    Logged in Chrome sessions shared by worker threads.
+    """
+    
+    def __init__(self, drivers: List[webdriver.Chrome]):
+        """
+        Initialize BrowserPool with ready drivers.
+        
+        Args:
+            drivers: WebDriver instances owned by the pool
+        """
+        self.size = len(drivers)
+        self._drivers = queue.Queue()
+        for driver in drivers:
+            self._drivers.put(driver)
+    
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        """
+        Borrow a driver, waiting until one is free.
+        
+        Yields:
+            WebDriver instance, returned to the pool on exit
+        """
+        driver = self._drivers.get()
+        try:
+            yield driver
+        finally:
+            self._drivers.put(driver)
+    
+    def close(self, release: Callable[[webdriver.Chrome], None]) -> None:
+        """
+        Hand every driver in the pool back.
+        
+        Args:
+            release: Function quitting or recycling a driver
+        """
+        while not self._drivers.empty():
+            release(self._drivers.get_nowait())
+
 class ArccosScraper:
     """
     Scraper for retrieving golf data from Arccos Golf website.
     """
     
-    def __init__(self, user_id: int, headless: bool = True):
+    def __init__(self, user_id: int, headless: bool = True, deadline: Optional[float] = None):
         """
         Initialize ArccosScraper with user credentials.
         
         Args:
             user_id: ID of the user in the database
             headless: Whether to run the browser in headless mode
+            deadline: time.monotonic() value after which to stop scraping
         """
         self.user_id = user_id
         self.email = config["scrapers"]["arccos"]["email"]
         self.password = config["scrapers"]["arccos"]["password"]
         self.base_url = config["scrapers"]["arccos"]["url"]
+        self.api_url = config["scrapers"]["arccos"]["api_url"]
+        self.auth_url = config["scrapers"]["arccos"]["auth_url"]
+        self.use_api = config["scrapers"]["arccos"]["use_api"]
+        self.hole_workers = config["scrapers"]["arccos"]["hole_workers"]
+        self.round_workers = config["scrapers"]["arccos"]["round_workers"]
+        self.round_cache_days = config["scrapers"]["arccos"]["round_cache_days"]
         self.headless = headless
+        self.deadline = deadline
         self.driver = None
         self.wait = None
+        self.wait_short = None
+        self.wait_long = None
+        self.pool = None
+        
+        # HTTP session for the Arccos API, reused for every request
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        self.api_user_id = None
         
         # Directory for error screenshots
         self.screenshot_dir = os.path.join(project_root, 'data', 'screenshots', 'arccos')
         os.makedirs(self.screenshot_dir, exist_ok=True)
         
+        # Browser cookies saved after a successful login, reused by later runs
+        self.sessions_dir = os.path.join(project_root, 'data', 'sessions')
+        self.cookie_file = f"arccos_{user_id}.json"
+        
+        # Round details saved by previous runs, reused while they are fresh
+        self.rounds_dir = os.path.join(project_root, 'data', 'arccos', 'rounds')
+        
         # Validate credentials
         if not self.email or not self.password:
             logger.error("Arccos credentials not configured")
             raise ValueError("Arccos credentials missing in configuration")
     
+    def _create_driver(self) -> webdriver.Chrome:
+        """
+        Start a Chrome WebDriver with the scraper's options.
+        
+        Returns:
+            WebDriver instance
+        """
+        chrome_options = Options()
+        
+        if self.headless:
+            chrome_options.add_argument("--headless")
+        
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        
+        # Set user agent to avoid detection
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+        
+        # Disable automation flags
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Skip images, stylesheets and fonts
+        chrome_options.add_experimental_option("prefs", BLOCKED_CONTENT_SETTINGS)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        
+        # Return from get() once the HTML is parsed instead of waiting for
+        # every subresource; the elements we need are waited for explicitly
+        chrome_options.page_load_strategy = "eager"
+        
+        # Record network events, so the round JSON loaded by the dashboard
+        # can be read back instead of clicking through the holes
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
+        # Set up driver
+        service = Service(_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Block remaining static assets and analytics requests
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        
+        return driver
+    
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """
+        Reuse an idle headless browser, or start a new one.
+        
+        Returns:
+            WebDriver instance without cookies or site data
+        """
+        driver = _take_idle_driver() if self.headless else None
+        driver = driver or self._create_driver()
+        
+        # Set a reasonable page load timeout, capped at this scraper's
+        # deadline; an idle browser still has the previous scraper's
+        driver.set_page_load_timeout(time_left(self.deadline, PAGE_LOAD_TIMEOUT_SECONDS))
+        
+        return driver
+    
+    def _release_driver(self, driver: webdriver.Chrome) -> None:
+        """
+        Keep a headless browser for the next scraper, or quit it.
+        
+        The browser's cookies and Arccos site data are cleared first, so the
+        next user does not inherit this user's session.
+        
+        Args:
+            driver: WebDriver instance to release
+        """
+        if self.headless and _idle_drivers.qsize() < MAX_IDLE_DRIVERS:
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": self.base_url, "storageTypes": "all"})
+                driver.get("about:blank")
+                _drain_performance_log(driver)
+                _idle_drivers.put(driver)
+                return
+            except WebDriverException as e:
+                logger.warning(f"Could not reset WebDriver for reuse: {str(e)}")
+        
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing WebDriver: {str(e)}")
+    
     @log_exceptions()
     def setup_driver(self) -> None:
         """
@@ -87,37 +500,128 @@ class ArccosScraper:
         """
         try:
             logger.info("Setting up Chrome WebDriver")
-            chrome_options = Options()
+            self.driver = self._acquire_driver()
             
-            if self.headless:
-                chrome_options.add_argument("--headless")
+            # Configure wait timeouts, built once and reused by every lookup.
+            # Implicit waits stay off so they do not stack with these.
+            self.driver.implicitly_wait(0)
+            self.wait = WebDriverWait(self.driver, 20)  # 20 seconds timeout
+            self.wait_short = _short_wait(self.driver)
+            self.wait_long = WebDriverWait(self.driver, LONG_WAIT_SECONDS, poll_frequency=0.25)
             
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
+            logger.info("Chrome WebDriver setup complete")
+        except Exception as e:
+            logger.error(f"Failed to set up WebDriver: {str(e)}")
+            raise
+    
+    def setup_pool(self) -> None:
+        """
+        Start the browser pool used to read holes in parallel.
+        
+        Each pooled browser is logged in with the cookies of the main driver,
+        so setup_driver and a login must have succeeded first. Nothing is
+        started when hole_workers is below 2.
+        """
+        if self.hole_workers < 2:
+            return
+        
+        logger.info(f"Starting {self.hole_workers} pooled Chrome WebDrivers")
+        cookies = self.driver.get_cookies()
+        drivers = []
+        try:
+            for _ in range(self.hole_workers):
+                driver = self._acquire_driver()
+                drivers.append(driver)
+                
+                # Cookies can only be added for the domain that is loaded
+                driver.get(self.base_url)
+                for cookie in cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                    except WebDriverException as e:
+                        logger.debug(f"Skipping cookie {cookie.get('name')}: {str(e)}")
             
-            # Set user agent to avoid detection
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/94.0.4606.81 Safari/537.36")
+            self.pool = BrowserPool(drivers)
             
-            # Disable automation flags
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
+        except Exception as e:
+            logger.warning(f"Could not start browser pool, reading holes serially: {str(e)}")
+            for driver in drivers:
+                self._release_driver(driver)
+    
+    def _dashboard_loaded(self, wait: WebDriverWait) -> bool:
+        """
+        Check whether the current page shows the logged in dashboard.
+        
+        Args:
+            wait: Wait deciding how long to look for a dashboard element
             
-            # Set up driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        Returns:
+            bool: True if a dashboard element was found
+        """
+        element = safe_wait_for_element(
+            self.driver, By.XPATH, DASHBOARD_XPATH,
+            condition=EC.presence_of_element_located, wait=wait
+        )
+        return element is not None
+    
+    def save_cookies(self) -> None:
+        """
+        Save the browser cookies so later runs can skip the login form.
+        
+        The file holds a live session, so only the owner may read it.
+        """
+        try:
+            os.makedirs(self.sessions_dir, mode=0o700, exist_ok=True)
+            fd = os.open(os.path.join(self.sessions_dir, self.cookie_file),
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # Also restrict files saved before the mode was set on creation
+            os.fchmod(fd, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.driver.get_cookies(), f)
+        except Exception as e:
+            logger.warning(f"Could not save Arccos cookies: {str(e)}")
+    
+    def restore_cookies(self) -> bool:
+        """
+        Restore the browser session saved by a previous login.
+        
+        The saved cookies are discarded if they no longer give access to the
+        dashboard, so the caller can log in again.
+        
+        Returns:
+            bool: True if the restored session is logged in, False otherwise
+        """
+        if not os.path.exists(os.path.join(self.sessions_dir, self.cookie_file)):
+            return False
+        
+        cookies = load_json_data(self.cookie_file, self.sessions_dir)
+        if not cookies:
+            return False
+        
+        try:
+            logger.info("Restoring saved Arccos session")
             
-            # Set a reasonable page load timeout
-            self.driver.set_page_load_timeout(30)
+            # Cookies can only be added for the domain that is loaded
+            self.driver.get(self.base_url)
+            for cookie in cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException as e:
+                    logger.debug(f"Skipping saved cookie {cookie.get('name')}: {str(e)}")
             
-            # Configure wait timeouts
-            self.wait = WebDriverWait(self.driver, 20)  # 20 seconds timeout
+            self.driver.get(f"{self.base_url}/rounds")
+            if "/login" not in self.driver.current_url and self._dashboard_loaded(self.wait_short):
+                logger.info("Restored saved Arccos session")
+                return True
             
-            logger.info("Chrome WebDriver setup complete")
-        except Exception as e:
-            logger.error(f"Failed to set up WebDriver: {str(e)}")
-            raise
+        except WebDriverException as e:
+            logger.warning(f"Could not restore saved Arccos session: {str(e)}")
+        
+        logger.info("Saved Arccos session expired, logging in again")
+        self.driver.delete_all_cookies()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(self.sessions_dir, self.cookie_file))
+        return False
     
     @retry(max_attempts=3, delay=2, backoff=2, 
            exceptions=(TimeoutException, ElementClickInterceptedException))
@@ -135,65 +639,37 @@ class ArccosScraper:
             # Arccos login URL is actually at dashboard.arccosgolf.com/login
             self.driver.get("https://dashboard.arccosgolf.com/login")
             
-            # Check for any CAPTCHA
-            if CaptchaDetector.is_captcha_present(self.driver):
+            # Check for any CAPTCHA, only scanning the page when the URL or title hints at one
+            if CaptchaDetector.is_captcha_likely(self.driver) and CaptchaDetector.is_captcha_present(self.driver):
                 CaptchaDetector.handle_captcha(self.driver, self.driver.current_url)
             
             # Wait for login form to load - Arccos uses both email and username fields
             email_field = safe_wait_for_element(
-                self.driver, By.CSS_SELECTOR, "input[type='email']", timeout=15,
-                condition=EC.presence_of_element_located
+                self.driver, By.CSS_SELECTOR, EMAIL_SELECTOR,
+                condition=EC.presence_of_element_located, wait=self.wait_long
             )
             
             if not email_field:
-                # Try alternate selector
-                email_field = safe_wait_for_element(
-                    self.driver, By.ID, "email", timeout=5,
-                    condition=EC.presence_of_element_located
-                )
-            
-            if not email_field:
+                # A CAPTCHA page without telltale URL or title would hide the form
+                if CaptchaDetector.is_captcha_present(self.driver):
+                    CaptchaDetector.handle_captcha(self.driver, self.driver.current_url)
+                
                 logger.error("Login page did not load properly - email field not found")
                 take_error_screenshot(self.driver, "login_form_missing", self.screenshot_dir)
                 return False
                 
-            # Find password field - try multiple selectors
-            password_field = None
-            for selector in ["input[type='password']", "#password", "input[name='password']"]:
-                try:
-                    password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if password_field:
-                        break
-                except NoSuchElementException:
-                    continue
+            # Find password field
+            password_fields = self.driver.find_elements(By.CSS_SELECTOR, PASSWORD_SELECTOR)
+            password_field = password_fields[0] if password_fields else None
                     
             if not password_field:
                 logger.error("Password field not found")
                 take_error_screenshot(self.driver, "password_field_missing", self.screenshot_dir)
                 return False
                 
-            # Find login button - try multiple selectors
-            login_button = None
-            button_selectors = [
-                "button[type='submit']", 
-                "button.login-button",
-                "button:contains('Sign In')",
-                "button:contains('Log In')",
-                "input[type='submit']"
-            ]
-            
-            for selector in button_selectors:
-                try:
-                    if "contains" in selector:
-                        # Use XPath for text contains
-                        xpath = selector.replace("button:contains('", "//button[contains(text(), '").replace("')", "')]")
-                        login_button = self.driver.find_element(By.XPATH, xpath)
-                    else:
-                        login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if login_button:
-                        break
-                except NoSuchElementException:
-                    continue
+            # Find login button
+            login_buttons = self.driver.find_elements(By.XPATH, LOGIN_BUTTON_XPATH)
+            login_button = login_buttons[0] if login_buttons else None
             
             if not login_button:
                 logger.error("Login button not found")
@@ -216,30 +692,7 @@ class ArccosScraper:
                 self.driver.execute_script("arguments[0].click();", login_button)
             
             # Wait for dashboard elements to confirm successful login
-            # Arccos dashboard usually has these elements
-            dashboard_selectors = [
-                "//div[contains(@class, 'dashboard')]",
-                "//div[contains(@class, 'home')]",
-                "//a[contains(text(), 'Dashboard')]",
-                "//h1[contains(text(), 'Dashboard')]",
-                "//div[contains(@class, 'user-profile')]",
-                "//div[contains(@class, 'rounds')]",
-                "//a[contains(text(), 'Rounds')]"
-            ]
-            
-            # Check for any successful login indicator
-            dashboard_loaded = False
-            for selector in dashboard_selectors:
-                element = safe_wait_for_element(
-                    self.driver, By.XPATH, selector,
-                    timeout=5, condition=EC.presence_of_element_located
-                )
-                if element:
-                    dashboard_loaded = True
-                    logger.debug(f"Found dashboard element with selector: {selector}")
-                    break
-            
-            if not dashboard_loaded:
+            if not self._dashboard_loaded(self.wait_long):
                 # Check for error messages
                 error_msgs = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'error')] | //p[contains(@class, 'error')] | //span[contains(@class, 'error-message')]")
                 if error_msgs:
@@ -251,6 +704,7 @@ class ArccosScraper:
                 return False
             
             logger.info("Successfully logged in to Arccos Golf")
+            self.save_cookies()
             return True
             
         except TimeoutException as e:
@@ -288,8 +742,8 @@ class ArccosScraper:
             # Navigate to rounds page (real Arccos URL)
             self.driver.get("https://dashboard.arccosgolf.com/rounds")
             
-            # Check for CAPTCHA
-            if CaptchaDetector.is_captcha_present(self.driver):
+            # Check for CAPTCHA, only scanning the page when the URL or title hints at one
+            if CaptchaDetector.is_captcha_likely(self.driver) and CaptchaDetector.is_captcha_present(self.driver):
                 CaptchaDetector.handle_captcha(self.driver, self.driver.current_url)
             
             # Wait for rounds list to load safely
@@ -297,158 +751,122 @@ class ArccosScraper:
             rounds_container = safe_wait_for_element(
                 self.driver, By.XPATH, 
                 "//div[contains(@class, 'rounds-list') or contains(@class, 'rounds-container')]",
-                timeout=15, condition=EC.presence_of_element_located
+                condition=EC.presence_of_element_located, wait=self.wait_long
             )
             
             if not rounds_container:
                 logger.warning("Rounds container not found, looking for individual round elements")
             
+            # Wait until round cards are rendered
+            try:
+                self.wait_short.until(lambda driver: driver.find_elements(
+                    By.XPATH, " | ".join(selector.path for selector in ROUND_CARD_XPATHS)
+                ))
+            except TimeoutException:
+                logger.warning("No round cards rendered yet")
+            
+            # Use the round list JSON the page loaded when it was captured
+            captured = self._captured_json(
+                "/rounds", lambda data: isinstance(data, list) or (isinstance(data, dict) and "rounds" in data)
+            )
+            if captured:
+                rounds = self._rounds_from_api(captured, limit)
+                if rounds:
+                    logger.info(f"Successfully extracted {len(rounds)} rounds from the page's network data")
+                    return rounds
+            
+            # Parse the page once instead of querying the browser per element
+            page = lxml.html.fromstring(self.driver.page_source)
+            
             # Try several different selectors for round cards
             round_elements = None
-            round_selectors = [
-                "//div[contains(@class, 'round-card')]",
-                "//div[contains(@class, 'round-item')]",
-                "//div[contains(@class, 'round-container')]",
-                "//div[contains(@class, 'round-entry')]",
-                "//div[contains(@class, 'round')][@data-id]",
-                "//article[contains(@class, 'round')]"
-            ]
-            
-            for selector in round_selectors:
+            for selector in ROUND_CARD_XPATHS:
                 try:
-                    elements = self.driver.find_elements(By.XPATH, selector)
+                    elements = selector(page)
                     if elements and len(elements) > 0:
                         round_elements = elements
-                        logger.info(f"Found {len(elements)} rounds using selector: {selector}")
+                        logger.info(f"Found {len(elements)} rounds using selector: {selector.path}")
                         break
                 except Exception:
                     continue
             
             if not round_elements:
+                # A CAPTCHA page without telltale URL or title would hide the rounds
+                if CaptchaDetector.is_captcha_present(self.driver):
+                    CaptchaDetector.handle_captcha(self.driver, self.driver.current_url)
+                
                 logger.error("Could not find any round elements on the page")
                 take_error_screenshot(self.driver, "no_rounds_found", self.screenshot_dir)
                 return []
             
-            # Add a short pause to ensure all elements are properly loaded
-            time.sleep(1)
+            # Only build the per-round debug messages when they are logged
+            log_rounds = logger.isEnabledFor(logging.DEBUG)
             
-            # Process round elements (limited to specified limit)
-            for idx, element in enumerate(round_elements[:limit]):
-                try:
-                    # Extract round details (try multiple possible selectors)
-                    round_info = {}
-                    
-                    # Try to extract round ID
-                    round_id = None
-                    for attr in ['data-round-id', 'data-id', 'id']:
-                        try:
-                            round_id = element.get_attribute(attr)
-                            if round_id and not round_id.isspace():
-                                break
-                        except Exception:
-                            pass
-                    
-                    if not round_id:
-                        # Try to extract from URL in an anchor tag
-                        try:
-                            anchor = element.find_element(By.TAG_NAME, "a")
-                            href = anchor.get_attribute("href")
-                            if href and '/rounds/' in href:
-                                round_id = href.split('/rounds/')[1].split('/')[0].split('?')[0]
-                        except Exception:
-                            pass
-                    
-                    if not round_id:
-                        logger.warning(f"Could not extract round ID for element {idx+1}")
+            # Save each round to NDJSON as soon as it is extracted, for debugging/recovery
+            rounds_path = os.path.join(
+                ensure_data_directory(os.path.join(project_root, 'data', 'arccos')),
+                generate_timestamp_filename("arccos_rounds", "ndjson")
+            )
+            with open(rounds_path, 'w') as rounds_file:
+                # Process round elements (limited to specified limit)
+                for idx, element in enumerate(round_elements[:limit]):
+                    try:
+                        # Extract round details (try multiple possible selectors)
+                        round_info = {}
+                        
+                        # Try to extract round ID
+                        round_id = None
+                        for attr in ['data-round-id', 'data-id', 'id']:
+                            try:
+                                round_id = element.get(attr)
+                                if round_id and not round_id.isspace():
+                                    break
+                            except Exception:
+                                pass
+                        
+                        if not round_id:
+                            # Try to extract from URL in an anchor tag
+                            try:
+                                href = element.xpath(".//a/@href")[0]
+                                if href and '/rounds/' in href:
+                                    round_id = href.split('/rounds/')[1].split('/')[0].split('?')[0]
+                            except Exception:
+                                pass
+                        
+                        if not round_id:
+                            logger.warning(f"Could not extract round ID for element {idx+1}")
+                            continue
+                        
+                        round_info["id"] = round_id
+                        round_info["url"] = f"https://dashboard.arccosgolf.com/rounds/{round_id}"
+                        
+                        # Try to extract date using multiple selectors
+                        round_info["date"] = _first_text(element, ROUND_DATE_XPATHS) or "Unknown date"
+                        
+                        # Try to extract course name using multiple selectors
+                        round_info["course"] = _first_text(element, ROUND_COURSE_XPATHS) or f"Round {round_id}"
+                        
+                        # Try to extract score using multiple selectors
+                        round_info["score"] = _first_text(element, ROUND_SCORE_XPATHS) or "N/A"
+                        
+                        if log_rounds:
+                            logger.debug(f"Extracted round: ID={round_info['id']}, Course={round_info['course']}, Date={round_info['date']}")
+                        rounds.append(round_info)
+                        rounds_file.write(json.dumps(round_info) + "\n")
+                        
+                    except NoSuchElementException as e:
+                        logger.warning(f"Error extracting data for round {idx+1}: {str(e)}")
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Unexpected error processing round {idx+1}: {str(e)}")
                         continue
-                    
-                    round_info["id"] = round_id
-                    round_info["url"] = f"https://dashboard.arccosgolf.com/rounds/{round_id}"
-                    
-                    # Try to extract date using multiple selectors
-                    date_text = None
-                    date_selectors = [
-                        ".//div[contains(@class, 'round-date')]",
-                        ".//span[contains(@class, 'date')]",
-                        ".//time",
-                        ".//div[contains(@class, 'date')]",
-                        ".//span[contains(text(), '/') or contains(text(), '-')]" # Common date format indicators
-                    ]
-                    
-                    for date_selector in date_selectors:
-                        try:
-                            elements = element.find_elements(By.XPATH, date_selector)
-                            if elements:
-                                date_text = elements[0].text
-                                break
-                        except Exception:
-                            pass
-                    
-                    round_info["date"] = date_text or "Unknown date"
-                    
-                    # Try to extract course name using multiple selectors
-                    course_text = None
-                    course_selectors = [
-                        ".//div[contains(@class, 'course-name')]",
-                        ".//span[contains(@class, 'course')]",
-                        ".//div[contains(@class, 'course')]",
-                        ".//h3",
-                        ".//h4"
-                    ]
-                    
-                    for course_selector in course_selectors:
-                        try:
-                            elements = element.find_elements(By.XPATH, course_selector)
-                            if elements:
-                                course_text = elements[0].text
-                                break
-                        except Exception:
-                            pass
-                    
-                    round_info["course"] = course_text or f"Round {round_id}"
-                    
-                    # Try to extract score using multiple selectors
-                    score_text = None
-                    score_selectors = [
-                        ".//div[contains(@class, 'score')]",
-                        ".//span[contains(@class, 'score')]",
-                        ".//div[contains(text(), '+') or contains(text(), '-') or contains(text(), 'E')]", # Look for +/- scores or Even
-                        ".//span[contains(text(), '+') or contains(text(), '-') or contains(text(), 'E')]"
-                    ]
-                    
-                    for score_selector in score_selectors:
-                        try:
-                            elements = element.find_elements(By.XPATH, score_selector)
-                            if elements:
-                                score_text = elements[0].text
-                                break
-                        except Exception:
-                            pass
-                    
-                    round_info["score"] = score_text or "N/A"
-                    
-                    logger.debug(f"Extracted round: ID={round_info['id']}, Course={round_info['course']}, Date={round_info['date']}")
-                    rounds.append(round_info)
-                    
-                except NoSuchElementException as e:
-                    logger.warning(f"Error extracting data for round {idx+1}: {str(e)}")
-                    continue
-                except Exception as e:
-                    logger.warning(f"Unexpected error processing round {idx+1}: {str(e)}")
-                    continue
             
             if not rounds:
                 logger.warning("No rounds could be extracted from the page")
                 take_error_screenshot(self.driver, "rounds_extraction_failed", self.screenshot_dir)
+                os.remove(rounds_path)
             else:
-                logger.info(f"Successfully extracted {len(rounds)} rounds")
-                
-                # Save rounds to JSON for debugging/recovery
-                save_json_data(
-                    rounds,
-                    generate_timestamp_filename("arccos_rounds", "json"),
-                    os.path.join(project_root, 'data', 'arccos')
-                )
+                logger.info(f"Successfully extracted {len(rounds)} rounds to {rounds_path}")
             
             return rounds
             
@@ -462,6 +880,206 @@ class ArccosScraper:
             take_error_screenshot(self.driver, "rounds_list_error", self.screenshot_dir)
             return []
     
+    def _scrape_hole(self, driver: webdriver.Chrome, hole_element: Any,
+                     hole_idx: int) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Extract the data and shots of one hole card on a round page.
+        
+        Args:
+            driver: WebDriver showing the round page
+            hole_element: Hole card element
+            hole_idx: Index of the hole card, for logging
+            
+        Returns:
+            Tuple of (hole data dictionary, list of shot dictionaries), or None
+            if the hole could not be read
+        """
+        try:
+            # Parse the card once instead of querying the browser per element
+            card = lxml.html.fromstring(hole_element.get_attribute("outerHTML"))
+            
+            hole_num = _xpath_text(card, ".//div[contains(@class, 'hole-number')]")
+            hole_par = _xpath_text(card, ".//div[contains(@class, 'hole-par')]")
+            hole_score = _xpath_text(card, ".//div[contains(@class, 'hole-score')]")
+            hole_distance = _xpath_text(card, ".//div[contains(@class, 'hole-distance')]")
+            
+            # Clean data
+            hole_num_int = int(hole_num.translate(KEEP_DIGITS))
+            hole_par_int = int(hole_par.translate(KEEP_DIGITS))
+            hole_score_int = int(hole_score.translate(KEEP_DIGITS))
+            hole_distance_int = int(hole_distance.translate(KEEP_DIGITS))
+            
+            # Check fairway hit and GIR indicators
+            fairway_hit = "fairway-hit" in card.get("class", "")
+            gir = "gir" in card.get("class", "")
+            
+            hole_data = {
+                "hole_number": hole_num_int,
+                "par": hole_par_int,
+                "score": hole_score_int,
+                "distance_yards": hole_distance_int,
+                "fairway_hit": fairway_hit,
+                "green_in_regulation": gir,
+                "putts": None
+            }
+            
+            # Get putts for this hole, when they are shown
+            with contextlib.suppress(NoSuchElementException, ValueError):
+                putts = _xpath_text(card, ".//div[contains(@class, 'putts')]")
+                hole_data["putts"] = int(putts.translate(KEEP_DIGITS))
+            
+            shots = []
+            
+            # Pooled browsers get their own wait
+            wait = self.wait_short if driver is self.driver else _short_wait(driver)
+            
+            # Click on hole to get shot data
+            hole_element.click()
+            
+            # Wait for shot data to load
+            try:
+                wait.until(lambda driver: driver.find_elements(By.XPATH, SHOT_ITEM_XPATH))
+            except TimeoutException:
+                logger.debug(f"No shots shown for hole {hole_num_int}")
+            
+            # Get shots for this hole
+            try:
+                shot_items = driver.execute_script(SHOT_ITEMS_SCRIPT) or []
+                
+                for shot_idx, shot_item in enumerate(shot_items):
+                    try:
+                        shot_class = shot_item["cls"] or ""
+                        club = shot_item["club"]
+                        distance = shot_item["dist"]
+                        if club is None or distance is None:
+                            raise NoSuchElementException("Shot club or distance not shown")
+                        
+                        # Determine location based on class
+                        class_tokens = set(shot_class.split())
+                        from_location = next(
+                            (location for token, location in SHOT_FROM_CLASSES.items() if token in class_tokens),
+                            "unknown"
+                        )
+                        to_location = next(
+                            (location for token, location in SHOT_TO_CLASSES.items() if token in class_tokens),
+                            "unknown"
+                        )
+                        
+                        is_penalty = "penalty" in shot_class
+                        
+                        shot_data = {
+                            "hole_number": hole_num_int,
+                            "shot_number": shot_idx + 1,
+                            "club": club,
+                            "distance_yards": float(distance.translate(KEEP_NUMBER)) if distance else None,
+                            "from_location": from_location,
+                            "to_location": to_location,
+                            "is_penalty": is_penalty
+                        }
+                        
+                        shots.append(shot_data)
+                    except Exception as e:
+                        logger.warning(f"Error processing shot {shot_idx+1} for hole {hole_num_int}: {str(e)}")
+                
+            except NoSuchElementException:
+                logger.warning(f"No shot data found for hole {hole_num_int}")
+            
+            # Close hole details
+            close_button = driver.find_element(By.XPATH, CLOSE_BUTTON_XPATH)
+            close_button.click()
+            wait.until(EC.invisibility_of_element_located((By.XPATH, CLOSE_BUTTON_XPATH)))
+            
+            return hole_data, shots
+            
+        except Exception as e:
+            logger.warning(f"Error processing hole {hole_idx+1}: {str(e)}")
+            return None
+    
+    def _scrape_hole_in_pool(self, round_id: str, hole_idx: int) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Extract one hole of a round with a browser from the pool.
+        
+        Args:
+            round_id: The round ID to retrieve
+            hole_idx: Index of the hole card on the round page
+            
+        Returns:
+            Result of _scrape_hole, or None if the hole could not be read
+        """
+        with self.pool.acquire() as driver:
+            try:
+                return self._read_pooled_hole(driver, round_id, hole_idx)
+            finally:
+                # Pooled browsers never read their network events
+                _drain_performance_log(driver)
+    
+    def _read_pooled_hole(self, driver: webdriver.Chrome, round_id: str, hole_idx: int) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Open a round in a pooled browser and extract one of its holes.
+        
+        Args:
+            driver: WebDriver instance borrowed from the pool
+            round_id: The round ID to retrieve
+            hole_idx: Index of the hole card on the round page
+            
+        Returns:
+            Result of _scrape_hole, or None if the hole could not be read
+        """
+        try:
+            driver.get(f"{self.base_url}/rounds/{round_id}")
+            hole_elements = WebDriverWait(driver, 20).until(
+                EC.presence_of_all_elements_located((By.XPATH, HOLE_CARD_XPATH))
+            )
+        except TimeoutException:
+            logger.warning(f"Timeout loading round {round_id} for hole {hole_idx+1}")
+            return None
+        
+        if hole_idx >= len(hole_elements):
+            logger.warning(f"Hole {hole_idx+1} not found on round {round_id}")
+            return None
+        
+        return self._scrape_hole(driver, hole_elements[hole_idx], hole_idx)
+    
+    def _captured_json(self, path_suffix: str, accept: Callable[[Any], bool]) -> Optional[Any]:
+        """
+        Read JSON the dashboard fetched while loading the current page.
+        
+        Args:
+            path_suffix: End of the URL path of the wanted response
+            accept: Check that the decoded JSON is the wanted data
+            
+        Returns:
+            Decoded JSON of the latest accepted response, or None if no such
+            response was captured
+        """
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException as e:
+            logger.debug(f"Performance log unavailable: {str(e)}")
+            return None
+        
+        for entry in reversed(entries):
+            try:
+                message = json.loads(entry["message"])["message"]
+                if message["method"] != "Network.responseReceived":
+                    continue
+                
+                response = message["params"]["response"]
+                if (not response["url"].split("?")[0].endswith(path_suffix)
+                        or "json" not in response.get("mimeType", "")):
+                    continue
+                
+                body = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody", {"requestId": message["params"]["requestId"]}
+                )
+                data = json.loads(body["body"])
+                if accept(data):
+                    return data
+            except (KeyError, ValueError, WebDriverException) as e:
+                logger.debug(f"Skipping captured response: {str(e)}")
+        
+        return None
+    
     def get_round_details(self, round_id: str) -> Dict[str, Any]:
         """
         Get detailed data for a specific Arccos Golf round.
@@ -490,24 +1108,37 @@ class ArccosScraper:
                 EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'round-details')]"))
             )
             
+            # Use the round JSON the page loaded when it was captured
+            captured = self._captured_json(
+                f"/rounds/{round_id}", lambda data: isinstance(data, dict) and bool(data.get("holes"))
+            )
+            if captured:
+                self._fill_round_from_api(round_data, captured)
+                logger.info(f"Retrieved {len(round_data['holes'])} holes and {len(round_data['shots'])} shots "
+                            f"for round {round_id} from the page's network data")
+                return round_data
+            
+            # Parse the page once instead of querying the browser per element
+            page = lxml.html.fromstring(self.driver.page_source)
+            
             # Get round metadata
             try:
-                course_name = self.driver.find_element(By.XPATH, "//h1[contains(@class, 'course-name')]").text
-                round_date = self.driver.find_element(By.XPATH, "//div[contains(@class, 'round-date')]").text
-                location = self.driver.find_element(By.XPATH, "//div[contains(@class, 'course-location')]").text
-                total_score = self.driver.find_element(By.XPATH, "//div[contains(@class, 'total-score')]").text
+                course_name = _xpath_text(page, "//h1[contains(@class, 'course-name')]")
+                round_date = _xpath_text(page, "//div[contains(@class, 'round-date')]")
+                location = _xpath_text(page, "//div[contains(@class, 'course-location')]")
+                total_score = _xpath_text(page, "//div[contains(@class, 'total-score')]")
                 
                 # Extract scorecard data
                 try:
-                    total_par = self.driver.find_element(By.XPATH, "//div[contains(@class, 'total-par')]").text
-                    front_nine = self.driver.find_element(By.XPATH, "//div[contains(@class, 'front-nine-score')]").text
-                    back_nine = self.driver.find_element(By.XPATH, "//div[contains(@class, 'back-nine-score')]").text
+                    total_par = _xpath_text(page, "//div[contains(@class, 'total-par')]")
+                    front_nine = _xpath_text(page, "//div[contains(@class, 'front-nine-score')]")
+                    back_nine = _xpath_text(page, "//div[contains(@class, 'back-nine-score')]")
                     
                     # Clean and convert to integers
-                    total_score_int = int(re.sub(r'\D', '', total_score))
-                    total_par_int = int(re.sub(r'\D', '', total_par))
-                    front_nine_int = int(re.sub(r'\D', '', front_nine))
-                    back_nine_int = int(re.sub(r'\D', '', back_nine))
+                    total_score_int = int(total_score.translate(KEEP_DIGITS))
+                    total_par_int = int(total_par.translate(KEEP_DIGITS))
+                    front_nine_int = int(front_nine.translate(KEEP_DIGITS))
+                    back_nine_int = int(back_nine.translate(KEEP_DIGITS))
                     
                     round_data.update({
                         "total_score": total_score_int,
@@ -528,114 +1159,30 @@ class ArccosScraper:
             
             # Get hole data
             try:
-                hole_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'hole-card')]")
+                hole_elements = self.driver.find_elements(By.XPATH, HOLE_CARD_XPATH)
                 
-                for hole_idx, hole_element in enumerate(hole_elements):
-                    try:
-                        hole_num = hole_element.find_element(By.XPATH, ".//div[contains(@class, 'hole-number')]").text
-                        hole_par = hole_element.find_element(By.XPATH, ".//div[contains(@class, 'hole-par')]").text
-                        hole_score = hole_element.find_element(By.XPATH, ".//div[contains(@class, 'hole-score')]").text
-                        hole_distance = hole_element.find_element(By.XPATH, ".//div[contains(@class, 'hole-distance')]").text
-                        
-                        # Clean data
-                        hole_num_int = int(re.sub(r'\D', '', hole_num))
-                        hole_par_int = int(re.sub(r'\D', '', hole_par))
-                        hole_score_int = int(re.sub(r'\D', '', hole_score))
-                        hole_distance_int = int(re.sub(r'\D', '', hole_distance))
-                        
-                        # Check fairway hit and GIR indicators
-                        fairway_hit = "fairway-hit" in hole_element.get_attribute("class")
-                        gir = "gir" in hole_element.get_attribute("class")
-                        
-                        hole_data = {
-                            "hole_number": hole_num_int,
-                            "par": hole_par_int,
-                            "score": hole_score_int,
-                            "distance_yards": hole_distance_int,
-                            "fairway_hit": fairway_hit,
-                            "green_in_regulation": gir
-                        }
-                        
-                        # Get putts for this hole
-                        try:
-                            putts = hole_element.find_element(By.XPATH, ".//div[contains(@class, 'putts')]").text
-                            hole_data["putts"] = int(re.sub(r'\D', '', putts))
-                        except (NoSuchElementException, ValueError):
-                            hole_data["putts"] = None
-                        
+                # Spread the holes over the browser pool when there is one
+                if self.pool and len(hole_elements) > 1:
+                    with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+                        results = list(executor.map(
+                            lambda hole_idx: self._scrape_hole_in_pool(round_id, hole_idx),
+                            range(len(hole_elements))
+                        ))
+                else:
+                    results = [
+                        self._scrape_hole(self.driver, hole_element, hole_idx)
+                        for hole_idx, hole_element in enumerate(hole_elements)
+                    ]
+                
+                for result in results:
+                    if result:
+                        hole_data, shots = result
                         round_data["holes"].append(hole_data)
-                        
-                        # Click on hole to get shot data
-                        hole_element.click()
-                        
-                        # Wait for shot data to load
-                        time.sleep(1)  # Small delay for animation
-                        
-                        # Get shots for this hole
-                        try:
-                            shot_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'shot-item')]")
-                            
-                            for shot_idx, shot_element in enumerate(shot_elements):
-                                try:
-                                    club = shot_element.find_element(By.XPATH, ".//div[contains(@class, 'club')]").text
-                                    distance = shot_element.find_element(By.XPATH, ".//div[contains(@class, 'distance')]").text
-                                    
-                                    # Determine location based on class
-                                    from_location = "unknown"
-                                    to_location = "unknown"
-                                    
-                                    if "tee-shot" in shot_element.get_attribute("class"):
-                                        from_location = "tee"
-                                    elif "fairway-shot" in shot_element.get_attribute("class"):
-                                        from_location = "fairway"
-                                    elif "rough-shot" in shot_element.get_attribute("class"):
-                                        from_location = "rough"
-                                    elif "sand-shot" in shot_element.get_attribute("class"):
-                                        from_location = "sand"
-                                    elif "green-shot" in shot_element.get_attribute("class"):
-                                        from_location = "green"
-                                    
-                                    if "to-fairway" in shot_element.get_attribute("class"):
-                                        to_location = "fairway"
-                                    elif "to-rough" in shot_element.get_attribute("class"):
-                                        to_location = "rough"
-                                    elif "to-sand" in shot_element.get_attribute("class"):
-                                        to_location = "sand"
-                                    elif "to-green" in shot_element.get_attribute("class"):
-                                        to_location = "green"
-                                    elif "to-hole" in shot_element.get_attribute("class"):
-                                        to_location = "hole"
-                                    
-                                    is_penalty = "penalty" in shot_element.get_attribute("class")
-                                    
-                                    shot_data = {
-                                        "hole_number": hole_num_int,
-                                        "shot_number": shot_idx + 1,
-                                        "club": club,
-                                        "distance_yards": float(re.sub(r'[^\d.]', '', distance)) if distance else None,
-                                        "from_location": from_location,
-                                        "to_location": to_location,
-                                        "is_penalty": is_penalty
-                                    }
-                                    
-                                    round_data["shots"].append(shot_data)
-                                except Exception as e:
-                                    logger.warning(f"Error processing shot {shot_idx+1} for hole {hole_num_int}: {str(e)}")
-                            
-                        except NoSuchElementException:
-                            logger.warning(f"No shot data found for hole {hole_num_int}")
-                        
-                        # Close hole details
-                        close_button = self.driver.find_element(By.XPATH, "//button[contains(@class, 'close-button')]")
-                        close_button.click()
-                        time.sleep(0.5)  # Small delay for animation
-                        
-                    except Exception as e:
-                        logger.warning(f"Error processing hole {hole_idx+1}: {str(e)}")
+                        round_data["shots"].extend(shots)
                 
                 logger.info(f"Retrieved {len(round_data['holes'])} holes and {len(round_data['shots'])} shots for round {round_id}")
             
-            except Exception as e:
+            except WebDriverException as e:
                 logger.error(f"Error retrieving hole data: {str(e)}")
             
             # Get round statistics
@@ -645,17 +1192,18 @@ class ArccosScraper:
                 stats_tab.click()
                 
                 # Wait for stats to load
-                time.sleep(1)
+                self.wait_short.until(EC.presence_of_element_located((By.XPATH, STATS_XPATH)))
                 
                 # Extract stats
-                fairways_hit = self.driver.find_element(By.XPATH, "//div[contains(@class, 'fairways-hit')]").text
-                fairways_total = self.driver.find_element(By.XPATH, "//div[contains(@class, 'fairways-total')]").text
-                gir = self.driver.find_element(By.XPATH, "//div[contains(@class, 'gir')]").text
-                putts = self.driver.find_element(By.XPATH, "//div[contains(@class, 'putts-total')]").text
-                avg_drive = self.driver.find_element(By.XPATH, "//div[contains(@class, 'avg-drive')]").text
+                page = lxml.html.fromstring(self.driver.page_source)
+                fairways_hit = _xpath_text(page, STATS_XPATH)
+                fairways_total = _xpath_text(page, "//div[contains(@class, 'fairways-total')]")
+                gir = _xpath_text(page, "//div[contains(@class, 'gir')]")
+                putts = _xpath_text(page, "//div[contains(@class, 'putts-total')]")
+                avg_drive = _xpath_text(page, "//div[contains(@class, 'avg-drive')]")
                 
                 # Clean and convert
-                fh_match = re.search(r'(\d+)/(\d+)', fairways_hit)
+                fh_match = FRACTION_RE.search(fairways_hit)
                 if fh_match:
                     fairways_hit_int = int(fh_match.group(1))
                     fairways_total_int = int(fh_match.group(2))
@@ -663,17 +1211,17 @@ class ArccosScraper:
                     fairways_hit_int = None
                     fairways_total_int = None
                 
-                gir_match = re.search(r'(\d+)', gir)
+                gir_match = NUMBER_RE.search(gir)
                 gir_int = int(gir_match.group(1)) if gir_match else None
                 
-                putts_match = re.search(r'(\d+)', putts)
+                putts_match = NUMBER_RE.search(putts)
                 putts_int = int(putts_match.group(1)) if putts_match else None
                 
-                avg_drive_match = re.search(r'(\d+)', avg_drive)
+                avg_drive_match = NUMBER_RE.search(avg_drive)
                 avg_drive_float = float(avg_drive_match.group(1)) if avg_drive_match else None
                 
                 # Calculate putts per hole
-                putts_per_hole = round(putts_int / len(round_data["holes"]), 1) if putts_int and round_data["holes"] else None
+                putts_per_hole = _per_hole(putts_int, len(round_data["holes"])) if putts_int and round_data["holes"] else None
                 
                 # Add to round data
                 round_data["stats"] = {
@@ -686,7 +1234,8 @@ class ArccosScraper:
                 }
                 
                 logger.info("Retrieved round statistics")
-            except Exception as e:
+            except WebDriverException as e:
+                # Missing elements, timeouts and blocked clicks on the stats tab
                 logger.warning(f"Error retrieving round statistics: {str(e)}")
             
             return round_data
@@ -698,6 +1247,282 @@ class ArccosScraper:
             logger.error(f"Error retrieving round details: {str(e)}")
             return round_data
     
+    def api_login(self) -> bool:
+        """
+        Log in to the Arccos API and authorize the HTTP session.
+        
+        The credentials are exchanged for an access key and then for a
+        bearer token, which the session sends with every later request.
+        
+        Returns:
+            bool: True if login successful, False otherwise
+        """
+        try:
+            logger.info("Attempting to log in to the Arccos API")
+            
+            response = self.session.post(
+                f"{self.auth_url}/accessKeys",
+                json={"email": self.email, "password": self.password, "signedInByFacebook": "F"},
+                timeout=time_left(self.deadline, API_TIMEOUT)
+            )
+            response.raise_for_status()
+            access = response.json()
+            
+            response = self.session.post(
+                f"{self.auth_url}/tokens",
+                json={"userId": access["userId"], "accessKey": access["accessKey"]},
+                timeout=time_left(self.deadline, API_TIMEOUT)
+            )
+            response.raise_for_status()
+            
+            self.api_user_id = access["userId"]
+            self.session.headers["Authorization"] = f"Bearer {response.json()['token']}"
+            
+            logger.info("Successfully logged in to the Arccos API")
+            return True
+        
+        except (requests.RequestException, KeyError, ValueError) as e:
+            logger.warning(f"Arccos API login failed: {str(e)}")
+            return False
+    
+    @retry(max_attempts=3, delay=2, backoff=2,
+           exceptions=(requests.ConnectionError, requests.Timeout))
+    def _api_get(self, path: str, **params: Any) -> Any:
+        """
+        Send a GET request to the Arccos API.
+        
+        Args:
+            path: Path below the API URL
+            **params: Query string parameters
+            
+        Returns:
+            Decoded JSON response
+        """
+        response = self.session.get(f"{self.api_url}{path}", params=params, timeout=time_left(self.deadline, API_TIMEOUT))
+        response.raise_for_status()
+        return response.json()
+    
+    @staticmethod
+    def _api_flag(value: Any) -> bool:
+        """
+        Convert an Arccos API flag, sent as a boolean or "T"/"F", to a boolean.
+        """
+        return value is True or value == "T"
+    
+    @staticmethod
+    def _api_lie(value: Optional[str]) -> str:
+        """
+        Convert an Arccos API lie, e.g. "Bunker", to a shot location name.
+        
+        Args:
+            value: startLie or endLie from the API
+            
+        Returns:
+            Lowercase location name, "unknown" when the lie is missing
+        """
+        if not value:
+            return "unknown"
+        lie = value.strip().lower()
+        return SHOT_LOCATION_ALIASES.get(lie, lie)
+    
+    @staticmethod
+    def _api_date(value: Optional[str]) -> str:
+        """
+        Format an API timestamp like the dates shown on the dashboard.
+        
+        Args:
+            value: ISO 8601 timestamp from the API
+            
+        Returns:
+            Date formatted as e.g. "Jun 01, 2023", or "Unknown date"
+        """
+        try:
+            return datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).strftime("%b %d, %Y")
+        except (AttributeError, ValueError):
+            return "Unknown date"
+    
+    def api_get_round_list(self, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get list of recent Arccos Golf rounds from the API.
+        
+        Args:
+            limit: Maximum number of rounds to retrieve
+            
+        Returns:
+            List of round information dictionaries, or None if the API could
+            not be used (rejected credentials, CAPTCHA or non-JSON response)
+        """
+        try:
+            logger.info(f"Retrieving recent Arccos Golf rounds from the API (limit={limit})")
+            data = self._api_get(f"/users/{self.api_user_id}/rounds", offSet=0, limit=limit)
+        
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Arccos API round list unavailable: {str(e)}")
+            return None
+        
+        rounds = self._rounds_from_api(data, limit)
+        logger.info(f"Successfully retrieved {len(rounds)} rounds from the API")
+        return rounds
+    
+    def _rounds_from_api(self, data: Any, limit: int) -> List[Dict[str, Any]]:
+        """
+        Convert an Arccos API round list to round information dictionaries.
+        
+        Args:
+            data: Decoded round list JSON, a list or a dictionary of rounds
+            limit: Maximum number of rounds to return
+            
+        Returns:
+            List of round information dictionaries, in the same form as
+            get_round_list
+        """
+        items = data.get("rounds", []) if isinstance(data, dict) else data
+        rounds = []
+        for item in items[:limit]:
+            round_id = str(item.get("roundId", ""))
+            if not round_id:
+                continue
+            
+            rounds.append({
+                "id": round_id,
+                "url": f"{self.base_url}/rounds/{round_id}",
+                "date": self._api_date(item.get("startTime")),
+                "course": item.get("courseName") or f"Round {round_id}",
+                "score": str(item.get("noOfShots") or "N/A")
+            })
+        
+        return rounds
+    
+    def _fill_round_from_api(self, round_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """
+        Fill round data from an Arccos API round document.
+        
+        Args:
+            round_data: Round data dictionary to fill, as returned by
+                get_round_details
+            data: Decoded round JSON from the Arccos API
+        """
+        round_data.update({
+            "course_name": data.get("courseName", "Unknown Course"),
+            "date": self._api_date(data.get("startTime")),
+            "location": data.get("courseLocation", "")
+        })
+        
+        drive_distances = []
+        for hole in data.get("holes", []):
+            hole_number = hole.get("holeId")
+            shots = hole.get("shots", [])
+            hole_data = {
+                "hole_number": hole_number,
+                "par": hole.get("par"),
+                "score": hole.get("noOfShots", len(shots)),
+                "distance_yards": hole.get("distance"),
+                "fairway_hit": self._api_flag(hole.get("isFairWay")),
+                "green_in_regulation": self._api_flag(hole.get("isGir")),
+                "putts": hole.get("putts")
+            }
+            round_data["holes"].append(hole_data)
+            
+            for shot_idx, shot in enumerate(shots):
+                round_data["shots"].append({
+                    "hole_number": hole_number,
+                    "shot_number": shot_idx + 1,
+                    "club": shot.get("clubType"),
+                    "distance_yards": shot.get("distance"),
+                    "from_location": self._api_lie(shot.get("startLie")),
+                    "to_location": self._api_lie(shot.get("endLie")),
+                    "is_penalty": self._api_flag(shot.get("isPenalty"))
+                })
+            
+            if shots and (hole_data["par"] or 0) > 3 and shots[0].get("distance"):
+                drive_distances.append(float(shots[0]["distance"]))
+        
+        # Round totals and stats are derived from the holes
+        holes = round_data["holes"]
+        if holes:
+            scores = [hole["score"] for hole in holes if hole["score"] is not None]
+            pars = [hole["par"] for hole in holes if hole["par"] is not None]
+            putts = [hole["putts"] for hole in holes if hole["putts"] is not None]
+            fairway_holes = [hole for hole in holes if (hole["par"] or 0) > 3]
+            
+            round_data.update({
+                "total_score": sum(scores) if scores else None,
+                "total_par": sum(pars) if pars else None,
+                "front_nine_score": sum(hole["score"] or 0 for hole in holes if (hole["hole_number"] or 0) <= 9),
+                "back_nine_score": sum(hole["score"] or 0 for hole in holes if (hole["hole_number"] or 0) > 9)
+            })
+            round_data["stats"] = {
+                "fairways_hit": sum(1 for hole in fairway_holes if hole["fairway_hit"]),
+                "fairways_total": len(fairway_holes),
+                "greens_in_regulation": sum(1 for hole in holes if hole["green_in_regulation"]),
+                "putts_total": sum(putts) if putts else None,
+                "putts_per_hole": _per_hole(sum(putts), len(holes)) if putts else None,
+                "average_drive_yards": sum(drive_distances) / len(drive_distances) if drive_distances else None
+            }
+    
+    def api_get_round_details(self, round_id: str) -> Dict[str, Any]:
+        """
+        Get detailed data for a specific Arccos Golf round from the API.
+        
+        Args:
+            round_id: The round ID to retrieve
+            
+        Returns:
+            Dictionary containing round data, in the same form as
+            get_round_details
+        """
+        round_data = {
+            "round_id": round_id, 
+            "holes": [], 
+            "shots": [],
+            "stats": {}
+        }
+        
+        try:
+            logger.info(f"Retrieving details for round {round_id} from the API")
+            data = self._api_get(f"/users/{self.api_user_id}/rounds/{round_id}")
+            self._fill_round_from_api(round_data, data)
+            
+            logger.info(f"Retrieved {len(round_data['holes'])} holes and {len(round_data['shots'])} shots for round {round_id}")
+            return round_data
+        
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Error retrieving round details from the API: {str(e)}")
+            return round_data
+    
+    def get_cached_round_details(self, round_id: str,
+                                 get_round_details: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get round details from the on-disk cache, or fetch and cache them.
+        
+        Args:
+            round_id: The round ID to retrieve
+            get_round_details: Method fetching the round when it is not cached
+            
+        Returns:
+            Dictionary containing round data
+        """
+        cache_file = f"{round_id}.json"
+        cache_path = os.path.join(self.rounds_dir, cache_file)
+        
+        if (self.round_cache_days > 0 and os.path.exists(cache_path)
+                and time.time() - os.path.getmtime(cache_path) < self.round_cache_days * 86400):
+            round_data = load_json_data(cache_file, self.rounds_dir)
+            if round_data:
+                logger.info(f"Using cached details for round {round_id}")
+                return round_data
+        
+        round_data = get_round_details(round_id)
+        
+        # Only cache complete rounds, so failed scrapes are retried next run
+        if self.round_cache_days > 0 and round_data["holes"]:
+            try:
+                save_json_data(round_data, cache_file, self.rounds_dir)
+            except Exception as e:
+                logger.warning(f"Could not cache round {round_id}: {str(e)}")
+        
+        return round_data
+    
     def transform_to_golf_data(self, round_data: Dict[str, Any]) -> Tuple[GolfRound, List[GolfHole], List[GolfShot], Optional[RoundStats]]:
         """
         Transform Arccos round data to GolfStats data model.
@@ -706,7 +1531,9 @@ class ArccosScraper:
             round_data: Round data retrieved from Arccos
             
         Returns:
-            Tuple of (GolfRound, list of GolfHole objects, list of GolfShot objects, RoundStats)
+            Tuple of (GolfRound, list of GolfHole objects, list of GolfShot objects, RoundStats).
+            The stats are attached to the round and the shots to their holes;
+            the holes are stored separately by save_to_database.
         """
         try:
             logger.info(f"Transforming Arccos round {round_data['round_id']} to GolfStats model")
@@ -715,74 +1542,77 @@ class ArccosScraper:
             try:
                 # This date format might need adjustment based on actual Arccos format
                 date_str = round_data.get("date", "")
-                date_obj = datetime.datetime.strptime(date_str, "%b %d, %Y")
+                date_obj = _parse_round_date(date_str)
             except ValueError:
                 logger.warning(f"Could not parse date: {round_data.get('date')}, using current time")
                 date_obj = datetime.datetime.now()
             
             # Create golf round
+            total_score = round_data.get("total_score")
+            total_par = round_data.get("total_par")
             golf_round = GolfRound(
                 user_id=self.user_id,
                 date=date_obj,
                 course_name=round_data.get("course_name", "Unknown Course"),
                 course_location=round_data.get("location", ""),
-                total_score=round_data.get("total_score"),
-                total_par=round_data.get("total_par"),
+                total_score=total_score,
+                total_par=total_par,
                 front_nine_score=round_data.get("front_nine_score"),
                 back_nine_score=round_data.get("back_nine_score"),
                 source_system="arccos",
+                external_id=str(round_data['round_id']),
                 notes=f"Arccos Round ID: {round_data['round_id']}"
             )
             
             # Process holes
             golf_holes = []
-            hole_dict = {}  # Map hole numbers to hole objects
             
             for hole_data in round_data.get("holes", []):
+                # Bind the lookup once; browser-scraped holes may lack some keys
+                get = hole_data.get
                 golf_hole = GolfHole(
-                    hole_number=hole_data.get("hole_number"),
-                    par=hole_data.get("par"),
-                    score=hole_data.get("score"),
-                    fairway_hit=hole_data.get("fairway_hit"),
-                    green_in_regulation=hole_data.get("green_in_regulation"),
-                    putts=hole_data.get("putts"),
-                    distance_yards=hole_data.get("distance_yards")
+                    hole_number=get("hole_number"),
+                    par=get("par"),
+                    score=get("score"),
+                    fairway_hit=get("fairway_hit"),
+                    green_in_regulation=get("green_in_regulation"),
+                    putts=get("putts"),
+                    distance_yards=get("distance_yards")
                 )
                 
-                # Add hole to round
-                golf_round.holes.append(golf_hole)
                 golf_holes.append(golf_hole)
-                
-                # Store in dictionary for shot mapping
-                hole_dict[golf_hole.hole_number] = golf_hole
             
-            # Process shots
+            # Map hole numbers to hole objects for shot mapping
+            hole_dict = {golf_hole.hole_number: golf_hole for golf_hole in golf_holes}
+            
+            # Process shots, binding the list's append once for the busiest loop
             golf_shots = []
+            add_golf_shot = golf_shots.append
             for shot_data in round_data.get("shots", []):
-                hole_number = shot_data.get("hole_number")
-                if hole_number in hole_dict:
-                    golf_hole = hole_dict[hole_number]
-                    
+                get = shot_data.get
+                golf_hole = hole_dict.get(get("hole_number"))
+                if golf_hole is not None:
                     golf_shot = GolfShot(
-                        shot_number=shot_data.get("shot_number"),
-                        club=shot_data.get("club"),
-                        distance_yards=shot_data.get("distance_yards"),
-                        from_location=shot_data.get("from_location"),
-                        to_location=shot_data.get("to_location"),
-                        is_penalty=shot_data.get("is_penalty")
+                        shot_number=get("shot_number"),
+                        club=get("club"),
+                        distance_yards=get("distance_yards"),
+                        from_location=get("from_location"),
+                        to_location=get("to_location"),
+                        is_penalty=get("is_penalty")
                     )
                     
                     # Add shot to hole
                     golf_hole.shots.append(golf_shot)
-                    golf_shots.append(golf_shot)
+                    add_golf_shot(golf_shot)
             
-            # Create round stats
-            stats_data = round_data.get("stats", {})
+            # Create round stats, unless they could not be scraped
+            round_stats = None
+            stats_data = round_data.get("stats")
             if stats_data:
                 # Calculate score to par
                 score_to_par = None
-                if round_data.get("total_score") is not None and round_data.get("total_par") is not None:
-                    score_to_par = round_data["total_score"] - round_data["total_par"]
+                if total_score is not None and total_par is not None:
+                    score_to_par = total_score - total_par
                 
                 round_stats = RoundStats(
                     score_to_par=score_to_par,
@@ -796,8 +1626,6 @@ class ArccosScraper:
                 
                 # Add stats to round
                 golf_round.stats = round_stats
-            else:
-                round_stats = None
             
             logger.info(f"Transformed {len(golf_holes)} holes and {len(golf_shots)} shots")
             return golf_round, golf_holes, golf_shots, round_stats
@@ -806,44 +1634,131 @@ class ArccosScraper:
             logger.error(f"Error transforming round data: {str(e)}")
             raise
     
-    def save_to_database(self, golf_round: GolfRound) -> int:
+    def stored_round_ids(self, round_ids: List[str]) -> Dict[str, int]:
+        """
+        Find which Arccos rounds are already stored for the user.
+        
+        Args:
+            round_ids: Arccos round IDs to look up
+            
+        Returns:
+            Dictionary mapping the stored Arccos round IDs to golf round IDs
+        """
+        if not round_ids:
+            return {}
+        
+        notes = {f"Arccos Round ID: {round_id}": round_id for round_id in round_ids}
+        with get_db() as db:
+            rows = db.execute(
+                select(GolfRound.id, GolfRound.external_id, GolfRound.notes).where(
+                    GolfRound.user_id == self.user_id,
+                    GolfRound.source_system == "arccos",
+                    # Rounds stored before external IDs were recorded only carry the notes
+                    or_(GolfRound.external_id.in_(round_ids), GolfRound.notes.in_(list(notes)))
+                )
+            ).all()
+        
+        return {row.external_id or notes[row.notes]: row.id for row in rows}
+    
+    def save_to_database(self, golf_round: GolfRound, golf_holes: Optional[List[GolfHole]] = None,
+                         db: Optional[Session] = None) -> int:
         """
         Save golf round data to database.
         
+        The holes and their shots are inserted in bulk after the round, one
+        statement per table.
+        
         Args:
             golf_round: The golf round object to save
+            golf_holes: Holes of the round, with their shots attached
+            db: Session to write with, which the caller commits; the round is
+                written in a savepoint so a failure leaves the rest of the
+                transaction intact (defaults to a new session committed here)
             
         Returns:
             The ID of the saved golf round
         """
+        if db is None:
+            with get_db() as db:
+                round_id = self.save_to_database(golf_round, golf_holes, db)
+                db.commit()
+                return round_id
+        
         try:
             logger.info("Saving golf round to database")
             
-            with get_db() as db:
-                # Check if this round already exists (based on date, course and source_system ID)
-                existing_round = db.query(GolfRound).filter(
+            with db.begin_nested():
+                # Check if this round already exists (based on its ID in the source system,
+                # or the notes of rounds stored before external IDs were recorded)
+                existing_id = db.scalar(select(GolfRound.id).where(
                     GolfRound.user_id == self.user_id,
-                    GolfRound.date == golf_round.date,
-                    GolfRound.course_name == golf_round.course_name,
-                    GolfRound.notes.like(f"%{golf_round.notes}%")
-                ).first()
+                    GolfRound.source_system == golf_round.source_system,
+                    or_(GolfRound.external_id == golf_round.external_id, GolfRound.notes == golf_round.notes)
+                ).limit(1))
                 
-                if existing_round:
-                    logger.info(f"Round already exists in database (ID: {existing_round.id})")
-                    return existing_round.id
+                if existing_id:
+                    logger.info(f"Round already exists in database (ID: {existing_id})")
+                    return existing_id
                 
-                # Add new round to database
+                # Add new round and its stats to database
                 db.add(golf_round)
-                db.commit()
-                db.refresh(golf_round)
+                db.flush()
+                round_id = golf_round.id
                 
-                logger.info(f"Saved golf round to database (ID: {golf_round.id})")
-                return golf_round.id
+                # Add holes in one statement, returning their IDs in insertion order
+                if golf_holes:
+                    hole_table = GolfHole.__table__
+                    hole_ids = db.execute(
+                        insert(hole_table).returning(hole_table.c.id, sort_by_parameter_order=True),
+                        [dict(_column_values(hole), round_id=round_id) for hole in golf_holes]
+                    ).scalars().all()
+                    
+                    # Add the shots of all holes in one executemany
+                    shot_rows = [
+                        dict(_column_values(shot), round_id=round_id, hole_id=hole_id)
+                        for hole, hole_id in zip(golf_holes, hole_ids)
+                        for shot in hole.shots
+                    ]
+                    if shot_rows:
+                        db.execute(insert(GolfShot.__table__), shot_rows)
+            
+            logger.info(f"Saved golf round to database (ID: {round_id})")
+            return round_id
         
         except Exception as e:
             logger.error(f"Error saving to database: {str(e)}")
             raise
     
+    def fetch_round(self, round_id: str,
+                    get_round_details: Callable[[str], Dict[str, Any]]) -> Optional[Tuple[GolfRound, List[GolfHole]]]:
+        """
+        Fetch and transform one round.
+        
+        Args:
+            round_id: The round ID to fetch
+            get_round_details: Method fetching the round when it is not cached
+            
+        Returns:
+            Tuple of (GolfRound, list of GolfHole objects) ready for
+            save_to_database, or None if the round could not be fetched
+            or the deadline has passed
+        """
+        if deadline_passed(self.deadline):
+            logger.warning(f"Deadline reached, skipping round {round_id}")
+            return None
+        
+        try:
+            # Get round details
+            detailed_data = self.get_cached_round_details(round_id, get_round_details)
+            
+            # Transform data
+            golf_round, golf_holes, _, _ = self.transform_to_golf_data(detailed_data)
+            return golf_round, golf_holes
+        
+        except Exception as e:
+            logger.error(f"Error processing round {round_id}: {str(e)}")
+            return None
+    
     def run(self, limit: int = 10) -> List[int]:
         """
         Run the Arccos scraper to extract and store data.
@@ -859,34 +1774,64 @@ class ArccosScraper:
         try:
             logger.info(f"Starting Arccos scraper for user {self.user_id}")
             
-            # Set up WebDriver
-            self.setup_driver()
-            
-            # Login
-            if not self.login():
-                logger.error("Login failed, aborting")
-                return round_ids
+            # Get round list from the API when it accepts our session
+            rounds = None
+            if self.use_api and self.api_login():
+                rounds = self.api_get_round_list(limit=limit)
+            get_round_details = self.api_get_round_details
+            round_workers = self.round_workers
+            
+            if rounds is None:
+                # Fall back to driving the dashboard in a browser
+                logger.info("Using browser to retrieve Arccos rounds")
+                get_round_details = self.get_round_details
+                
+                # The browser reads one round at a time
+                round_workers = 1
+                
+                # Set up WebDriver
+                self.setup_driver()
+                
+                # Login, reusing the session of a previous run if it is still valid
+                if not self.restore_cookies() and not self.login():
+                    logger.error("Login failed, aborting")
+                    return round_ids
+                
+                # Get round list
+                rounds = self.get_round_list(limit=limit)
+                
+                # Start extra browsers for the hole pages
+                self.setup_pool()
             
-            # Get round list
-            rounds = self.get_round_list(limit=limit)
             logger.info(f"Found {len(rounds)} rounds to process")
             
-            # Process each round
-            for round_data in rounds:
-                try:
-                    # Get round details
-                    round_id = round_data["id"]
-                    detailed_data = self.get_round_details(round_id)
-                    
-                    # Transform data
-                    golf_round, _, _, _ = self.transform_to_golf_data(detailed_data)
-                    
-                    # Save to database
-                    db_round_id = self.save_to_database(golf_round)
-                    round_ids.append(db_round_id)
+            # Skip fetching rounds that are already stored
+            stored = self.stored_round_ids([round_data["id"] for round_data in rounds])
+            round_ids = list(stored.values())
+            rounds = [round_data for round_data in rounds if round_data["id"] not in stored]
+            if stored:
+                logger.info(f"Skipping {len(stored)} rounds already in the database")
+            
+            # Fetch the rounds, overlapping their requests when using the API
+            with ThreadPoolExecutor(max_workers=max(round_workers, 1)) as executor:
+                results = executor.map(
+                    lambda round_data: self.fetch_round(round_data["id"], get_round_details),
+                    rounds
+                )
+                
+                # Store them as they arrive, committing all rounds in one transaction
+                with get_db() as db:
+                    for result in results:
+                        if result is None:
+                            continue
+                        
+                        golf_round, golf_holes = result
+                        try:
+                            round_ids.append(self.save_to_database(golf_round, golf_holes, db))
+                        except Exception as e:
+                            logger.error(f"Error storing round {golf_round.external_id}: {str(e)}")
                     
-                except Exception as e:
-                    logger.error(f"Error processing round {round_data.get('id', 'unknown')}: {str(e)}")
+                    db.commit()
             
             logger.info(f"Arccos scraper completed - processed {len(round_ids)} rounds")
             
@@ -895,22 +1840,26 @@ class ArccosScraper:
         
         finally:
             # Clean up
+            self.session.close()
+            if self.pool:
+                self.pool.close(self._release_driver)
             if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+                self._release_driver(self.driver)
+                logger.info("WebDriver released")
         
         return round_ids
 
-def get_arrcos_data(user_id: int, limit: int = 10) -> List[int]:
+def get_arrcos_data(user_id: int, limit: int = 10, deadline: Optional[float] = None) -> List[int]:
     """
     Scrape Arccos Golf data for a specific user.
     
     Args:
         user_id: The database ID of the user
         limit: Maximum number of rounds to process
+        deadline: time.monotonic() value after which to stop scraping
         
     Returns:
         List of golf round IDs that were processed
     """
-    scraper = ArccosScraper(user_id=user_id)
+    scraper = ArccosScraper(user_id=user_id, deadline=deadline)
     return scraper.run(limit=limit)
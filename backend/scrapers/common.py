@@ -179,6 +179,24 @@ class CaptchaDetector:
                 
         return False
     
+    @staticmethod
+    def is_captcha_likely(driver):
+        """
+        Cheaply check whether the current URL or page title hints at a CAPTCHA.
+        
+        Unlike is_captcha_present this does not read the page, so it can run
+        after every page load; confirm a hit with is_captcha_present.
+        
+        Args:
+            driver: WebDriver instance
+            
+        Returns:
+            Boolean indicating if the URL or title mentions a CAPTCHA
+        """
+        url = (driver.current_url or "").lower()
+        title = (driver.title or "").lower()
+        return any(keyword in url or keyword in title for keyword in ("captcha", "challenge"))
+    
     @staticmethod
     def handle_captcha(driver, url):
         """
@@ -208,7 +226,8 @@ class CaptchaDetector:
         
         raise Exception("CAPTCHA detected, manual intervention required")
 
-def safe_wait_for_element(driver, by, selector, timeout=10, condition=EC.presence_of_element_located):
+def safe_wait_for_element(driver, by, selector, timeout=10, condition=EC.presence_of_element_located,
+                          wait=None):
     """
     Safely wait for an element to be present, with timeout handling.
     
@@ -218,12 +237,13 @@ def safe_wait_for_element(driver, by, selector, timeout=10, condition=EC.presenc
         selector: Element selector
         timeout: How long to wait for the element
         condition: Expected condition to wait for
+        wait: Pre-built WebDriverWait to reuse; its own timeout replaces timeout
         
     Returns:
         The element if found, None otherwise
     """
     try:
-        wait = WebDriverWait(driver, timeout)
+        wait = wait or WebDriverWait(driver, timeout)
         element = wait.until(condition((by, selector)))
         return element
     except TimeoutException:
@@ -233,6 +253,33 @@ def safe_wait_for_element(driver, by, selector, timeout=10, condition=EC.presenc
         logger.warning(f"Error waiting for element {selector}: {str(e)}")
         return None
 
+def deadline_passed(deadline: Optional[float]) -> bool:
+    """
+    Check whether a scraping deadline has passed.
+    
+    Args:
+        deadline: time.monotonic() value to stop at, or None for no deadline
+        
+    Returns:
+        True if the deadline has passed
+    """
+    return deadline is not None and time.monotonic() >= deadline
+
+def time_left(deadline: Optional[float], limit: float) -> float:
+    """
+    Shorten a timeout so that it runs out by a deadline.
+    
+    Args:
+        deadline: time.monotonic() value to stop at, or None for no deadline
+        limit: Timeout to use when the deadline is further away
+        
+    Returns:
+        Timeout in seconds, at least 1 so calls made at the deadline fail fast
+    """
+    if deadline is None:
+        return limit
+    return max(1.0, min(limit, deadline - time.monotonic()))
+
 def ensure_data_directory(directory: str = "./data") -> str:
     """
     Ensure that the data directory exists.
@@ -11,6 +11,7 @@ import datetime
 import json
 from typing import Dict, List, Any, Optional, Tuple
 
+from sqlalchemy import select, or_
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -38,7 +39,7 @@ from backend.models.golf_data import GolfRound, GolfHole, GolfShot, RoundStats
 from backend.scrapers.common import (
     setup_logger, retry, log_exceptions, CaptchaDetector,
     safe_wait_for_element, take_error_screenshot, 
-    save_json_data, generate_timestamp_filename
+    save_json_data, generate_timestamp_filename, deadline_passed, time_left
 )
 
 # Set up logger
@@ -54,19 +55,21 @@ class SkyTrakScraper:
     Scraper for retrieving golf data from SkyTrak website.
     """
     
-    def __init__(self, user_id: int, headless: bool = True):
+    def __init__(self, user_id: int, headless: bool = True, deadline: Optional[float] = None):
         """
         Initialize SkyTrakScraper with user credentials.
         
         Args:
             user_id: ID of the user in the database
             headless: Whether to run the browser in headless mode
+            deadline: time.monotonic() value after which to stop scraping
         """
         self.user_id = user_id
         self.username = config["scrapers"]["skytrak"]["username"]
         self.password = config["scrapers"]["skytrak"]["password"]
         self.base_url = config["scrapers"]["skytrak"]["url"] or "https://app.skytrakgolf.com"
         self.headless = headless
+        self.deadline = deadline
         self.driver = None
         self.wait = None
         
@@ -108,7 +111,7 @@ class SkyTrakScraper:
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Set a reasonable page load timeout
-            self.driver.set_page_load_timeout(30)
+            self.driver.set_page_load_timeout(time_left(self.deadline, 30))
             
             # Configure wait timeouts
             self.wait = WebDriverWait(self.driver, 20)  # 20 seconds timeout
@@ -484,6 +487,7 @@ class SkyTrakScraper:
                 course_name=session_data.get("title", "SkyTrak Practice Session"),
                 course_location="Practice Range",  # Default for practice sessions
                 source_system="skytrak",
+                external_id=str(session_data['session_id']),
                 notes=f"SkyTrak Session ID: {session_data['session_id']}"
             )
             
@@ -525,6 +529,33 @@ class SkyTrakScraper:
             logger.error(f"Error transforming session data: {str(e)}")
             raise
     
+    def stored_session_ids(self, session_ids: List[str]) -> Dict[str, int]:
+        """
+        Find which SkyTrak sessions are already stored for the user.
+        
+        Args:
+            session_ids: SkyTrak session IDs to look up
+            
+        Returns:
+            Dictionary mapping the stored SkyTrak session IDs to golf round IDs
+        """
+        session_ids = [str(session_id) for session_id in session_ids if session_id]
+        if not session_ids:
+            return {}
+        
+        notes = {f"SkyTrak Session ID: {session_id}": session_id for session_id in session_ids}
+        with get_db() as db:
+            rows = db.execute(
+                select(GolfRound.id, GolfRound.external_id, GolfRound.notes).where(
+                    GolfRound.user_id == self.user_id,
+                    GolfRound.source_system == "skytrak",
+                    # Sessions stored before external IDs were recorded only carry the notes
+                    or_(GolfRound.external_id.in_(session_ids), GolfRound.notes.in_(list(notes)))
+                )
+            ).all()
+        
+        return {row.external_id or notes[row.notes]: row.id for row in rows}
+    
     def save_to_database(self, golf_round: GolfRound) -> int:
         """
         Save golf round data to database.
@@ -539,16 +570,17 @@ class SkyTrakScraper:
             logger.info("Saving golf round to database")
             
             with get_db() as db:
-                # Check if this round already exists (based on date and source_system ID)
-                existing_round = db.query(GolfRound).filter(
+                # Check if this round already exists (based on its ID in the source system,
+                # or the notes of rounds stored before external IDs were recorded)
+                existing_id = db.scalar(select(GolfRound.id).where(
                     GolfRound.user_id == self.user_id,
-                    GolfRound.date == golf_round.date,
-                    GolfRound.notes.like(f"%{golf_round.notes}%")
-                ).first()
+                    GolfRound.source_system == golf_round.source_system,
+                    or_(GolfRound.external_id == golf_round.external_id, GolfRound.notes == golf_round.notes)
+                ).limit(1))
                 
-                if existing_round:
-                    logger.info(f"Round already exists in database (ID: {existing_round.id})")
-                    return existing_round.id
+                if existing_id:
+                    logger.info(f"Round already exists in database (ID: {existing_id})")
+                    return existing_id
                 
                 # Add new round to database
                 db.add(golf_round)
@@ -589,8 +621,19 @@ class SkyTrakScraper:
             sessions = self.get_session_list(limit=limit)
             logger.info(f"Found {len(sessions)} sessions to process")
             
+            # Skip fetching sessions that are already stored
+            stored = self.stored_session_ids([session.get("id") for session in sessions])
+            round_ids = list(stored.values())
+            sessions = [session for session in sessions if str(session.get("id")) not in stored]
+            if stored:
+                logger.info(f"Skipping {len(stored)} sessions already in the database")
+            
             # Process each session
-            for session in sessions:
+            for i, session in enumerate(sessions):
+                if deadline_passed(self.deadline):
+                    logger.warning(f"Deadline reached, stopping after {i}/{len(sessions)} sessions")
+                    break
+                
                 try:
                     # Get session details
                     session_id = session["id"]
@@ -619,16 +662,17 @@ class SkyTrakScraper:
         
         return round_ids
 
-def get_skytrak_data(user_id: int, limit: int = 10) -> List[int]:
+def get_skytrak_data(user_id: int, limit: int = 10, deadline: Optional[float] = None) -> List[int]:
     """
     Scrape SkyTrak data for a specific user.
     
     Args:
         user_id: The database ID of the user
         limit: Maximum number of sessions to process
+        deadline: time.monotonic() value after which to stop scraping
         
     Returns:
         List of golf round IDs that were processed
     """
-    scraper = SkyTrakScraper(user_id=user_id)
+    scraper = SkyTrakScraper(user_id=user_id, deadline=deadline)
     return scraper.run(limit=limit)
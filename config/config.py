@@ -50,6 +50,8 @@ default_config = {
     "supabase": {
         "url": os.environ.get("SUPABASE_URL", ""),
         "anon_key": os.environ.get("SUPABASE_API_KEY") or os.environ.get("SUPABASE_KEY", ""),
+        # Maximum number of rows sent in a single insert request
+        "insert_chunk_size": int(os.environ.get("SUPABASE_INSERT_CHUNK_SIZE", 500)),
     },
     
     # Legacy database settings (keeping for reference)
@@ -82,6 +84,16 @@ default_config = {
         },
         "arccos": {
             "url": "https://dashboard.arccosgolf.com",
+            # JSON APIs behind the dashboard, used before falling back to the browser
+            "api_url": os.environ.get("ARCCOS_API_URL", "https://api.arccosgolf.com"),
+            "auth_url": os.environ.get("ARCCOS_AUTH_URL", "https://authentication.arccosgolf.com"),
+            "use_api": os.environ.get("ARCCOS_USE_API", "true").lower() == "true",
+            # Browsers reading the holes of a round in parallel (below 2 reads them serially)
+            "hole_workers": int(os.environ.get("ARCCOS_HOLE_WORKERS", 0)),
+            # Rounds fetched from the API in parallel
+            "round_workers": int(os.environ.get("ARCCOS_ROUND_WORKERS", 4)),
+            # Days a scraped round is reused from the on-disk cache (0 disables it)
+            "round_cache_days": int(os.environ.get("ARCCOS_ROUND_CACHE_DAYS", 30)),
             "email": os.environ.get("ARCCOS_EMAIL", ""),
             "password": os.environ.get("ARCCOS_PASSWORD", ""),
             "headless": True
@@ -111,7 +123,31 @@ default_config = {
     "etl": {
         "schedule": {
             "daily_update": os.environ.get("ETL_DAILY_UPDATE_SCHEDULE", "0 0 * * *"),  # Every day at midnight (cron format)
-            "weekly_report": os.environ.get("ETL_WEEKLY_REPORT_SCHEDULE", "0 0 * * 0")   # Every Sunday at midnight
+            "weekly_report": os.environ.get("ETL_WEEKLY_REPORT_SCHEDULE", "0 0 * * 0"),   # Every Sunday at midnight
+            # How late a missed daily run may still start, e.g. after a restart
+            "misfire_grace_seconds": int(os.environ.get("ETL_MISFIRE_GRACE_SECONDS", 21600))
+        },
+        # Maximum number of sessions/rounds requested from each scraper per user
+        "limits": {
+            "trackman": int(os.environ.get("TRACKMAN_LIMIT", 500)),
+            "arccos": int(os.environ.get("ARCCOS_LIMIT", 500)),
+            "skytrak": int(os.environ.get("SKYTRAK_LIMIT", 500))
+        },
+        # Number of worker processes used to process users in parallel
+        "workers": int(os.environ.get("ETL_WORKERS", os.cpu_count() or 1)),
+        # Hard limit on the total run time of the daily ETL
+        "max_runtime_seconds": int(os.environ.get("ETL_MAX_RUNTIME_SECONDS", 4 * 60 * 60)),
+        # Adaptive per-provider concurrency across all workers
+        "throttle": {
+            "target_seconds": float(os.environ.get("ETL_THROTTLE_TARGET_SECONDS", 300)),
+            "start_concurrency": int(os.environ.get("ETL_THROTTLE_START_CONCURRENCY", 2)),
+            "max_concurrency": int(os.environ.get("ETL_THROTTLE_MAX_CONCURRENCY", 8))
+        },
+        # Replication of queued Supabase writes
+        "outbox": {
+            "interval_minutes": int(os.environ.get("ETL_OUTBOX_INTERVAL_MINUTES", 5)),
+            "batch_size": int(os.environ.get("ETL_OUTBOX_BATCH_SIZE", 100)),
+            "max_attempts": int(os.environ.get("ETL_OUTBOX_MAX_ATTEMPTS", 5))
         },
         "output_dir": "data/etl"
     }
@@ -0,0 +1,72 @@
+import datetime
+import unittest
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database.db_connection import Base
+from backend.models.user import User
+from backend.models.golf_data import GolfRound, RoundStats, UserStatsAggregate
+from backend.etl.aggregates import refresh_user_aggregates
+
+class TestUserAggregates(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool,
+                                    connect_args={"check_same_thread": False})
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+
+        user = User(email="golfer@example.com")
+        self.db.add(user)
+        self.db.flush()
+        self.user_id = user.id
+
+        now = datetime.datetime.utcnow()
+        self._add_round(now - datetime.timedelta(days=10), score=90, fairways_hit=7, putts=32)
+        self._add_round(now - datetime.timedelta(days=60), score=80, fairways_hit=10, putts=30)
+        # A range session has no score, and its stats must not count as a round of zeros
+        self._add_round(now - datetime.timedelta(days=5), score=None, fairways_hit=0, putts=0,
+                        source="trackman")
+        self.db.commit()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _add_round(self, date, score, fairways_hit, putts, source="arccos"):
+        golf_round = GolfRound(user_id=self.user_id, date=date, course_name="Test",
+                               total_score=score, total_par=72 if score else None,
+                               source_system=source)
+        golf_round.stats = RoundStats(fairways_hit=fairways_hit, fairways_total=14, putts_total=putts)
+        self.db.add(golf_round)
+
+    def _aggregates(self):
+        rows = self.db.scalars(select(UserStatsAggregate).where(UserStatsAggregate.user_id == self.user_id))
+        return {row.window_days: row for row in rows}
+
+    def test_windows_ignore_range_sessions(self):
+        self.assertEqual(refresh_user_aggregates(self.db), 3)
+        aggregates = self._aggregates()
+
+        recent = aggregates[30]
+        self.assertEqual(recent.rounds_played, 2)
+        self.assertAlmostEqual(recent.scoring_average, 90)
+        self.assertAlmostEqual(recent.score_to_par_average, 18)
+        self.assertAlmostEqual(recent.putts_per_round, 32)
+        self.assertAlmostEqual(recent.fairways_hit_pct, 50)
+
+        for window_days in (90, 365):
+            aggregate = aggregates[window_days]
+            self.assertEqual(aggregate.rounds_played, 3)
+            self.assertAlmostEqual(aggregate.scoring_average, 85)
+            self.assertAlmostEqual(aggregate.putts_per_round, 31)
+            self.assertAlmostEqual(aggregate.fairways_hit_pct, 17 * 100 / 28)
+
+    def test_refresh_replaces_rows(self):
+        refresh_user_aggregates(self.db)
+        self.assertEqual(refresh_user_aggregates(self.db), 3)
+        self.assertEqual(len(self.db.scalars(select(UserStatsAggregate)).all()), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import datetime
+import unittest
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database.db_connection import Base
+from backend.models.golf_data import GolfRound, GolfShot, ShotLocation
+
+class TestShotLocationColumns(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        golf_round = GolfRound(user_id=1, date=datetime.datetime(2023, 6, 1), course_name="Test")
+        self.db.add(golf_round)
+        self.db.flush()
+        self.round_id = golf_round.id
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _stored(self, location):
+        shot_id = self.db.execute(
+            insert(GolfShot).returning(GolfShot.id),
+            {"round_id": self.round_id, "shot_number": 1, "to_location": location}
+        ).scalar_one()
+        return self.db.scalar(select(GolfShot.to_location).where(GolfShot.id == shot_id))
+
+    def test_names_stored_as_codes(self):
+        self.assertEqual(self._stored("range"), "range")
+        self.assertEqual(self._stored(" Green "), "green")
+        self.assertEqual(self._stored(ShotLocation.TEE), "tee")
+
+    def test_aliases_mapped(self):
+        self.assertEqual(self._stored("Bunker"), "sand")
+        self.assertEqual(self._stored("fringe"), "green")
+
+    def test_unknown_and_empty_names(self):
+        self.assertEqual(self._stored("water"), "unknown")
+        self.assertIsNone(self._stored(""))
+        self.assertIsNone(self._stored(None))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.database.db_connection import Base
+from backend.models.golf_data import EtlOutbox
+from backend.etl import outbox_worker
+from backend.etl.data_transformer import GolfDataStorage
+
+class TestDrainOutbox(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool,
+                                    connect_args={"check_same_thread": False})
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+        self.db = self.Session()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _add_entries(self, count=1):
+        entries = [EtlOutbox(kind="trackman", payload={"round": i}) for i in range(count)]
+        self.db.add_all(entries)
+        self.db.commit()
+        return [entry.id for entry in entries]
+
+    def _stored(self, entry_id):
+        # Read through a separate session to see only committed changes
+        with self.Session() as db:
+            return db.get(EtlOutbox, entry_id)
+
+    def _patch_store(self, *side_effect):
+        return patch.object(GolfDataStorage, "store_supabase_payload", side_effect=side_effect)
+
+    def test_failed_entry_retried_until_replicated(self):
+        entry_id, = self._add_entries()
+
+        with self._patch_store(RuntimeError("Supabase unavailable"), True):
+            first = outbox_worker.drain_outbox(db=self.db)
+            entry = self._stored(entry_id)
+            self.assertEqual(first, {"replicated": 0, "retried": 1, "failed": 0})
+            self.assertEqual(entry.status, "pending")
+            self.assertEqual(entry.attempts, 1)
+            self.assertEqual(entry.last_error, "Supabase unavailable")
+            self.assertIsNone(entry.processed_at)
+
+            second = outbox_worker.drain_outbox(db=self.db)
+            entry = self._stored(entry_id)
+            self.assertEqual(second, {"replicated": 1, "retried": 0, "failed": 0})
+            self.assertEqual(entry.status, "done")
+            self.assertEqual(entry.attempts, 1)
+            self.assertIsNotNone(entry.processed_at)
+
+    def test_entry_failed_after_max_attempts(self):
+        entry_id, = self._add_entries()
+
+        with patch.object(outbox_worker, "OUTBOX_MAX_ATTEMPTS", 2), \
+                self._patch_store(RuntimeError("Supabase did not store the round"),
+                                  RuntimeError("Supabase did not store the round")) as store:
+            first = outbox_worker.drain_outbox(db=self.db)
+            self.assertEqual(first, {"replicated": 0, "retried": 1, "failed": 0})
+            self.assertEqual(self._stored(entry_id).status, "pending")
+
+            second = outbox_worker.drain_outbox(db=self.db)
+            entry = self._stored(entry_id)
+            self.assertEqual(second, {"replicated": 0, "retried": 0, "failed": 1})
+            self.assertEqual(entry.status, "failed")
+            self.assertEqual(entry.attempts, 2)
+            self.assertIsNotNone(entry.processed_at)
+
+            # Failed entries are not tried again
+            third = outbox_worker.drain_outbox(db=self.db)
+            self.assertEqual(third, {"replicated": 0, "retried": 0, "failed": 0})
+            self.assertEqual(store.call_count, 2)
+
+    def test_each_entry_committed_as_processed(self):
+        first_id, second_id = self._add_entries(2)
+
+        # An interruption while replicating the second entry keeps the first
+        with self._patch_store(True, KeyboardInterrupt()):
+            with self.assertRaises(KeyboardInterrupt):
+                outbox_worker.drain_outbox(db=self.db)
+        self.db.rollback()
+
+        self.assertEqual(self._stored(first_id).status, "done")
+        self.assertEqual(self._stored(second_id).status, "pending")
+        self.assertEqual(self._stored(second_id).attempts, 0)
+
+class TestStoreSupabasePayload(unittest.TestCase):
+    payload = {
+        "round": {"user_id": "1", "date": "2023-06-01", "source_system": "arccos", "external_id": "r1"},
+        "holes": [{"hole_number": 1}, {"hole_number": 2}],
+        "shots_by_hole": [[{"shot_number": 1}], [{"shot_number": 1}, {"shot_number": 2}]],
+        "stats": {"putts_total": 3}
+    }
+
+    def _patch(self, name, **kwargs):
+        patcher = patch(f"backend.etl.data_transformer.{name}", **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def setUp(self):
+        self.upsert = self._patch("upsert_golf_round", return_value={"id": 10})
+        self._patch("add_holes_for_round", return_value=[{"id": 100}, {"id": 101}])
+        self.add_shots = self._patch("add_shots_for_hole", side_effect=lambda hole_id, shots: shots)
+        self.add_stats = self._patch("add_round_stats", return_value={"id": 1000})
+
+    def test_payload_stored(self):
+        self.assertEqual(GolfDataStorage(use_sqlalchemy=False).store_supabase_payload(self.payload), 10)
+        self.assertEqual(self.upsert.call_args.args[1]["external_id"], "r1")
+        self.assertEqual(self.add_shots.call_count, 2)
+
+    def test_failed_shots_raise(self):
+        self.add_shots.side_effect = lambda hole_id, shots: [] if hole_id == 101 else shots
+
+        with self.assertRaises(RuntimeError):
+            GolfDataStorage(use_sqlalchemy=False).store_supabase_payload(self.payload)
+        self.add_stats.assert_not_called()
+
+    def test_failed_stats_raise(self):
+        self.add_stats.return_value = None
+
+        with self.assertRaises(RuntimeError):
+            GolfDataStorage(use_sqlalchemy=False).store_supabase_payload(self.payload)
+
+if __name__ == '__main__':
+    unittest.main()
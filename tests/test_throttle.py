@@ -0,0 +1,63 @@
+import time
+import unittest
+
+from backend.etl.throttle import AdaptiveThrottle, INCREASE_AFTER
+
+class TestAdaptiveThrottle(unittest.TestCase):
+    def test_failure_halves_permits(self):
+        throttle = AdaptiveThrottle("test", target_seconds=10, start_concurrency=8, max_concurrency=8)
+
+        with self.assertRaises(ValueError):
+            with throttle.slot():
+                raise ValueError("scrape failed")
+        self.assertEqual(throttle.permits, 4)
+
+        with self.assertRaises(ValueError):
+            with throttle.slot():
+                raise ValueError("scrape failed")
+        self.assertEqual(throttle.permits, 2)
+
+    def test_failure_keeps_one_permit(self):
+        throttle = AdaptiveThrottle("test", target_seconds=10, start_concurrency=1)
+
+        with self.assertRaises(ValueError):
+            with throttle.slot():
+                raise ValueError("scrape failed")
+        self.assertEqual(throttle.permits, 1)
+
+    def test_fast_scrapes_add_permit(self):
+        throttle = AdaptiveThrottle("test", target_seconds=10, start_concurrency=2, max_concurrency=8)
+
+        for _ in range(INCREASE_AFTER - 1):
+            with throttle.slot():
+                pass
+        self.assertEqual(throttle.permits, 2)
+
+        with throttle.slot():
+            pass
+        self.assertEqual(throttle.permits, 3)
+
+    def test_permits_capped_at_max(self):
+        throttle = AdaptiveThrottle("test", target_seconds=10, start_concurrency=2, max_concurrency=2)
+
+        for _ in range(INCREASE_AFTER * 2):
+            with throttle.slot():
+                pass
+        self.assertEqual(throttle.permits, 2)
+
+    def test_slot_times_out_at_deadline(self):
+        throttle = AdaptiveThrottle("test", target_seconds=10, start_concurrency=1)
+
+        with throttle.slot():
+            start = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                with throttle.slot(deadline=time.monotonic() + 0.2):
+                    pass
+            self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+        # A deadline already passed only fails when no slot is free
+        with throttle.slot(deadline=time.monotonic() - 1):
+            pass
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from flask import Flask
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from werkzeug.security import generate_password_hash
+
+from backend.database.db_connection import Base
+from backend.models.user import User
+from backend.models import golf_data  # noqa: F401 - registers the relationship targets
+from backend.auth.custom_auth import custom_auth
+from backend.etl import daily_etl
+
+class TestUserQueries(unittest.TestCase):
+    """User lookups load the user in one query and never lazy-load relationships."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool,
+                                    connect_args={"check_same_thread": False})
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.db.add(User(email="golfer@example.com", username="golfer",
+                         hashed_password=generate_password_hash("Secret123"), is_active=True))
+        self.db.commit()
+        self.db.expunge_all()
+
+        self.statements = []
+        self.loaded_users = []
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        event.listen(User, "load", self._loaded)
+
+    def tearDown(self):
+        event.remove(User, "load", self._loaded)
+        event.remove(self.engine, "before_cursor_execute", self._count)
+        self.db.close()
+        self.engine.dispose()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _loaded(self, user, context):
+        self.loaded_users.append(user)
+
+    @contextmanager
+    def _get_db(self):
+        # Keep the session open so the loaded users stay attached
+        yield self.db
+
+    def test_extract_user_list_single_query(self):
+        with patch.object(daily_etl, "get_db", self._get_db):
+            users = daily_etl.extract_user_list()
+
+        self.assertEqual(len(users), 1)
+        self.assertEqual(len(self.statements), 1)
+        with self.assertRaises(InvalidRequestError):
+            users[0].golf_rounds
+        self.assertEqual(len(self.statements), 1)
+
+    def test_login_single_query(self):
+        app = Flask(__name__)
+        app.secret_key = "test"
+        app.register_blueprint(custom_auth)
+
+        with patch("backend.auth.custom_auth.get_db", self._get_db):
+            response = app.test_client().post("/login", json={"login": "golfer", "password": "Secret123"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.statements), 1)
+        with self.assertRaises(InvalidRequestError):
+            self.loaded_users[0].golf_rounds
+        self.assertEqual(len(self.statements), 1)
+
+if __name__ == '__main__':
+    unittest.main()